@@ -34,27 +34,37 @@ from .entities.curve import Curve
 
 # Entities
 from .entities.dot import Dot
+from .entities.dot_cloud import DotCloud
 from .entities.ellipse import Ellipse
 from .entities.entity_group import EntityGroup
 from .entities.line import Line
 from .entities.path import Path
+from .entities.picture import Picture
 from .entities.point import Point
 from .entities.polygon import Polygon
 from .entities.rect import Rect
 from .entities.text import Text
 from .grid.cell import Cell
 from .grid.cell_group import CellGroup
+from .grid.mask import CellMask
 
 # Grid
 from .grid.grid import Grid
 
 # Image
+from .image.cache import ImageCache
+from .image.filters import FilterPipeline
 from .image.image import Image
 from .image.layer import Layer
+from .image.stipple import stipple
+from .image.tiled import TiledImage
 
 # Layout
 from .layout import align, between, distribute, stack
 
+# Photo mosaics
+from .mosaic import TileLibrary
+
 # Animation
 from .animation.builders import stagger
 from .animation.models import Easing
@@ -127,6 +137,7 @@ __all__ = [
     "CapName",
     "Cell",
     "CellGroup",
+    "CellMask",
     "Color",
     "ColorLike",
     "Connectable",
@@ -135,15 +146,18 @@ __all__ = [
     "CoordLike",
     "Curve",
     "Dot",
+    "DotCloud",
     "Easing",
     "Ellipse",
     "Entity",
     "EntityGroup",
     "FillStyle",
+    "FilterPipeline",
     "Gradient",
     "GradientStop",
     "Grid",
     "Image",
+    "ImageCache",
     "Layer",
     "Line",
     "LinearGradient",
@@ -152,6 +166,7 @@ __all__ = [
     "Path",
     "PathStyle",
     "Pathable",
+    "Picture",
     "Point",
     "Polygon",
     "RadialGradient",
@@ -166,6 +181,8 @@ __all__ = [
     "Surface",
     "Text",
     "TextStyle",
+    "TileLibrary",
+    "TiledImage",
     "__version__",
     "align",
     "between",
@@ -177,4 +194,5 @@ __all__ = [
     "register_cap",
     "stack",
     "stagger",
+    "stipple",
 ]
@@ -12,6 +12,8 @@ import math
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from .coord import Coord
 
 if TYPE_CHECKING:
@@ -269,3 +271,39 @@ def eval_cubic_derivative(
     dx = 3 * mt2 * (cp1.x - p0.x) + 6 * mt * t * (cp2.x - cp1.x) + 3 * t2 * (p3.x - cp2.x)
     dy = 3 * mt2 * (cp1.y - p0.y) + 6 * mt * t * (cp2.y - cp1.y) + 3 * t2 * (p3.y - cp2.y)
     return (dx, dy)
+
+
+def cubic_bounds(segments: np.ndarray) -> tuple[float, float, float, float]:
+    """
+    Exact axis-aligned bounds of cubic Bézier segments, all at once.
+
+    Each axis of a cubic is extremal at its end points or where its
+    quadratic derivative is zero; both roots are solved for every
+    segment and axis in one array pass.
+
+    Args:
+        segments: ``(n, 4, 2)`` array of ``(p0, cp1, cp2, p3)`` points.
+
+    Returns:
+        ``(min_x, min_y, max_x, max_y)``.
+    """
+    p0, p1, p2, p3 = segments[:, 0], segments[:, 1], segments[:, 2], segments[:, 3]
+    # B'(t) = 3[a(1-t)^2 + 2b(1-t)t + ct^2]  ->  A t^2 + B t + C = 0
+    a, b, c = p1 - p0, p2 - p1, p3 - p2
+    qa, qb, qc = a - 2 * b + c, 2 * (b - a), a
+    linear = np.abs(qa) < 1e-12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sqrt_disc = np.sqrt(qb * qb - 4 * qa * qc)
+        roots = np.stack(
+            [
+                np.where(linear, -qc / qb, (-qb - sqrt_disc) / (2 * qa)),
+                np.where(linear, np.nan, (-qb + sqrt_disc) / (2 * qa)),
+            ]
+        )
+    # Roots outside (0, 1) (or missing) fall back to t = 0, the start point
+    t = np.where((roots > 0) & (roots < 1), roots, 0.0)
+    mt = 1 - t
+    extrema = mt**3 * p0 + 3 * mt**2 * t * p1 + 3 * mt * t**2 * p2 + t**3 * p3
+    points = np.concatenate([p0, p3, extrema[0], extrema[1]])
+    low, high = points.min(axis=0), points.max(axis=0)
+    return (float(low[0]), float(low[1]), float(high[0]), float(high[1]))
@@ -109,6 +109,7 @@ class Entity(ABC):
     @rotation.setter
     def rotation(self, value: float) -> None:
         self._rotation = float(value)
+        self._geometry_changed()
 
     @property
     def scale_factor(self) -> float:
@@ -118,6 +119,7 @@ class Entity(ABC):
     @scale_factor.setter
     def scale_factor(self, value: float) -> None:
         self._scale_factor = float(value)
+        self._geometry_changed()
 
     @property
     def rotation_center(self) -> Coord:
@@ -240,6 +242,7 @@ class Entity(ABC):
         self._relative_at = None
         self._along_path = None
         self._along_offset = None
+        self._geometry_changed()
 
     @property
     def x(self) -> float:
@@ -265,6 +268,7 @@ class Entity(ABC):
         if value is not None:
             self._along_path = None
             self._along_offset = None
+        self._geometry_changed()
 
     @property
     def surface(self) -> Surface | None:
@@ -276,6 +280,15 @@ class Entity(ABC):
         """Set the containing surface."""
         self._surface = value
 
+    def _geometry_changed(self) -> None:
+        """Tell the containing surface this entity moved, turned or resized."""
+        if self._surface is not None:
+            self._surface._entity_changed(self)
+
+    def _follows_entity(self) -> bool:
+        """Whether this entity's position derives from another entity's."""
+        return isinstance(self._reference, Entity) or self._along_path is not None
+
     def surface_position_at(self, rx: float, ry: float) -> tuple[float, float]:
         """Convert surface-relative (rx, ry) to absolute pixel coordinates.
 
@@ -337,6 +350,7 @@ class Entity(ABC):
             self._along_t = 0.5
             self._along_offset = None
             self._reference = None
+            self._geometry_changed()
             return
         if value.along is not None:
             self._along_path = value.along
@@ -350,6 +364,7 @@ class Entity(ABC):
             self._along_offset = None
         if value.reference is not None:
             self._reference = value.reference
+        self._geometry_changed()
 
     # --- Movement methods ---
 
@@ -373,6 +388,7 @@ class Entity(ABC):
         self._relative_at = None
         self._along_path = None
         self._along_offset = None
+        self._geometry_changed()
         return self
 
     def _move_by(self, dx: float = 0, dy: float = 0) -> Entity:
@@ -396,6 +412,7 @@ class Entity(ABC):
             self._along_path = None
             self._along_offset = None
             self._relative_at = None
+            self._geometry_changed()
             return self
         if self._relative_at is not None:
             ref = self._reference or self._surface
@@ -406,8 +423,10 @@ class Entity(ABC):
                 dry = dy / ref_h if ref_h > 0 else 0
                 rx, ry = self._relative_at
                 self._relative_at = RelCoord(rx + drx, ry + dry)
+                self._geometry_changed()
                 return self
         self._position = Coord(self._position.x + dx, self._position.y + dy)
+        self._geometry_changed()
         return self
 
     def move_to_surface(self, surface: Surface, at: RelCoordLike = "center") -> Entity:
@@ -623,6 +642,7 @@ class Entity(ABC):
         if origin is not None:
             self._orbit_around(angle, Coord.coerce(origin))
         self._rotation = (self._rotation + angle) % 360
+        self._geometry_changed()
         return self
 
     def scale(self, factor: float, origin: CoordLike | None = None) -> Entity:
@@ -643,6 +663,7 @@ class Entity(ABC):
         if origin is not None:
             self._scale_around(factor, Coord.coerce(origin))
         self._scale_factor *= factor
+        self._geometry_changed()
         return self
 
     def offset_from(self, anchor_spec: AnchorSpec, dx: float = 0, dy: float = 0) -> Coord:
@@ -1189,6 +1210,14 @@ class Entity(ABC):
         """
         return []
 
+    def get_required_symbols(self) -> list[tuple[str, str]]:
+        """Collect shared SVG symbol definitions needed by this entity (e.g. Picture).
+
+        Returns:
+            List of (symbol_id, symbol_svg) tuples. Empty by default.
+        """
+        return []
+
     def _iter_paints(self) -> Iterator[Color | Gradient]:
         """Yield all paint objects (``Color`` or ``Gradient``) on this entity.
 
@@ -0,0 +1,322 @@
+"""SpatialIndex - Uniform hash grid over entity bounds."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import statistics
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .entity import Entity
+
+# Entities spanning more buckets than this live in a short "large" list
+# that every query scans, instead of being copied into every bucket.
+_MAX_SPAN = 64
+
+# The bucket size is re-chosen (one full rebuild) when the index grows
+# this many times beyond the size it was tuned for.
+_REBUILD_GROWTH = 4
+
+Box = tuple[float, float, float, float]
+
+
+class SpatialIndex:
+    """
+    A uniform hash grid over the visual bounds of entities.
+
+    Each entity is stored in every square bucket its visual bounding box
+    overlaps, so region, point and nearest-neighbour queries only look at
+    entities in nearby buckets. The bucket size is tuned to the entities
+    themselves: roughly the typical entity size, or the average spacing
+    for point-like entities.
+
+    Updates are lazy. ``insert()`` and ``touch()`` only mark an entity;
+    its bounds are recomputed at the next query. Moving thousands of
+    entities between queries therefore costs one ``bounds()`` call each.
+    Entities positioned from another entity (a ``Binding`` reference or
+    an ``along`` path) move whenever that entity does, which may be on
+    another surface, so their bounds are re-read at every query.
+
+    Surfaces own and maintain their indexes; use ``Surface.query()``,
+    ``Surface.entities_at()`` and ``Surface.nearest()`` rather than this
+    class directly.
+    """
+
+    def __init__(self, entities: Iterable[Entity] = ()) -> None:
+        """
+        Create an index.
+
+        Args:
+            entities: Initial entities, in order.
+        """
+        self._order: dict[Entity, int] = {}
+        self._boxes: dict[Entity, Box] = {}
+        self._spans: dict[Entity, tuple[int, int, int, int]] = {}
+        self._buckets: dict[tuple[int, int], dict[Entity, None]] = {}
+        self._large: dict[Entity, None] = {}
+        self._dirty: dict[Entity, None] = {}
+        # Entities positioned from another entity, re-read at every query
+        self._followers: dict[Entity, None] = {}
+        self._next = 0
+        self._cell = 0.0
+        self._tuned_for = 0
+        # Inclusive bucket range that has ever held an entity (conservative)
+        self._extent: tuple[int, int, int, int] | None = None
+        for entity in entities:
+            self.insert(entity)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, entity: object) -> bool:
+        return entity in self._order
+
+    def __repr__(self) -> str:
+        return f"SpatialIndex({len(self)} entities, bucket={self._cell:g})"
+
+    # --- Maintenance ---
+
+    def insert(self, entity: Entity) -> None:
+        """Add *entity* (no-op if already indexed)."""
+        if entity not in self._order:
+            self._order[entity] = self._next
+            self._next += 1
+            self._dirty[entity] = None
+
+    def discard(self, entity: Entity) -> None:
+        """Remove *entity* if indexed."""
+        if self._order.pop(entity, None) is None:
+            return
+        self._dirty.pop(entity, None)
+        self._followers.pop(entity, None)
+        self._unplace(entity)
+
+    def touch(self, entity: Entity) -> None:
+        """Mark *entity* as moved or reshaped; its bounds are re-read lazily."""
+        if entity in self._order:
+            self._dirty[entity] = None
+
+    def refresh(self) -> None:
+        """Re-read the bounds of every entity (after direct shape edits)."""
+        self._dirty = dict.fromkeys(self._order)
+
+    # --- Queries ---
+
+    def query(self, rect: Box) -> list[Entity]:
+        """
+        Entities whose visual bounds intersect *rect*, in insertion order.
+
+        Args:
+            rect: ``(min_x, min_y, max_x, max_y)``.
+        """
+        self._flush()
+        x1, y1, x2, y2 = rect
+        hits = [
+            entity
+            for entity in self._candidates(rect)
+            if _intersects(self._boxes[entity], x1, y1, x2, y2)
+        ]
+        hits.sort(key=self._order.__getitem__)
+        return hits
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int = 1,
+        exclude: Entity | None = None,
+    ) -> list[tuple[float, int, Entity]]:
+        """
+        The *k* entities whose visual bounds are closest to ``(x, y)``.
+
+        Distance is measured to the bounding box (0 when the point is
+        inside it). Buckets are searched in growing square rings around
+        the point, stopping as soon as no unvisited bucket can hold
+        anything closer than the k-th best so far.
+
+        Args:
+            x: Query x.
+            y: Query y.
+            k: Number of entities to return.
+            exclude: An entity to leave out (e.g. the query's own entity).
+
+        Returns:
+            ``(distance, insertion order, entity)`` tuples, nearest first.
+        """
+        self._flush()
+        if k < 1 or self._extent is None:
+            return self._ranked(self._large, x, y, k, exclude)
+        found: dict[Entity, None] = dict(self._large)
+        ci, cj = self._key(x), self._key(y)
+        i1, j1, i2, j2 = self._extent
+        # Skip the empty rings between the point and the indexed area
+        ring = max(0, i1 - ci, ci - i2, j1 - cj, cj - j2)
+        last = max(ci - i1, i2 - ci, cj - j1, j2 - cj)
+        while ring <= last:
+            for key in _ring(ci, cj, ring):
+                bucket = self._buckets.get(key)
+                if bucket:
+                    found.update(bucket)
+            # Anything not found yet lies outside this ring, so at
+            # least ``ring`` buckets away from the point's bucket.
+            best = self._ranked(found, x, y, k, exclude)
+            if len(best) == k and best[-1][0] <= ring * self._cell:
+                return best
+            ring += 1
+        return self._ranked(found, x, y, k, exclude)
+
+    # --- Internals ---
+
+    def _key(self, value: float) -> int:
+        return math.floor(value / self._cell)
+
+    def _ranked(
+        self,
+        entities: Iterable[Entity],
+        x: float,
+        y: float,
+        k: int,
+        exclude: Entity | None,
+    ) -> list[tuple[float, int, Entity]]:
+        order = self._order
+        boxes = self._boxes
+        return heapq.nsmallest(
+            k,
+            ((_box_distance(boxes[e], x, y), order[e], e) for e in entities if e is not exclude),
+            key=lambda item: item[:2],
+        )
+
+    def _candidates(self, rect: Box) -> Iterable[Entity]:
+        """Entities in the buckets overlapping *rect*, plus the large ones."""
+        found: dict[Entity, None] = dict(self._large)
+        if self._extent is None:
+            return found
+        x1, y1, x2, y2 = rect
+        ei1, ej1, ei2, ej2 = self._extent
+        i1, j1 = max(self._key(x1), ei1), max(self._key(y1), ej1)
+        i2, j2 = min(self._key(x2), ei2), min(self._key(y2), ej2)
+        if i1 > i2 or j1 > j2:
+            return found
+        if (i2 - i1 + 1) * (j2 - j1 + 1) > len(self._buckets):
+            # Huge region: walking the occupied buckets is cheaper
+            for (i, j), bucket in self._buckets.items():
+                if i1 <= i <= i2 and j1 <= j <= j2:
+                    found.update(bucket)
+        else:
+            for i in range(i1, i2 + 1):
+                for j in range(j1, j2 + 1):
+                    bucket = self._buckets.get((i, j))
+                    if bucket:
+                        found.update(bucket)
+        return found
+
+    def _flush(self) -> None:
+        """Re-read the bounds of every dirty entity."""
+        self._dirty.update(self._followers)
+        if not self._dirty:
+            return
+        if len(self._order) > _REBUILD_GROWTH * self._tuned_for:
+            self._retune()
+        dirty, self._dirty = self._dirty, {}
+        for entity in dirty:
+            self._unplace(entity)
+            self._place(entity, entity.bounds(visual=True))
+
+    def _retune(self) -> None:
+        """Choose the bucket size from the current entities and re-bucket all."""
+        boxes = {entity: entity.bounds(visual=True) for entity in self._order}
+        finite = [b for b in boxes.values() if all(map(math.isfinite, b))]
+        self._cell = _bucket_size(finite)
+        self._tuned_for = len(self._order)
+        self._buckets.clear()
+        self._large.clear()
+        self._spans.clear()
+        self._extent = None
+        self._dirty.clear()
+        for entity, box in boxes.items():
+            self._place(entity, box)
+
+    def _place(self, entity: Entity, box: Box) -> None:
+        self._boxes[entity] = box
+        if entity._follows_entity():
+            self._followers[entity] = None
+        else:
+            self._followers.pop(entity, None)
+        if not all(map(math.isfinite, box)):
+            self._large[entity] = None
+            return
+        span = (self._key(box[0]), self._key(box[1]), self._key(box[2]), self._key(box[3]))
+        i1, j1, i2, j2 = span
+        if (i2 - i1 + 1) * (j2 - j1 + 1) > _MAX_SPAN:
+            self._large[entity] = None
+            return
+        self._spans[entity] = span
+        for i in range(i1, i2 + 1):
+            for j in range(j1, j2 + 1):
+                self._buckets.setdefault((i, j), {})[entity] = None
+        if self._extent is None:
+            self._extent = span
+        else:
+            e1, f1, e2, f2 = self._extent
+            self._extent = (min(e1, i1), min(f1, j1), max(e2, i2), max(f2, j2))
+
+    def _unplace(self, entity: Entity) -> None:
+        self._boxes.pop(entity, None)
+        if entity in self._large:
+            del self._large[entity]
+            return
+        span = self._spans.pop(entity, None)
+        if span is None:
+            return
+        i1, j1, i2, j2 = span
+        for i in range(i1, i2 + 1):
+            for j in range(j1, j2 + 1):
+                bucket = self._buckets[i, j]
+                del bucket[entity]
+                if not bucket:
+                    del self._buckets[i, j]
+
+
+def _bucket_size(boxes: list[Box]) -> float:
+    """
+    A bucket size suited to *boxes*.
+
+    The larger of the median entity extent and the average spacing
+    (the side of the square each entity would get if spread evenly over
+    their joint bounds), so both big shapes and point clouds end up with
+    a handful of entities per bucket.
+    """
+    if not boxes:
+        return 1.0
+    extent = statistics.median(max(b[2] - b[0], b[3] - b[1]) for b in boxes)
+    width = max(b[2] for b in boxes) - min(b[0] for b in boxes)
+    height = max(b[3] for b in boxes) - min(b[1] for b in boxes)
+    spacing = math.sqrt(width * height / len(boxes))
+    size = max(extent, spacing, math.hypot(width, height) / 1e6)
+    return size if size > 0 else 1.0
+
+
+def _ring(ci: int, cj: int, r: int) -> Iterable[tuple[int, int]]:
+    """Bucket keys at Chebyshev distance exactly *r* from ``(ci, cj)``."""
+    if r == 0:
+        yield (ci, cj)
+        return
+    for i in range(ci - r, ci + r + 1):
+        yield (i, cj - r)
+        yield (i, cj + r)
+    for j in range(cj - r + 1, cj + r):
+        yield (ci - r, j)
+        yield (ci + r, j)
+
+
+def _intersects(box: Box, x1: float, y1: float, x2: float, y2: float) -> bool:
+    return box[0] <= x2 and box[2] >= x1 and box[1] <= y2 and box[3] >= y1
+
+
+def _box_distance(box: Box, x: float, y: float) -> float:
+    """Distance from ``(x, y)`` to *box* (0 inside)."""
+    dx = max(box[0] - x, 0.0, x - box[2])
+    dy = max(box[1] - y, 0.0, y - box[3])
+    return math.hypot(dx, dy)
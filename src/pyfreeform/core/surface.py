@@ -20,8 +20,10 @@ from ..entities.text import Text, _measure_text_width
 from ..gradient import Gradient, PaintLike
 from .binding import Binding
 from .connection import Connection
-from .coord import Coord
+from .coord import Coord, CoordLike
+from .entity import Entity
 from .relcoord import RelCoord, RelCoordLike
+from .spatial import SpatialIndex
 from .pathable import FullPathable, Pathable
 from .tangent import get_angle_at, perpendicular_shift
 from .positions import NAMED_POSITIONS, AnchorSpec
@@ -35,7 +37,6 @@ if TYPE_CHECKING:
         ShapeStyle,
         TextStyle,
     )
-    from .entity import Entity
 
 
 class _ScaledPathable:
@@ -97,9 +98,12 @@ class Surface:
         self._y = y
         self._width = width
         self._height = height
-        self._entities: list[Entity] = []
+        # Insertion-ordered set: O(1) membership tests and removal
+        self._entities: dict[Entity, None] = {}
         self._connections: dict[Connection, None] = {}
         self._data: dict[str, Any] = {}
+        # Built on the first spatial query, then kept up to date
+        self._spatial: SpatialIndex | None = None
 
     # =========================================================================
     # PROPERTIES
@@ -342,7 +346,9 @@ class Surface:
     def _register_entity(self, entity: Entity) -> None:
         """Register an entity with this surface. Override for custom behavior."""
         entity.surface = self
-        self._entities.append(entity)
+        self._entities[entity] = None
+        for index in self._spatial_indexes():
+            index.insert(entity)
 
     def _resolve_along(
         self,
@@ -1808,13 +1814,130 @@ class Surface:
     def remove(self, entity: Entity) -> bool:
         """Remove an entity from this surface."""
         if entity in self._entities:
-            self._entities.remove(entity)
+            del self._entities[entity]
             entity.surface = None
+            for index in self._spatial_indexes():
+                index.discard(entity)
             return True
         return False
 
     def clear(self) -> None:
         """Remove all entities from this surface."""
+        indexes = self._spatial_indexes()
         for entity in self._entities:
             entity.surface = None
+            for index in indexes:
+                index.discard(entity)
         self._entities.clear()
+
+    # =========================================================================
+    # SPATIAL QUERIES
+    # =========================================================================
+
+    def _spatial_indexes(self) -> list[SpatialIndex]:
+        """The live indexes that must follow this surface's entities."""
+        return [] if self._spatial is None else [self._spatial]
+
+    def _query_indexes(self) -> list[SpatialIndex]:
+        """The indexes spatial queries search, built on first use."""
+        if self._spatial is None:
+            self._spatial = SpatialIndex(self._entities)
+        return [self._spatial]
+
+    def _entity_changed(self, entity: Entity) -> None:
+        """Called by an entity of this surface after it moved or was transformed."""
+        for index in self._spatial_indexes():
+            index.touch(entity)
+
+    def query(self, rect: tuple[float, float, float, float]) -> list[Entity]:
+        """
+        Entities whose visual bounds intersect a rectangle.
+
+        Backed by a spatial index (a uniform hash grid) that is built on
+        the first query and then kept up to date as entities are added,
+        removed, moved, rotated or scaled, so each query only looks at
+        entities near the rectangle. Entities positioned from another
+        entity (a ``Binding`` reference or an ``along`` path) follow it
+        without being told, so their bounds are re-read on every query.
+
+        Args:
+            rect: ``(min_x, min_y, max_x, max_y)`` in pixels, the same
+                form ``bounds()`` returns.
+
+        Returns:
+            The matching entities, in the order they were added.
+
+        Example:
+            ```python
+            visible = scene.query((0, 0, 400, 300))
+            ```
+        """
+        result: list[Entity] = []
+        for index in self._query_indexes():
+            result.extend(index.query(rect))
+        return result
+
+    def entities_at(self, x: float, y: float) -> list[Entity]:
+        """
+        Hit-test: entities whose visual bounds contain a point.
+
+        Args:
+            x: Point x in pixels.
+            y: Point y in pixels.
+
+        Returns:
+            The entities under the point, topmost first (the reverse of
+            render order).
+        """
+        hits = self.query((x, y, x, y))
+        hits.reverse()
+        hits.sort(key=lambda e: e.z_index, reverse=True)
+        return hits
+
+    def nearest(self, point: CoordLike | Entity, k: int = 1) -> list[Entity]:
+        """
+        The *k* entities closest to a point or to another entity.
+
+        Distance is measured from the point to each entity's visual
+        bounding box (0 when the point is inside it).
+
+        Args:
+            point: A position, or an entity (its bounding-box center is
+                used and the entity itself is left out).
+            k: Number of entities to return.
+
+        Returns:
+            Up to *k* entities, nearest first.
+
+        Example:
+            ```python
+            for dot in dots:
+                for other in scene.nearest(dot, k=3):
+                    dot.connect(other)
+            ```
+        """
+        exclude = None
+        if isinstance(point, Entity):
+            exclude = point
+            x1, y1, x2, y2 = point.bounds(visual=True)
+            x, y = (x1 + x2) / 2, (y1 + y2) / 2
+        else:
+            coord = Coord.coerce(point)
+            x, y = coord.x, coord.y
+        ranked = []
+        for rank, index in enumerate(self._query_indexes()):
+            ranked.extend((d, rank, order, e) for d, order, e in index.nearest(x, y, k, exclude))
+        ranked.sort(key=lambda item: item[:3])
+        return [item[3] for item in ranked[:k]]
+
+    def reindex(self) -> None:
+        """
+        Re-read every entity's bounds for spatial queries.
+
+        Moves, rotation and scaling are tracked automatically. Call this
+        after changing an entity's shape directly (a radius, a width, a
+        vertex) so that ``query()``, ``entities_at()`` and ``nearest()``
+        see the new extent.
+        """
+        for index in self._query_indexes():
+            index.refresh()
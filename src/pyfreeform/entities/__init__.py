@@ -2,9 +2,11 @@
 
 from .curve import Curve
 from .dot import Dot
+from .dot_cloud import DotCloud
 from .ellipse import Ellipse
 from .line import Line
 from .path import Path
+from .picture import Picture
 from .polygon import Polygon
 from .rect import Rect
 from .text import Text
@@ -12,9 +14,11 @@ from .text import Text
 __all__ = [
     "Curve",
     "Dot",
+    "DotCloud",
     "Ellipse",
     "Line",
     "Path",
+    "Picture",
     "Polygon",
     "Rect",
     "Text",
@@ -406,6 +406,7 @@ class Curve(EndpointEntity):
         self._position = Coord(self._position.x + dx, self._position.y + dy)
         self._end = Coord(self._end.x + dx, self._end.y + dy)
         self._control = None
+        self._geometry_changed()
         return self
 
     def animate_draw(
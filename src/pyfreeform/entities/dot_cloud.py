@@ -0,0 +1,203 @@
+"""DotCloud - Many dots drawn as one SVG path."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..color import Color
+from ..core.coord import Coord
+from ..core.entity import Entity
+from ..renderers import SMILRenderer
+
+if TYPE_CHECKING:
+    from ..gradient import Gradient
+
+
+class DotCloud(Entity):
+    """
+    Thousands of same-colored dots as a single entity.
+
+    A scene with 100,000 ``Dot`` entities holds 100,000 Python objects
+    and writes 100,000 ``<circle>`` elements. A DotCloud stores the
+    centers and radii as NumPy arrays and renders them as one ``<path>``
+    of circles, which keeps both memory and file size small. Use it for
+    stippling, particle fields and scatter textures.
+
+    Point coordinates are relative to the cloud's position, so with the
+    default position (0, 0) they are scene coordinates, and moving the
+    cloud moves every dot.
+
+    Attributes:
+        position: Origin the points are offset from
+        color: Fill color of every dot
+
+    Anchors:
+        - "center": Center of the points' bounding box
+
+    Example:
+        ```python
+        points = stipple(Image.load("portrait.jpg"), 20_000, width=800, height=800)
+        scene.place(DotCloud(points, radius=0.9))
+        ```
+    """
+
+    def __init__(
+        self,
+        points: np.ndarray | list[tuple[float, float]],
+        radius: float | np.ndarray = 1.0,
+        color: str | tuple[int, int, int] = "black",
+        z_index: int = 0,
+        opacity: float = 1.0,
+        x: float = 0,
+        y: float = 0,
+    ) -> None:
+        """
+        Create a dot cloud.
+
+        Args:
+            points: ``(n, 2)`` array of dot centers.
+            radius: One radius for every dot, or an array of n radii.
+            color: Fill color (name, hex, or RGB tuple).
+            z_index: Layer ordering (higher = on top).
+            opacity: Opacity (0.0 transparent to 1.0 opaque).
+            x: Horizontal position of the cloud's origin.
+            y: Vertical position of the cloud's origin.
+
+        Raises:
+            ValueError: If points is not ``(n, 2)`` or the radii don't
+                match the number of points.
+        """
+        offsets = np.array(points, dtype=np.float64)
+        if offsets.size == 0:
+            offsets = offsets.reshape(0, 2)
+        if offsets.ndim != 2 or offsets.shape[1] != 2:
+            raise ValueError(f"points must have shape (n, 2), got {offsets.shape}")
+        radii = np.array(radius, dtype=np.float64)
+        if radii.ndim == 0:
+            radii = np.full(len(offsets), float(radii))
+        elif radii.shape != (len(offsets),):
+            raise ValueError(f"Expected {len(offsets)} radii, got shape {radii.shape}")
+        super().__init__(x, y, z_index)
+        self._offsets = offsets
+        self._radii = radii
+        self._color = Color(color)
+        self.opacity = float(opacity)
+
+    @property
+    def points(self) -> np.ndarray:
+        """Dot centers in scene coordinates, as a new ``(n, 2)`` array."""
+        return self._offsets + np.array([self.x, self.y])
+
+    @property
+    def radii(self) -> np.ndarray:
+        """Radius of every dot (read-only)."""
+        view = self._radii.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def color(self) -> str:
+        """The fill color as a hex string."""
+        return self._color.to_hex()
+
+    @color.setter
+    def color(self, value: str | tuple[int, int, int]) -> None:
+        self._color = Color(value)
+
+    def _iter_paints(self) -> Iterator[Color | Gradient]:
+        yield self._color
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def _box(self) -> tuple[float, float, float, float]:
+        """Untransformed bounding box of the dots (including radii)."""
+        if not len(self):
+            return (self.x, self.y, self.x, self.y)
+        return _circles_box(self.points, self._radii)
+
+    @property
+    def rotation_center(self) -> Coord:
+        """Natural pivot for rotation/scale: bounding-box center."""
+        x1, y1, x2, y2 = self._box()
+        return Coord((x1 + x2) / 2, (y1 + y2) / 2)
+
+    @property
+    def anchor_names(self) -> list[str]:
+        """Available anchors: just 'center'."""
+        return ["center"]
+
+    def _named_anchor(self, name: str) -> Coord:
+        """Get anchor point by name."""
+        if name == "center":
+            return self.rotation_center
+        raise ValueError(f"DotCloud has no anchor '{name}'. Available: {self.anchor_names}")
+
+    def bounds(self, *, visual: bool = False) -> tuple[float, float, float, float]:
+        """Get axis-aligned bounding box (accounts for rotation and scale)."""
+        if (self._rotation == 0 and self._scale_factor == 1.0) or not len(self):
+            return self._box()
+        return _circles_box(self._world_points(), self._radii * self._scale_factor)
+
+    def rotated_bounds(
+        self,
+        angle: float,
+        *,
+        visual: bool = False,
+    ) -> tuple[float, float, float, float]:
+        """Exact AABB of this cloud rotated by *angle* degrees around origin."""
+        if angle == 0 or not len(self):
+            return self.bounds(visual=visual)
+        return _circles_box(
+            _rotate(self._world_points(), angle, np.zeros(2)), self._radii * self._scale_factor
+        )
+
+    def _world_points(self) -> np.ndarray:
+        """Dot centers with the cloud's rotation and scale applied."""
+        points = self.points
+        if self._rotation == 0 and self._scale_factor == 1.0:
+            return points
+        center = np.array(self.rotation_center)
+        scaled = center + (points - center) * self._scale_factor
+        return _rotate(scaled, self._rotation, center)
+
+    def to_path_d(self) -> str:
+        """
+        SVG path data drawing every dot as two arcs.
+
+        Each dot becomes ``M x-r y a r r 0 1 0 2r 0 a r r 0 1 0 -2r 0``.
+        """
+        points = self.points
+        return "".join(
+            f"M{x - r:.6g} {y:.6g}a{r:.6g} {r:.6g} 0 1 0 {2 * r:.6g} 0"
+            f"a{r:.6g} {r:.6g} 0 1 0 {-2 * r:.6g} 0"
+            for (x, y), r in zip(points.tolist(), self._radii.tolist(), strict=True)
+        )
+
+    def to_svg(self) -> str:
+        """Render to an SVG ``<path>`` element (delegates to renderer)."""
+        return SMILRenderer().render_entity(self)
+
+    def __repr__(self) -> str:
+        return f"DotCloud({len(self)} dots, color={self.color!r})"
+
+
+def _rotate(points: np.ndarray, angle: float, center: np.ndarray) -> np.ndarray:
+    """Rotate ``(n, 2)`` points by *angle* degrees around *center*."""
+    if angle == 0:
+        return points
+    rad = math.radians(angle)
+    cos_a, sin_a = math.cos(rad), math.sin(rad)
+    delta = points - center
+    return center + delta @ np.array([[cos_a, sin_a], [-sin_a, cos_a]])
+
+
+def _circles_box(centers: np.ndarray, radii: np.ndarray) -> tuple[float, float, float, float]:
+    """Bounding box of circles."""
+    low = (centers - radii[:, None]).min(axis=0)
+    high = (centers + radii[:, None]).max(axis=0)
+    return (float(low[0]), float(low[1]), float(high[0]), float(high[1]))
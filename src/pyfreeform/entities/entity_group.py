@@ -276,6 +276,7 @@ class EntityGroup(Entity):
         self._rotation += angle
         if origin is not None:
             self._orbit_around(angle, Coord.coerce(origin))
+        self._geometry_changed()
         return self
 
     def scale(
@@ -300,6 +301,7 @@ class EntityGroup(Entity):
         self._scale *= factor
         if origin is not None:
             self._scale_around(factor, Coord.coerce(origin))
+        self._geometry_changed()
         return self
 
     @property
@@ -310,6 +312,7 @@ class EntityGroup(Entity):
     @rotation.setter
     def rotation(self, value: float) -> None:
         self._rotation = float(value)
+        self._geometry_changed()
 
     @property
     def scale_factor(self) -> float:
@@ -319,6 +322,7 @@ class EntityGroup(Entity):
     @scale_factor.setter
     def scale_factor(self, value: float) -> None:
         self._scale = float(value)
+        self._geometry_changed()
 
     # =========================================================================
     # DEFS COLLECTION (forward to children)
@@ -345,6 +349,13 @@ class EntityGroup(Entity):
             result.extend(child.get_required_gradients())
         return result
 
+    def get_required_symbols(self) -> list[tuple[str, str]]:
+        """Collect SVG symbol definitions from all children."""
+        result: list[tuple[str, str]] = []
+        for child in self._children:
+            result.extend(child.get_required_symbols())
+        return result
+
     def __repr__(self) -> str:
         n = len(self._children)
         extras = []
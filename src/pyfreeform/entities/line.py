@@ -281,6 +281,7 @@ class Line(EndpointEntity):
         self._relative_at = None
         self._along_path = None
         self._relative_end = None
+        self._geometry_changed()
         return self
 
     def _move_by(self, dx: float = 0, dy: float = 0) -> Line:
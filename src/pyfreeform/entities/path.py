@@ -6,10 +6,18 @@ import math
 from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from ..animation import typed_methods
 from ..animation.shared import add_draw
 from ..color import Color
-from ..core.bezier import bezier_segment_index, eval_cubic, eval_cubic_derivative, fit_cubic_beziers
+from ..core.bezier import (
+    bezier_segment_index,
+    cubic_bounds,
+    eval_cubic,
+    eval_cubic_derivative,
+    fit_cubic_beziers,
+)
 from ..core.coord import Coord
 from ..core.entity import Entity
 from ..config.caps import CapName, collect_markers, resolve_cap
@@ -22,6 +30,9 @@ if TYPE_CHECKING:
     from ..animation.models import EasingLike, RepeatLike
     from ..core.pathable import Pathable
 
+# Bounds memoized per path: one per distinct (angle, rotation, scale)
+_BOUNDS_MEMO_SIZE = 8
+
 
 class Path(Entity):
     """
@@ -154,6 +165,7 @@ class Path(Entity):
 
         # Compute cubic Bézier segments from the pathable
         self._bezier_segments = fit_cubic_beziers(pathable, segments, closed, start_t, end_t)
+        self._bounds_memo: tuple[list, np.ndarray, dict] | None = None
 
     @property
     def closed(self) -> bool:
@@ -352,66 +364,39 @@ class Path(Entity):
                 )
         return ("path", list(self._bezier_segments))
 
-    @staticmethod
-    def _cubic_axis_extrema(p0: float, p1: float, p2: float, p3: float) -> list[float]:
-        """Critical t-values where one axis of a cubic Bezier is extremal.
+    def _segment_box(self, angle: float = 0.0) -> tuple[float, float, float, float]:
+        """Exact world-space bounds of the segments rotated by *angle* degrees
+        around the origin, without stroke padding.
 
-        Solves B'(t)=0 for the quadratic derivative. Returns roots in (0,1).
+        Results are memoized per segment list and transform: moving the
+        path replaces the segment list and clears the memo, and rotation
+        and scale are part of the key, so a stale box is never returned.
         """
-        # B'(t) = 3[a(1-t)² + 2b(1-t)t + ct²]  where a=P1-P0, b=P2-P1, c=P3-P2
-        # Expanding: At² + Bt + C = 0
-        a = p1 - p0
-        b = p2 - p1
-        c = p3 - p2
-        A = a - 2 * b + c
-        B = 2 * (b - a)
-        C = a
-        roots: list[float] = []
-        if abs(A) < 1e-12:
-            # Linear: Bt + C = 0
-            if abs(B) > 1e-12:
-                t = -C / B
-                if 0 < t < 1:
-                    roots.append(t)
-        else:
-            disc = B * B - 4 * A * C
-            if disc >= 0:
-                sd = math.sqrt(disc)
-                for sign in (-1, 1):
-                    t = (-B + sign * sd) / (2 * A)
-                    if 0 < t < 1:
-                        roots.append(t)
-        return roots
-
-    @staticmethod
-    def _cubic_segment_bounds(
-        p0x: float,
-        p0y: float,
-        p1x: float,
-        p1y: float,
-        p2x: float,
-        p2y: float,
-        p3x: float,
-        p3y: float,
-    ) -> tuple[float, float, float, float]:
-        """Exact AABB of one cubic Bezier segment. O(1)."""
-        min_x, max_x = min(p0x, p3x), max(p0x, p3x)
-        min_y, max_y = min(p0y, p3y), max(p0y, p3y)
-        for t in Path._cubic_axis_extrema(p0x, p1x, p2x, p3x):
-            mt = 1 - t
-            v = mt * mt * mt * p0x + 3 * mt * mt * t * p1x + 3 * mt * t * t * p2x + t * t * t * p3x
-            if v < min_x:
-                min_x = v
-            if v > max_x:
-                max_x = v
-        for t in Path._cubic_axis_extrema(p0y, p1y, p2y, p3y):
-            mt = 1 - t
-            v = mt * mt * mt * p0y + 3 * mt * mt * t * p1y + 3 * mt * t * t * p2y + t * t * t * p3y
-            if v < min_y:
-                min_y = v
-            if v > max_y:
-                max_y = v
-        return (min_x, min_y, max_x, max_y)
+        segments = self._bezier_segments
+        memo = self._bounds_memo
+        if memo is None or memo[0] is not segments:
+            coords = [value for seg in segments for p in seg for value in (p.x, p.y)]
+            points = np.array(coords, dtype=np.float64).reshape(-1, 4, 2)
+            memo = self._bounds_memo = (segments, points, {})
+        key = (angle, self._rotation, self._scale_factor)
+        box = memo[2].get(key)
+        if box is None:
+            points = memo[1]
+            if self._rotation != 0 or self._scale_factor != 1.0:
+                center = self.rotation_center
+                origin = np.array([center.x, center.y])
+                points = origin + _rotate((points - origin) * self._scale_factor, self._rotation)
+            if angle != 0:
+                points = _rotate(points, angle)
+            box = cubic_bounds(points)
+            if len(memo[2]) >= _BOUNDS_MEMO_SIZE:
+                memo[2].clear()
+            memo[2][key] = box
+        return box
+
+    def _geometry_changed(self) -> None:
+        self._bounds_memo = None
+        super()._geometry_changed()
 
     def bounds(self, *, visual: bool = False) -> tuple[float, float, float, float]:
         """Exact bounding box (world space, solves cubic Bezier extrema per segment).
@@ -420,43 +405,7 @@ class Path(Entity):
             visual: If True, expand by stroke width / 2 to reflect
                     the rendered extent.
         """
-        if not self._bezier_segments:
-            return (self.position.x, self.position.y, self.position.x, self.position.y)
-
-        has_transform = self._rotation != 0 or self._scale_factor != 1.0
-        min_x = min_y = math.inf
-        max_x = max_y = -math.inf
-        for p0, cp1, cp2, p3 in self._bezier_segments:
-            if has_transform:
-                p0 = self._to_world_space(p0)
-                cp1 = self._to_world_space(cp1)
-                cp2 = self._to_world_space(cp2)
-                p3 = self._to_world_space(p3)
-            sb = Path._cubic_segment_bounds(
-                p0.x,
-                p0.y,
-                cp1.x,
-                cp1.y,
-                cp2.x,
-                cp2.y,
-                p3.x,
-                p3.y,
-            )
-            if sb[0] < min_x:
-                min_x = sb[0]
-            if sb[1] < min_y:
-                min_y = sb[1]
-            if sb[2] > max_x:
-                max_x = sb[2]
-            if sb[3] > max_y:
-                max_y = sb[3]
-        if visual:
-            half = self.width * self._scale_factor / 2
-            min_x -= half
-            min_y -= half
-            max_x += half
-            max_y += half
-        return (min_x, min_y, max_x, max_y)
+        return self.rotated_bounds(0, visual=visual)
 
     def rotated_bounds(
         self,
@@ -465,55 +414,19 @@ class Path(Entity):
         visual: bool = False,
     ) -> tuple[float, float, float, float]:
         """Exact AABB of this path rotated by *angle* degrees around origin."""
-        if angle == 0:
-            return self.bounds(visual=visual)
         if not self._bezier_segments:
             pos = self.position
             if self._rotation != 0 or self._scale_factor != 1.0:
                 pos = self._to_world_space(pos)
+            if angle == 0:
+                return (pos.x, pos.y, pos.x, pos.y)
             rad = math.radians(angle)
             cos_a, sin_a = math.cos(rad), math.sin(rad)
             px = pos.x * cos_a - pos.y * sin_a
             py = pos.x * sin_a + pos.y * cos_a
             return (px, py, px, py)
 
-        rad = math.radians(angle)
-        cos_a, sin_a = math.cos(rad), math.sin(rad)
-        has_transform = self._rotation != 0 or self._scale_factor != 1.0
-
-        def _rot(x: float, y: float) -> tuple[float, float]:
-            return x * cos_a - y * sin_a, x * sin_a + y * cos_a
-
-        min_x = min_y = math.inf
-        max_x = max_y = -math.inf
-        for p0, cp1, cp2, p3 in self._bezier_segments:
-            if has_transform:
-                p0 = self._to_world_space(p0)
-                cp1 = self._to_world_space(cp1)
-                cp2 = self._to_world_space(cp2)
-                p3 = self._to_world_space(p3)
-            r0 = _rot(p0.x, p0.y)
-            r1 = _rot(cp1.x, cp1.y)
-            r2 = _rot(cp2.x, cp2.y)
-            r3 = _rot(p3.x, p3.y)
-            sb = Path._cubic_segment_bounds(
-                r0[0],
-                r0[1],
-                r1[0],
-                r1[1],
-                r2[0],
-                r2[1],
-                r3[0],
-                r3[1],
-            )
-            if sb[0] < min_x:
-                min_x = sb[0]
-            if sb[1] < min_y:
-                min_y = sb[1]
-            if sb[2] > max_x:
-                max_x = sb[2]
-            if sb[3] > max_y:
-                max_y = sb[3]
+        min_x, min_y, max_x, max_y = self._segment_box(angle)
         if visual:
             half = self.width * self._scale_factor / 2
             min_x -= half
@@ -543,6 +456,7 @@ class Path(Entity):
             )
             for p0, cp1, cp2, p3 in self._bezier_segments
         ]
+        self._geometry_changed()
         return self
 
     @property
@@ -607,3 +521,10 @@ class Path(Entity):
     def __repr__(self) -> str:
         kind = "closed" if self._closed else "open"
         return f"Path({kind}, {len(self._bezier_segments)} segments, color={self.color!r})"
+
+
+def _rotate(points: np.ndarray, angle: float) -> np.ndarray:
+    """Rotate ``(..., 2)`` points by *angle* degrees around the origin."""
+    rad = math.radians(angle)
+    cos_a, sin_a = math.cos(rad), math.sin(rad)
+    return points @ np.array([[cos_a, sin_a], [-sin_a, cos_a]])
@@ -0,0 +1,174 @@
+"""Picture - A raster image placed in the scene."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+
+from ..core.coord import Coord
+from ..core.entity import Entity
+from ..core.positions import NAMED_POSITIONS
+from ..core.relcoord import RelCoord
+from ..core.svg_utils import svg_num, xml_escape
+from ..renderers import SMILRenderer
+
+
+class Picture(Entity):
+    """
+    A raster image (file path, URL or data URI) drawn into a rectangle.
+
+    Each distinct ``href`` is written to the SVG once, as a ``<symbol>``
+    in ``<defs>``; every Picture then renders as a small ``<use>``
+    reference to it. A mosaic that repeats a few hundred library tiles
+    across thousands of cells therefore stores each tile only once.
+
+    Attributes:
+        position: Top-left corner of the picture
+        width: Picture width
+        height: Picture height
+        href: Image location written to the SVG
+
+    Anchors:
+        - "center": Center point
+        - "top_left", "top_right", "bottom_left", "bottom_right": Corners
+        - "top", "bottom", "left", "right": Edge centers
+
+    Example:
+        ```python
+        pic = Picture(0, 0, 40, 40, "tiles/sunset.jpg")
+        cell.place(Picture(cell.x, cell.y, cell.width, cell.height, "tiles/sea.png"))
+        ```
+    """
+
+    def __init__(
+        self,
+        x: float = 0,
+        y: float = 0,
+        width: float = 10,
+        height: float = 10,
+        href: str = "",
+        aspect: float = 1.0,
+        fit: str = "slice",
+        z_index: int = 0,
+        opacity: float = 1.0,
+    ) -> None:
+        """
+        Create a picture.
+
+        Args:
+            x: Top-left corner x.
+            y: Top-left corner y.
+            width: Picture width.
+            height: Picture height.
+            href: Image path, URL or ``data:`` URI.
+            aspect: Width-to-height ratio of the image itself, so that
+                *fit* can crop or letterbox it correctly.
+            fit: How the image fills a rectangle of a different aspect
+                ratio: "slice" (cover and crop), "meet" (fit inside) or
+                "stretch".
+            z_index: Layer ordering (higher = on top).
+            opacity: Opacity (0.0 transparent to 1.0 opaque).
+
+        Raises:
+            ValueError: If fit is not one of the supported modes, or
+                aspect is not positive.
+        """
+        if fit not in _ASPECT_RATIO:
+            raise ValueError(f"fit must be one of {sorted(_ASPECT_RATIO)}, got '{fit}'")
+        if aspect <= 0:
+            raise ValueError(f"aspect must be positive, got {aspect}")
+        super().__init__(x, y, z_index)
+        self.width = float(width)
+        self.height = float(height)
+        self.href = href
+        self.aspect = float(aspect)
+        self.fit = fit
+        self.opacity = float(opacity)
+
+    @property
+    def symbol_id(self) -> str:
+        """Id of the shared ``<symbol>`` this picture references."""
+        key = f"{self.fit}|{svg_num(self.aspect)}|{self.href}"
+        return f"pic-{hashlib.sha1(key.encode()).hexdigest()[:12]}"
+
+    def get_required_symbols(self) -> list[tuple[str, str]]:
+        """The ``<symbol>`` definition holding this picture's image."""
+        aspect = svg_num(self.aspect)
+        return [
+            (
+                self.symbol_id,
+                f'<symbol id="{self.symbol_id}" viewBox="0 0 {aspect} 1"'
+                f' preserveAspectRatio="{_ASPECT_RATIO[self.fit]}">'
+                f'<image width="{aspect}" height="1" href="{xml_escape(self.href)}" />'
+                f"</symbol>",
+            )
+        ]
+
+    @property
+    def _center(self) -> Coord:
+        return Coord(self.x + self.width / 2, self.y + self.height / 2)
+
+    @property
+    def rotation_center(self) -> Coord:
+        """Natural pivot for rotation/scale: picture center."""
+        return self._center
+
+    @property
+    def anchor_names(self) -> list[str]:
+        """Available anchor names."""
+        return list(NAMED_POSITIONS)
+
+    def _named_anchor(self, name: str) -> Coord:
+        """Get anchor point by name (transform-aware)."""
+        if name not in NAMED_POSITIONS:
+            raise ValueError(f"Picture has no anchor '{name}'. Available: {self.anchor_names}")
+        return self._anchor_from_relcoord(NAMED_POSITIONS[name])
+
+    def _anchor_from_relcoord(self, rc: RelCoord) -> Coord:
+        """Resolve RelCoord in local picture space, then apply world transform."""
+        local = Coord(self.x + rc.rx * self.width, self.y + rc.ry * self.height)
+        return self._to_world_space(local)
+
+    def bounds(self, *, visual: bool = False) -> tuple[float, float, float, float]:
+        """Get axis-aligned bounding box (accounts for rotation and scale)."""
+        if self._rotation == 0 and self._scale_factor == 1.0:
+            return (self.x, self.y, self.x + self.width, self.y + self.height)
+        corners = [
+            self.anchor(name) for name in ("top_left", "top_right", "bottom_left", "bottom_right")
+        ]
+        xs = [c.x for c in corners]
+        ys = [c.y for c in corners]
+        return (min(xs), min(ys), max(xs), max(ys))
+
+    def rotated_bounds(
+        self,
+        angle: float,
+        *,
+        visual: bool = False,
+    ) -> tuple[float, float, float, float]:
+        """Exact AABB of this picture rotated by *angle* degrees around origin."""
+        if angle == 0:
+            return self.bounds(visual=visual)
+        rad = math.radians(angle)
+        cos_a, sin_a = math.cos(rad), math.sin(rad)
+        corners = [
+            self.anchor(name) for name in ("top_left", "top_right", "bottom_left", "bottom_right")
+        ]
+        rx = [c.x * cos_a - c.y * sin_a for c in corners]
+        ry = [c.x * sin_a + c.y * cos_a for c in corners]
+        return (min(rx), min(ry), max(rx), max(ry))
+
+    def to_svg(self) -> str:
+        """Render to an SVG ``<use>`` element (delegates to renderer)."""
+        return SMILRenderer().render_entity(self)
+
+    def __repr__(self) -> str:
+        return f"Picture({self.x}, {self.y}, {self.width}x{self.height}, href={self.href!r})"
+
+
+# fit mode -> SVG preserveAspectRatio
+_ASPECT_RATIO = {
+    "slice": "xMidYMid slice",
+    "meet": "xMidYMid meet",
+    "stretch": "none",
+}
@@ -290,6 +290,7 @@ class Polygon(Entity):
                 self._relative_vertices = [
                     RelCoord(v.rx + drx, v.ry + dry) for v in self._relative_vertices
                 ]
+                self._geometry_changed()
                 return self
         # Pixel mode: shift vertex specs directly
         new_specs = []
@@ -300,6 +301,7 @@ class Polygon(Entity):
                 new_specs.append(spec)  # Entity refs untouched
         self._vertex_specs = new_specs
         self._position = Coord(self._position.x + dx, self._position.y + dy)
+        self._geometry_changed()
         return self
 
     def bounds(self, *, visual: bool = False) -> tuple[float, float, float, float]:
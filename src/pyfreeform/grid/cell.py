@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING, Any
 
 from ..core.coord import Coord
 from ..core.relcoord import RelCoord
 from ..core.entity import Entity
 from ..core.surface import Surface
+from ..image.tiled import TiledImage
+from .layers import CellData
 
 if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+    from ..core.connection import Connection
+    from ..core.spatial import SpatialIndex
+    from ..image.integral import RegionStats
     from .grid import Grid
 
 
@@ -49,6 +57,9 @@ class Cell(Surface):
         color: Hex color string (from loaded image)
         rgb: RGB tuple (0-255 each)
         alpha: Transparency 0.0-1.0
+        hue: Hue in degrees 0-360
+        saturation: HSL saturation 0.0-1.0
+        lightness: HSL lightness 0.0-1.0
     """
 
     def __init__(
@@ -77,6 +88,24 @@ class Cell(Surface):
         self._grid = grid
         self._row = row
         self._col = col
+        self._data = CellData(grid, row, col)
+
+    def _register_entity(self, entity: Entity) -> None:
+        """Register an entity and keep this cell alive on its grid."""
+        super()._register_entity(entity)
+        self._grid._retain(self)
+
+    def _spatial_indexes(self) -> list[SpatialIndex]:
+        """This cell's own index (if queried) and the grid-wide one."""
+        indexes = super()._spatial_indexes()
+        if self._grid._spatial is not None:
+            indexes.append(self._grid._spatial)
+        return indexes
+
+    def add_connection(self, connection: Connection) -> None:
+        """Register a connection and keep this cell alive on its grid."""
+        super().add_connection(connection)
+        self._grid._retain(self)
 
     # =========================================================================
     # TYPED DATA PROPERTIES
@@ -147,6 +176,10 @@ class Cell(Surface):
         stored = self._data.get("rgb")
         if stored is not None:
             return stored
+        # Read a loaded color layer directly (no hex round-trip)
+        layer = self._grid._layers.get("color")
+        if layer is not None and layer.channels == 3:
+            return layer.rgb_at(self._row, self._col)
         # Try to derive from hex color
         hex_color = self._data.get("color")
         if hex_color and hex_color.startswith("#") and len(hex_color) == 7:
@@ -170,10 +203,60 @@ class Cell(Surface):
         raw = self._data.get("alpha")
         return float(raw) if raw is not None else 1.0
 
+    def _color_space(self, name: str, default: float) -> float:
+        """A color-space value: explicit data first, else derived from the color layer."""
+        raw = self._data.get(name)
+        if raw is not None:
+            return float(raw)
+        layer = self._grid._get_layer(name)
+        return layer.get(self._row, self._col) if layer is not None else default
+
+    @property
+    def hue(self) -> float:
+        """
+        Hue of the cell's color in degrees (0-360, red = 0).
+
+        Computed for the whole grid at once from the color layer (not
+        per cell), and matches ``Color(cell.color).to_hsl()[0]``.
+
+        Returns 0.0 if no image is loaded.
+
+        Example:
+            ```python
+            if 180 <= cell.hue < 270:
+                cell.add_dot(color="navy")
+            ```
+        """
+        return self._color_space("hue", 0.0)
+
+    @property
+    def saturation(self) -> float:
+        """
+        HSL saturation of the cell's color, from 0.0 (gray) to 1.0.
+
+        Returns 0.0 if no image is loaded.
+        """
+        return self._color_space("saturation", 0.0)
+
+    @property
+    def lightness(self) -> float:
+        """
+        HSL lightness of the cell's color, from 0.0 (black) to 1.0 (white).
+
+        Unlike ``brightness`` this is the midpoint of the strongest and
+        weakest channel, not a perceptual weighting.
+
+        Returns 0.5 if no image is loaded.
+        """
+        return self._color_space("lightness", 0.5)
+
     @property
-    def data(self) -> dict[str, Any]:
+    def data(self) -> MutableMapping[str, Any]:
         """
-        Raw data dictionary (for custom data or backwards compatibility).
+        Raw data mapping (for custom data or backwards compatibility).
+
+        Keys loaded with ``grid.load_layer()`` read and write the grid's
+        layer arrays; any other key is stored for this cell only.
 
         Prefer typed properties (brightness, color, etc.) for standard data.
         """
@@ -206,56 +289,56 @@ class Cell(Surface):
     def above(self) -> Cell | None:
         """Cell above this one (north), or None if at edge."""
         if self._row > 0:
-            return self._grid[self._row - 1][self._col]
+            return self._grid._cell(self._row - 1, self._col)
         return None
 
     @property
     def below(self) -> Cell | None:
         """Cell below this one (south), or None if at edge."""
         if self._row < self._grid.num_rows - 1:
-            return self._grid[self._row + 1][self._col]
+            return self._grid._cell(self._row + 1, self._col)
         return None
 
     @property
     def left(self) -> Cell | None:
         """Cell to the left (west), or None if at edge."""
         if self._col > 0:
-            return self._grid[self._row][self._col - 1]
+            return self._grid._cell(self._row, self._col - 1)
         return None
 
     @property
     def right(self) -> Cell | None:
         """Cell to the right (east), or None if at edge."""
         if self._col < self._grid.num_columns - 1:
-            return self._grid[self._row][self._col + 1]
+            return self._grid._cell(self._row, self._col + 1)
         return None
 
     @property
     def above_left(self) -> Cell | None:
         """Cell diagonally above-left (northwest), or None if at edge."""
         if self._row > 0 and self._col > 0:
-            return self._grid[self._row - 1][self._col - 1]
+            return self._grid._cell(self._row - 1, self._col - 1)
         return None
 
     @property
     def above_right(self) -> Cell | None:
         """Cell diagonally above-right (northeast), or None if at edge."""
         if self._row > 0 and self._col < self._grid.num_columns - 1:
-            return self._grid[self._row - 1][self._col + 1]
+            return self._grid._cell(self._row - 1, self._col + 1)
         return None
 
     @property
     def below_left(self) -> Cell | None:
         """Cell diagonally below-left (southwest), or None if at edge."""
         if self._row < self._grid.num_rows - 1 and self._col > 0:
-            return self._grid[self._row + 1][self._col - 1]
+            return self._grid._cell(self._row + 1, self._col - 1)
         return None
 
     @property
     def below_right(self) -> Cell | None:
         """Cell diagonally below-right (southeast), or None if at edge."""
         if self._row < self._grid.num_rows - 1 and self._col < self._grid.num_columns - 1:
-            return self._grid[self._row + 1][self._col + 1]
+            return self._grid._cell(self._row + 1, self._col + 1)
         return None
 
     @property
@@ -333,7 +416,9 @@ class Cell(Surface):
     # SUB-CELL IMAGE SAMPLING
     # =========================================================================
 
-    def sample_image(self, rx: float = 0.5, ry: float = 0.5) -> tuple[int, int, int]:
+    def sample_image(
+        self, rx: float = 0.5, ry: float = 0.5, footprint: float = 0.0
+    ) -> tuple[int, int, int]:
         """
         Read a single pixel from the original source image (no averaging).
 
@@ -342,9 +427,17 @@ class Cell(Surface):
         — a cell on a black/white border returns pure black or pure white
         depending on where the sample point falls.
 
+        When cells span many source pixels, a single pixel is a noisy
+        stand-in for its neighbourhood. Pass the sample's *footprint* (its
+        size as a fraction of the cell, e.g. ``0.25`` for a 4x4 pattern of
+        samples) to read the matching level of the image pyramid instead,
+        where each pixel already averages about that much source area.
+
         Args:
             rx: Horizontal position within cell (0.0 = left edge, 1.0 = right edge).
             ry: Vertical position within cell (0.0 = top edge, 1.0 = bottom edge).
+            footprint: Area to average over, as a fraction of the cell size.
+                0 reads one full-resolution pixel.
 
         Returns:
             RGB tuple (0-255 each).
@@ -355,15 +448,28 @@ class Cell(Surface):
         image = self._grid.source_image
         if image is None:
             raise ValueError("Grid was not created from an image — no source image to sample")
-        px = int(
-            min(max(0, (self._col + rx) * image.width / self._grid.num_columns), image.width - 1)
-        )
-        py = int(
-            min(max(0, (self._row + ry) * image.height / self._grid.num_rows), image.height - 1)
-        )
+        sx = image.width / self._grid.num_columns
+        sy = image.height / self._grid.num_rows
+        x = (self._col + rx) * sx
+        y = (self._row + ry) * sy
+        # Pyramid level whose pixels are at most the footprint across
+        span = footprint * min(sx, sy)
+        level = int(math.log2(span)) if span >= 2 else 0
+        if level and isinstance(image, TiledImage):
+            # No pyramid for streamed files: average the footprint window directly
+            size = 1 << level
+            x0, y0 = int(x) - size // 2, int(y) - size // 2
+            window = image.read(max(0, x0), max(0, y0), x0 + size, y0 + size)
+            return tuple(int(v) for v in window[..., :3].mean(axis=(0, 1)))
+        if level:
+            level = min(level, image.pyramid_depth - 1)
+            image = image.pyramid_level(level)
+            x, y = x / (1 << level), y / (1 << level)
+        px = int(min(max(0, x), image.width - 1))
+        py = int(min(max(0, y), image.height - 1))
         return image.rgb_at(px, py)
 
-    def sample_brightness(self, rx: float = 0.5, ry: float = 0.5) -> float:
+    def sample_brightness(self, rx: float = 0.5, ry: float = 0.5, footprint: float = 0.0) -> float:
         """
         Read brightness of a single pixel from the original source image.
 
@@ -374,14 +480,16 @@ class Cell(Surface):
         Args:
             rx: Horizontal position within cell (0.0 = left edge, 1.0 = right edge).
             ry: Vertical position within cell (0.0 = top edge, 1.0 = bottom edge).
+            footprint: Area to average over, as a fraction of the cell size
+                (see ``sample_image``).
 
         Returns:
             Brightness value 0.0 (black) to 1.0 (white).
         """
-        r, g, b = self.sample_image(rx, ry)
+        r, g, b = self.sample_image(rx, ry, footprint)
         return (0.299 * r + 0.587 * g + 0.114 * b) / 255.0
 
-    def sample_hex(self, rx: float = 0.5, ry: float = 0.5) -> str:
+    def sample_hex(self, rx: float = 0.5, ry: float = 0.5, footprint: float = 0.0) -> str:
         """
         Read hex color of a single pixel from the original source image.
 
@@ -391,12 +499,63 @@ class Cell(Surface):
         Args:
             rx: Horizontal position within cell (0.0 = left edge, 1.0 = right edge).
             ry: Vertical position within cell (0.0 = top edge, 1.0 = bottom edge).
+            footprint: Area to average over, as a fraction of the cell size
+                (see ``sample_image``).
 
         Returns:
             Hex color string (e.g., "#ff5733").
         """
-        r, g, b = self.sample_image(rx, ry)
+        r, g, b = self.sample_image(rx, ry, footprint)
         return f"#{r:02x}{g:02x}{b:02x}"
 
+    def region_stats(
+        self,
+        rx0: float = 0.0,
+        ry0: float = 0.0,
+        rx1: float = 1.0,
+        ry1: float = 1.0,
+        layer: str = "brightness",
+    ) -> RegionStats:
+        """
+        Statistics of source-image pixels inside a sub-rectangle of this cell.
+
+        Where ``sample_brightness()`` reads one pixel, this averages every
+        full-resolution pixel in the region -- in constant time, via the
+        source layer's cached summed-area table (or by reading just that
+        region, for a TiledImage source). Values are normalized to
+        0.0-1.0 like ``sample_brightness()``.
+
+        Args:
+            rx0: Left edge within cell (0.0 = left, 1.0 = right).
+            ry0: Top edge within cell (0.0 = top, 1.0 = bottom).
+            rx1: Right edge within cell.
+            ry1: Bottom edge within cell.
+            layer: Source image layer ("brightness", "red", "alpha", ...).
+
+        Returns:
+            RegionStats with count (pixels), sum, mean, variance and std.
+
+        Raises:
+            ValueError: If the grid was not created from an image.
+
+        Example:
+            ```python
+            left = cell.region_stats(0, 0, 0.5, 1)
+            right = cell.region_stats(0.5, 0, 1, 1)
+            if abs(left.mean - right.mean) > 0.3:
+                cell.add_line(start="top", end="bottom")
+            ```
+        """
+        image = self._grid.source_image
+        if image is None:
+            raise ValueError("Grid was not created from an image — no source image to sample")
+        sx = image.width / self._grid.num_columns
+        sy = image.height / self._grid.num_rows
+        x0 = min(max(0, math.floor((self._col + rx0) * sx)), image.width - 1)
+        y0 = min(max(0, math.floor((self._row + ry0) * sy)), image.height - 1)
+        x1 = max(x0 + 1, math.ceil((self._col + rx1) * sx))
+        y1 = max(y0 + 1, math.ceil((self._row + ry1) * sy))
+        return image.region_stats(x0, y0, x1, y1, layer).scaled(1 / 255)
+
     def __repr__(self) -> str:
         return f"Cell(row={self._row}, col={self._col}, brightness={self.brightness:.2f})"
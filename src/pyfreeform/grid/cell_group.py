@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from ..core.surface import Surface
 
 if TYPE_CHECKING:
+    from ..core.spatial import SpatialIndex
     from .cell import Cell
     from .grid import Grid
 
@@ -57,13 +58,46 @@ class CellGroup(Surface):
         max_y = max(c.y + c.height for c in cells)
         super().__init__(x, y, max_x - x, max_y - y)
 
+        # Rectangular groups (everything grid.merge() makes) average their
+        # data in O(1) from the grid's summed-area tables.
+        row_start = min(c.row for c in cells)
+        col_start = min(c.col for c in cells)
+        row_end = max(c.row for c in cells) + 1
+        col_end = max(c.col for c in cells) + 1
+        is_block = len(cells) == (row_end - row_start) * (col_end - col_start) and all(
+            c.grid is grid for c in cells
+        )
+        self._span = (row_start, col_start, row_end, col_end) if is_block else None
+
+    def _spatial_indexes(self) -> list[SpatialIndex]:
+        """This group's own index (if queried) and the grid-wide one."""
+        indexes = super()._spatial_indexes()
+        if self._grid._spatial is not None:
+            indexes.append(self._grid._spatial)
+        return indexes
+
     # =========================================================================
     # AVERAGED DATA PROPERTIES
     # =========================================================================
 
+    def _layer_mean(self, name: str, default: float) -> float | None:
+        """O(1) mean of a scalar layer, or None if the slow path is needed."""
+        if self._span is None:
+            return None
+        if name in self._grid._extra_keys:
+            return None  # Some cell holds its own value for this key
+        layer = self._grid._layers.get(name)
+        if layer is not None:
+            return self._grid._region_mean(name, self._span) if layer.channels == 1 else None
+        # No layer and no cell ever set the key: every cell reads the default
+        return default
+
     @property
     def brightness(self) -> float:
         """Average brightness across all constituent cells."""
+        mean = self._layer_mean("brightness", 0.5)
+        if mean is not None:
+            return mean
         return sum(c.brightness for c in self._cells) / len(self._cells)
 
     @property
@@ -75,15 +109,28 @@ class CellGroup(Surface):
     @property
     def rgb(self) -> tuple[int, int, int]:
         """Average RGB across all constituent cells."""
+        grid = self._grid
+        if self._span is not None and "rgb" not in grid._extra_keys:
+            # Same precedence as Cell.rgb: an "rgb" layer, then a "color" layer
+            name = "rgb" if "rgb" in grid._layers else "color"
+            layer = grid._layers.get(name)
+            if layer is not None and layer.channels == 3:
+                r, g, b = (grid._region_mean(name, self._span, channel) for channel in range(3))
+                return (round(r), round(g), round(b))
+
         n = len(self._cells)
-        total_r = sum(c.rgb[0] for c in self._cells)
-        total_g = sum(c.rgb[1] for c in self._cells)
-        total_b = sum(c.rgb[2] for c in self._cells)
+        rgbs = [c.rgb for c in self._cells]
+        total_r = sum(rgb[0] for rgb in rgbs)
+        total_g = sum(rgb[1] for rgb in rgbs)
+        total_b = sum(rgb[2] for rgb in rgbs)
         return (round(total_r / n), round(total_g / n), round(total_b / n))
 
     @property
     def alpha(self) -> float:
         """Average alpha across all constituent cells."""
+        mean = self._layer_mean("alpha", 1.0)
+        if mean is not None:
+            return mean
         return sum(c.alpha for c in self._cells) / len(self._cells)
 
     # =========================================================================
@@ -3,16 +3,36 @@
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING, Literal
+import weakref
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
 
 from ..core.coord import Coord
+from ..core.spatial import SpatialIndex
 from ..image import Image, Layer
+from ..image.colorspace import COLOR_SPACE_LAYERS, color_space_layers
+from ..image.dither import dither
+from ..image.tiled import TiledImage, accumulate_cells
 from .cell import Cell
 from .cell_group import CellGroup
+from .layers import GridLayer
+from .mask import CellMask
+from .neighborhood import SOBEL_X, SOBEL_Y, check_kernel, correlate
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator
 
+    from ..image.cache import ImageCache
+    from ..image.integral import RegionStats
+    from .neighborhood import EdgeMode
+
+
+class _CellRef(weakref.ref):
+    """Weak reference to a transient cell, remembering its cache key."""
+
+    __slots__ = ("key",)
+
 
 class Grid:
     """
@@ -67,32 +87,33 @@ class Grid:
         self._cell_width = cell_width or cell_size or 10
         self._cell_height = cell_height or cell_size or 10
         self._origin = Coord(*origin)
-        self._source_image: Image | None = None
-
-        # Create cells
-        self._cells: list[list[Cell]] = []
+        self._source_image: Image | TiledImage | None = None
+
+        # Cell data: one array per loaded layer, plus sparse custom keys
+        self._layers: dict[str, GridLayer] = {}
+        self._cell_extras: dict[tuple[int, int], dict[str, Any]] = {}
+        self._extra_keys: set[str] = set()
+
+        # Cells are created on demand from (row, col): geometry is grid
+        # arithmetic and data lives in the arrays above. A cell is kept once
+        # it holds entities or connections; otherwise it only lives while
+        # referenced, so huge grids cost nothing for cells the art never uses.
+        # Both are keyed by flat index ``row * cols + col``.
+        self._cells: dict[int, Cell] = {}
+        self._transient_cells: dict[int, _CellRef] = {}
+        # The row grid[row] returned last, so grid[row][col] loops over a
+        # row don't rebuild it per column; at most one row is held this way
+        self._last_row: tuple[int, list[Cell]] | None = None
         self._cell_groups: list[CellGroup] = []
-        for row in range(rows):
-            row_cells = []
-            for col in range(cols):
-                x = self._origin.x + col * self._cell_width
-                y = self._origin.y + row * self._cell_height
-                cell = Cell(
-                    grid=self,
-                    row=row,
-                    col=col,
-                    x=x,
-                    y=y,
-                    width=self._cell_width,
-                    height=self._cell_height,
-                )
-                row_cells.append(cell)
-            self._cells.append(row_cells)
+        # Index over all cell and group entities, built on the first query
+        self._spatial: SpatialIndex | None = None
+        # Color-space layers derived from "color": name -> (color version, layer)
+        self._derived: dict[str, tuple[int, GridLayer]] = {}
 
     @classmethod
     def from_image(
         cls,
-        image: Image,
+        image: Image | TiledImage,
         cols: int | None = None,
         rows: int | None = None,
         cell_size: float = 10,
@@ -101,12 +122,25 @@ class Grid:
         cell_height: float | None = None,
         origin: tuple[float, float] = (0, 0),
         load_layers: bool = True,
+        stats: tuple[str, ...] = (),
+        cache: ImageCache | None = None,
     ) -> Grid:
         """
         Create a grid sized to match an image.
 
+        A TiledImage is streamed strip by strip instead of resized in
+        memory; cell values are then plain area averages of the source
+        pixels, and the grid may not have more cells than the image has
+        pixels along either axis. Only uncompressed files (raw TIFF,
+        PPM/PGM) stream in bounded memory: other formats, compressed
+        TIFF included, are decoded in full for the pass (1-4 bytes per
+        pixel) and released afterwards; ``cell.sample_image()`` and
+        ``cell.region_stats()`` on them decode the file once more and keep
+        it until ``image.release()``.
+
         Args:
-            image: Source image (will be resized to match grid).
+            image: Source image (will be resized to match grid), or a
+                TiledImage for files too large to load.
             cols: Number of columns (calculates rows from aspect ratio).
                 If None and rows is also None, derives both from image
                 dimensions and cell size (fit-grid-to-image mode).
@@ -117,6 +151,11 @@ class Grid:
             cell_height: Explicit cell height (overrides cell_size).
             origin: Top-left corner of the grid.
             load_layers: Whether to load image data into cells.
+            stats: Extra per-cell statistics of source-pixel brightness to
+                compute in the same pass: any of "std", "min", "max".
+                Stored as layers ``"brightness_std"`` etc. (0.0-1.0).
+            cache: Optional ImageCache; when the image came from
+                ``cache.load()``, the resampled grid layers are cached too.
 
         Returns:
             A new Grid with image data loaded into cells.
@@ -155,20 +194,127 @@ class Grid:
             origin=origin,
         )
 
-        # Load image data
-        if load_layers:
-            # Resize image to match grid dimensions
-            resized = image.resize(cols, rows)
+        grid._load_image(image, load_layers, stats, cache)
+        return grid
+
+    def load_image(
+        self,
+        image: Image | TiledImage,
+        stats: tuple[str, ...] = (),
+        cache: ImageCache | None = None,
+    ) -> None:
+        """
+        Replace the grid's image layers with data from another image.
 
-            # Load standard layers
-            grid.load_layer("color", resized, mode="hex")
-            grid.load_layer("brightness", resized["brightness"], mode="normalized")
-            if resized.has_alpha:
-                grid.load_layer("alpha", resized["alpha"], mode="normalized")
+        Resamples *image* to the grid's columns and rows and reloads the
+        ``"color"``, ``"brightness"`` and ``"alpha"`` layers (plus any
+        *stats*), then makes it the source image for sub-cell sampling.
+        Cells, cell groups and their entities are left untouched, so one
+        grid can be refreshed for every frame of an animation instead of
+        being rebuilt.
+
+        Args:
+            image: The new source image (ideally of the same aspect ratio).
+            stats: Extra per-cell brightness statistics, as in ``from_image``.
+            cache: Optional ImageCache for the resampled layers.
+
+        Example:
+            ```python
+            for frame in Image.iter_frames("clip.gif"):
+                grid.load_image(frame)
+                ...
+            ```
+        """
+        self._load_image(image, True, stats, cache)
+
+    def _load_image(
+        self,
+        image: Image | TiledImage,
+        load_layers: bool,
+        stats: tuple[str, ...],
+        cache: ImageCache | None,
+    ) -> None:
+        """Load layers from *image* (see ``from_image`` and ``load_image``)."""
+        cols, rows = self._cols, self._rows
+        if isinstance(image, TiledImage):
+            # Stream the file once, accumulating every layer in the same pass
+            if load_layers or stats:
+                averages = accumulate_cells(
+                    image.strips(), image.width, image.height, cols, rows, stats
+                )
+            if load_layers:
+                self._load_averages(averages, image.has_alpha)
+        else:
+            if load_layers:
+                # Resize image to match grid dimensions
+                if cache is not None:
+                    resized = cache.resize(image, cols, rows)
+                else:
+                    resized = image.resize(cols, rows)
+
+                # Load standard layers
+                self.load_layer("color", resized, mode="hex")
+                self.load_layer("brightness", resized["brightness"], mode="normalized")
+                if resized.has_alpha:
+                    self.load_layer("alpha", resized["alpha"], mode="normalized")
+            if stats:
+                averages = accumulate_cells(
+                    image.strips(), image.width, image.height, cols, rows, stats
+                )
+        if load_layers and not image.has_alpha:
+            self._layers.pop("alpha", None)  # Left over from a previous image
+        for stat in stats:
+            self._set_layer(f"brightness_{stat}", GridLayer(averages[f"brightness_{stat}"]))
 
         # Store source image reference for sub-cell sampling
-        grid._source_image = image
+        self._source_image = image
+
+    @classmethod
+    def adaptive_from_image(
+        cls,
+        image: Image,
+        max_depth: int = 6,
+        threshold: float = 0.002,
+        cell_size: float = 10,
+        origin: tuple[float, float] = (0, 0),
+        layer: str = "color",
+    ) -> Grid:
+        """
+        Create a grid whose regions adapt to image detail (quadtree).
+
+        The grid is built at ``2 ** max_depth`` cells along the longer
+        image side, then ``subdivide()`` merges it into square-ish blocks:
+        flat areas (sky, walls) become a few large blocks while detailed
+        areas keep small ones. The blocks are ``CellGroup`` surfaces with
+        the usual typed properties and are available as ``grid.cell_groups``.
 
+        Args:
+            image: Source image.
+            max_depth: Maximum subdivision depth. The finest blocks are
+                single cells of a ``2 ** max_depth``-wide grid.
+            threshold: Variance (on a 0-1 scale) above which a block splits.
+                Lower values keep more detail.
+            cell_size: Size of the finest cells in pixels.
+            origin: Top-left corner of the grid.
+            layer: Layer whose variance drives splitting ("color" or "brightness").
+
+        Returns:
+            A new Grid with image data loaded and quadtree blocks in ``cell_groups``.
+
+        Example:
+            ```python
+            grid = Grid.adaptive_from_image(image, max_depth=6, threshold=0.002)
+            scene.add_grid(grid)
+            for block in grid.cell_groups:
+                block.add_fill(color=block.color)
+            ```
+        """
+        side = 2**max_depth
+        if image.width >= image.height:
+            grid = cls.from_image(image, cols=side, cell_size=cell_size, origin=origin)
+        else:
+            grid = cls.from_image(image, rows=side, cell_size=cell_size, origin=origin)
+        grid.subdivide(threshold=threshold, max_depth=max_depth, layer=layer)
         return grid
 
     # --- Properties ---
@@ -214,10 +360,15 @@ class Grid:
         return self._origin
 
     @property
-    def source_image(self) -> Image | None:
+    def source_image(self) -> Image | TiledImage | None:
         """The original source image (if created via from_image), or None."""
         return self._source_image
 
+    @property
+    def cell_groups(self) -> list[CellGroup]:
+        """CellGroups created by ``merge()`` or ``subdivide()``, in creation order."""
+        return list(self._cell_groups)
+
     # --- Cell access ---
 
     def __getitem__(self, key: int) -> list[Cell]:
@@ -235,12 +386,19 @@ class Grid:
         """
         if not (0 <= key < self._rows):
             raise IndexError(f"Row {key} out of bounds for grid with {self._rows} rows")
-        return self._cells[key]
+        last = self._last_row
+        if last is not None and last[0] == key:
+            return last[1]
+        row = self._row_cells(key)
+        self._last_row = (key, row)
+        return row
 
     def __iter__(self) -> Iterator[Cell]:
         """Iterate over all cells (row by row, left to right)."""
-        for row in self._cells:
-            yield from row
+        cell_at = self._cell
+        for row in range(self._rows):
+            for col in range(self._cols):
+                yield cell_at(row, col)
 
     def __len__(self) -> int:
         """Total number of cells."""
@@ -262,7 +420,7 @@ class Grid:
         row = math.floor((y - self._origin.y) / self._cell_height)
 
         if 0 <= row < self._rows and 0 <= col < self._cols:
-            return self._cells[row][col]
+            return self._cell(row, col)
         return None
 
     def get(self, row: int, col: int) -> Cell | None:
@@ -281,7 +439,7 @@ class Grid:
             The Cell at that position, or None if out of bounds.
         """
         if 0 <= row < self._rows and 0 <= col < self._cols:
-            return self._cells[row][col]
+            return self._cell(row, col)
         return None
 
     @property
@@ -289,6 +447,44 @@ class Grid:
         """All cells as a flat list (row by row, left to right)."""
         return list(self)
 
+    def _cell(self, row: int, col: int) -> Cell:
+        """The cell at (row, col), created on first use (indices not checked)."""
+        key = row * self._cols + col
+        cell = self._cells.get(key)
+        if cell is None:
+            ref = self._transient_cells.get(key)
+            if ref is None or (cell := ref()) is None:
+                cell = Cell(
+                    self,
+                    row,
+                    col,
+                    self._origin.x + col * self._cell_width,
+                    self._origin.y + row * self._cell_height,
+                    self._cell_width,
+                    self._cell_height,
+                )
+                ref = _CellRef(cell, self._forget_cell)
+                ref.key = key
+                self._transient_cells[key] = ref
+        return cell
+
+    def _forget_cell(self, ref: _CellRef) -> None:
+        """Weakref callback: drop the cache entry of a cell nobody references."""
+        if self._transient_cells.get(ref.key) is ref:
+            del self._transient_cells[ref.key]
+
+    def _row_cells(self, row: int) -> list[Cell]:
+        """A fresh list of the cells in one row (indices not checked)."""
+        return [self._cell(row, col) for col in range(self._cols)]
+
+    def _retain(self, cell: Cell) -> None:
+        """Keep a cell alive for the grid's lifetime (called when it gains state)."""
+        self._cells[cell.row * self._cols + cell.col] = cell
+
+    def _retained_cells(self) -> list[Cell]:
+        """Cells that hold (or once held) entities or connections, row by row."""
+        return [self._cells[key] for key in sorted(self._cells)]
+
     # --- Layer data ---
 
     def load_layer(
@@ -300,6 +496,9 @@ class Grid:
         """
         Load layer data from an image or layer into cell data.
 
+        The values are stored once on the grid as an array layer;
+        ``cell.data[name]`` and the typed cell properties read from it.
+
         Args:
             name: Key to store data under in cell.data.
             source: A Layer or Image to sample from.
@@ -308,60 +507,161 @@ class Grid:
                     "normalized" - Store value / 255 (0-1 range)
                     "hex" - Store hex color string (requires Image source)
         """
-        # Handle Image source
         if isinstance(source, Image):
             image = source
             # Resize to match grid if needed
             if image.width != self._cols or image.height != self._rows:
                 image = image.resize(self._cols, self._rows)
 
-            for row in range(self._rows):
-                for col in range(self._cols):
-                    cell = self._cells[row][col]
-                    if mode == "hex":
-                        cell.data[name] = image.hex_at(col, row)
-                    elif mode == "normalized":
-                        r, g, b = image.rgb_at(col, row)
-                        cell.data[name] = (r + g + b) / (3 * 255)
-                    else:
-                        cell.data[name] = image.rgb_at(col, row)
+            # Clip and truncate to 0-255 ints, as Image.rgb_at() does
+            rgb = np.stack(
+                [np.clip(image[channel].data, 0, 255) for channel in ("red", "green", "blue")],
+                axis=-1,
+            ).astype(np.uint8)
+            if mode == "hex":
+                layer = GridLayer(rgb, kind="hex")
+            elif mode == "normalized":
+                layer = GridLayer(rgb.sum(axis=-1, dtype=np.int64) / (3 * 255))
+            else:
+                layer = GridLayer(rgb, kind="rgb")
 
         elif isinstance(source, Layer):
-            layer = source
-            # Sample layer at each cell position
-            for row in range(self._rows):
-                for col in range(self._cols):
-                    # Map grid coords to layer coords
-                    lx = int(col * layer.width / self._cols)
-                    ly = int(row * layer.height / self._rows)
-                    lx = min(lx, layer.width - 1)
-                    ly = min(ly, layer.height - 1)
-
-                    value = layer[lx, ly]
-                    cell = self._cells[row][col]
-
-                    if mode == "normalized":
-                        cell.data[name] = value / 255.0
-                    else:
-                        cell.data[name] = value
+            # Sample the layer at each cell position (nearest, top-left aligned)
+            xs = (np.arange(self._cols) * source.width / self._cols).astype(np.intp)
+            ys = (np.arange(self._rows) * source.height / self._rows).astype(np.intp)
+            xs = np.minimum(xs, source.width - 1)
+            ys = np.minimum(ys, source.height - 1)
+            values = source.data[np.ix_(ys, xs)]
+
+            if mode == "normalized":
+                layer = GridLayer(values / 255.0)
+            else:
+                layer = GridLayer(values.copy())
 
         else:
             raise TypeError(f"Expected Layer or Image, got {type(source)}")
 
+        self._set_layer(name, layer)
+
+    def _load_averages(self, averages: dict[str, np.ndarray], has_alpha: bool) -> None:
+        """Load the standard layers from per-cell channel means (0-255)."""
+        channels = [averages[name] for name in ("red", "green", "blue")]
+        rgb = np.stack([np.clip(channel, 0, 255) for channel in channels], axis=-1)
+        self._set_layer("color", GridLayer(rgb.astype(np.uint8), kind="hex"))
+        brightness = 0.299 * channels[0] + 0.587 * channels[1] + 0.114 * channels[2]
+        self._set_layer("brightness", GridLayer(brightness / 255.0))
+        if has_alpha:
+            self._set_layer("alpha", GridLayer(averages["alpha"] / 255.0))
+
+    def _get_layer(self, name: str) -> GridLayer | None:
+        """
+        A loaded layer, or a color-space layer derived from "color".
+
+        Color-space layers (``"hue"``, ``"saturation"``, ``"L"``, ...) are
+        computed for the whole grid from the color layer on first use and
+        recomputed only after the color layer changes.
+        """
+        layer = self._layers.get(name)
+        if layer is not None or name not in COLOR_SPACE_LAYERS:
+            return layer
+        color = self._layers.get("color")
+        if color is None or color.channels != 3:
+            return None
+        cached = self._derived.get(name)
+        if cached is None or cached[0] != color.version:
+            rgb = color.values
+            computed = color_space_layers(name, rgb[..., 0], rgb[..., 1], rgb[..., 2])
+            for key, values in computed.items():
+                self._derived[key] = (color.version, GridLayer(values))
+            cached = self._derived[name]
+        return cached[1]
+
+    def _set_layer(self, name: str, layer: GridLayer) -> None:
+        """Store a layer under *name*, replacing any layer or per-cell values."""
+        self._layers[name] = layer
+        if name == "color":
+            self._derived.clear()
+        # The layer now owns this key; drop stale per-cell values
+        if name in self._extra_keys:
+            for extras in self._cell_extras.values():
+                extras.pop(name, None)
+
+    def region_stats(
+        self,
+        start: tuple[int, int] = (0, 0),
+        end: tuple[int, int] | None = None,
+        layer: str = "brightness",
+    ) -> RegionStats:
+        """
+        Sum, mean and variance of a loaded layer over a block of cells.
+
+        Runs in constant time regardless of block size (backed by a
+        summed-area table that is built once per layer and cached).
+        Corners are **inclusive**, like ``merge()``.
+
+        Args:
+            start: Top-left corner as ``(row, col)``. Default ``(0, 0)``.
+            end: Bottom-right corner as ``(row, col)``.
+                Default ``(rows-1, cols-1)`` (entire grid).
+            layer: Name of a numeric layer loaded via ``load_layer``
+                (e.g. "brightness", "alpha").
+
+        Returns:
+            RegionStats with count, sum, mean, variance and std.
+
+        Raises:
+            KeyError: If the layer has not been loaded.
+            ValueError: If the layer is a color layer, or the block is empty.
+
+        Example:
+            ```python
+            stats = grid.region_stats((0, 0), (9, 9))
+            if stats.std < 0.05:
+                grid.merge((0, 0), (9, 9)).add_fill(color="#222")
+            ```
+        """
+        if end is None:
+            end = (self._rows - 1, self._cols - 1)
+        grid_layer = self._get_layer(layer)
+        if grid_layer is None:
+            raise KeyError(f"Layer '{layer}' not loaded on this grid")
+        if grid_layer.channels != 1:
+            raise ValueError(f"Layer '{layer}' is a color layer; region_stats needs a numeric one")
+        (row_start, col_start), (row_end, col_end) = start, end
+        return grid_layer.table().stats(col_start, row_start, col_end + 1, row_end + 1)
+
+    def _region_mean(
+        self,
+        name: str,
+        span: tuple[int, int, int, int],
+        channel: int | None = None,
+    ) -> float:
+        """Mean of a layer over ``(row_start, col_start, row_end, col_end)`` (exclusive ends)."""
+        row_start, col_start, row_end, col_end = span
+        table = self._layers[name].table(channel)
+        return float(table.mean(col_start, row_start, col_end, row_end))
+
     # --- Utility methods ---
 
     def all_entities(self) -> list:
         """Get all entities in all cells and cell groups."""
         entities = []
-        for cell in self:
-            entities.extend(cell.entities)
+        for cell in self._retained_cells():
+            entities.extend(cell._entities)
         for group in self._cell_groups:
             entities.extend(group.entities)
         return entities
 
+    def _spatial_index(self) -> SpatialIndex:
+        """The index over every cell and group entity, built on first use."""
+        if self._spatial is None:
+            self._spatial = SpatialIndex(self.all_entities())
+        return self._spatial
+
     def clear(self) -> None:
         """Clear all entities from all cells and cell groups."""
-        for cell in self:
+        self._spatial = None
+        for cell in self._retained_cells():
             cell.clear()
         for group in self._cell_groups:
             group.clear()
@@ -389,7 +689,7 @@ class Grid:
         """
         if not 0 <= index < self._rows:
             raise IndexError(f"Row {index} out of bounds (0-{self._rows - 1})")
-        return list(self._cells[index])
+        return self._row_cells(index)
 
     def column(self, index: int) -> list[Cell]:
         """
@@ -409,7 +709,7 @@ class Grid:
         """
         if not 0 <= index < self._cols:
             raise IndexError(f"Column {index} out of bounds (0-{self._cols - 1})")
-        return [self._cells[row][index] for row in range(self._rows)]
+        return [self._cell(row, index) for row in range(self._rows)]
 
     @property
     def rows(self) -> Iterator[list[Cell]]:
@@ -423,8 +723,8 @@ class Grid:
                     cell.add_dot(color="red" if row_idx % 2 == 0 else "blue")
             ```
         """
-        for row in self._cells:
-            yield list(row)
+        for row in range(self._rows):
+            yield self._row_cells(row)
 
     @property
     def columns(self) -> Iterator[list[Cell]]:
@@ -439,7 +739,7 @@ class Grid:
             ```
         """
         for col in range(self._cols):
-            yield [self._cells[row][col] for row in range(self._rows)]
+            yield [self._cell(row, col) for row in range(self._rows)]
 
     # =========================================================================
     # REGION SELECTION
@@ -483,7 +783,7 @@ class Grid:
 
         for row in range(row_start, row_end):
             for col in range(col_start, col_end):
-                yield self._cells[row][col]
+                yield self._cell(row, col)
 
     def border(self, thickness: int = 1) -> Iterator[Cell]:
         """
@@ -501,16 +801,13 @@ class Grid:
                 cell.add_fill(color="gray")
             ```
         """
-        for cell in self:
-            r, c = cell.row, cell.col
-            on_border = (
-                r < thickness  # Top edge
-                or r >= self._rows - thickness  # Bottom edge
-                or c < thickness  # Left edge
-                or c >= self._cols - thickness  # Right edge
-            )
-            if on_border:
-                yield cell
+        # Only border cells are visited (interior cells are never created)
+        all_cols = range(self._cols)
+        edge_cols = [c for c in all_cols if c < thickness or c >= self._cols - thickness]
+        for r in range(self._rows):
+            on_edge_row = r < thickness or r >= self._rows - thickness  # Top / bottom edge
+            for c in all_cols if on_edge_row else edge_cols:
+                yield self._cell(r, c)
 
     # =========================================================================
     # CELL MERGING
@@ -600,6 +897,87 @@ class Grid:
         """
         return self.merge((0, index), (self._rows - 1, index))
 
+    def subdivide(
+        self,
+        threshold: float = 0.002,
+        max_depth: int | None = None,
+        layer: str = "color",
+    ) -> list[CellGroup]:
+        """
+        Merge the grid into quadtree blocks that follow its data's detail.
+
+        Starting from the whole grid, any block whose ``layer`` variance
+        exceeds ``threshold`` is split into four quadrants, recursively.
+        Each split test is O(1) (summed-area tables), and every tree level
+        is evaluated in one vectorized pass.
+
+        Args:
+            threshold: Variance (on a 0-1 scale; color layers use the mean of
+                the red/green/blue variances) above which a block splits.
+            max_depth: Maximum number of splits from the whole grid.
+                Default: split down to single cells where needed.
+            layer: Loaded layer to measure ("color", "brightness", ...).
+                Color-space layers such as ``"hue"`` work once a color
+                layer is loaded.
+
+        Returns:
+            The leaf blocks as CellGroups, top-to-bottom then left-to-right.
+            They are also registered like ``merge()`` groups.
+
+        Raises:
+            KeyError: If the layer has not been loaded.
+
+        Example:
+            ```python
+            scene = Scene.from_image("photo.jpg", grid_size=128)
+            for block in scene.grid.subdivide(threshold=0.003):
+                block.add_dot(color=block.color, radius=0.45)
+            ```
+        """
+        grid_layer = self._get_layer(layer)
+        if grid_layer is None:
+            raise KeyError(f"Layer '{layer}' not loaded on this grid")
+        if grid_layer.channels == 1:
+            tables, scale = [grid_layer.table()], 1.0
+        else:
+            tables, scale = [grid_layer.table(channel) for channel in range(3)], 1 / 255**2
+
+        # Pending blocks as parallel arrays (row_start, col_start, row_end, col_end)
+        blocks = np.array([[0, 0, self._rows, self._cols]], dtype=np.intp)
+        leaves: list[np.ndarray] = []
+        depth = 0
+        while len(blocks):
+            r0, c0, r1, c1 = blocks.T
+            variance = sum(t.variance(c0, r0, c1, r1) for t in tables) * scale / len(tables)
+            splittable = (r1 - r0 > 1) | (c1 - c0 > 1)
+            if max_depth is not None and depth >= max_depth:
+                splittable[:] = False
+            split = splittable & (variance > threshold)
+            leaves.append(blocks[~split])
+
+            # Quadrants of every split block; empty ones (1-wide blocks) are dropped
+            r0, c0, r1, c1 = blocks[split].T
+            rm, cm = (r0 + r1) // 2, (c0 + c1) // 2
+            children = np.concatenate(
+                [
+                    np.stack([r0, c0, rm, cm], axis=1),
+                    np.stack([r0, cm, rm, c1], axis=1),
+                    np.stack([rm, c0, r1, cm], axis=1),
+                    np.stack([rm, cm, r1, c1], axis=1),
+                ]
+            )
+            blocks = children[(children[:, 2] > children[:, 0]) & (children[:, 3] > children[:, 1])]
+            depth += 1
+
+        spans = np.concatenate(leaves)
+        spans = spans[np.lexsort((spans[:, 1], spans[:, 0]))]
+        groups = []
+        for r0, c0, r1, c1 in spans.tolist():
+            group = CellGroup(list(self.region(r0, r1, c0, c1)), grid=self)
+            self._cell_groups.append(group)
+            groups.append(group)
+        return groups
+
     # =========================================================================
     # PATTERN SELECTION
     # =========================================================================
@@ -624,9 +1002,8 @@ class Grid:
                 cell.add_fill(color="black")
             ```
         """
-        for i, cell in enumerate(self):
-            if (i - offset) % n == 0:
-                yield cell
+        for i in range(offset % n, self._rows * self._cols, n):
+            yield self._cell(*divmod(i, self._cols))
 
     def checkerboard(self, color: str = "black") -> Iterator[Cell]:
         """
@@ -645,14 +1022,18 @@ class Grid:
             ```
         """
         target_parity = 0 if color == "black" else 1
-        for cell in self:
-            if (cell.row + cell.col) % 2 == target_parity:
-                yield cell
+        for row in range(self._rows):
+            for col in range((target_parity - row) % 2, self._cols, 2):
+                yield self._cell(row, col)
 
     def where(self, predicate: Callable[[Cell], bool]) -> Iterator[Cell]:
         """
         Iterate over cells matching a condition.
 
+        Calls the predicate once per cell. For conditions on layer data,
+        ``select()`` and ``mask_where()`` do the same work as one array
+        comparison.
+
         Args:
             predicate: Function that takes a Cell and returns True/False.
 
@@ -699,13 +1080,364 @@ class Grid:
             for i in range(max(self._rows, self._cols)):
                 r, c = i, i + offset
                 if 0 <= r < self._rows and 0 <= c < self._cols:
-                    yield self._cells[r][c]
+                    yield self._cell(r, c)
         else:
             # Bottom-left to top-right
             for i in range(max(self._rows, self._cols)):
                 r, c = self._rows - 1 - i, i + offset
                 if 0 <= r < self._rows and 0 <= c < self._cols:
-                    yield self._cells[r][c]
+                    yield self._cell(r, c)
+
+    # =========================================================================
+    # VECTORIZED SELECTION
+    # =========================================================================
+
+    def layer_array(self, name: str) -> np.ndarray:
+        """
+        Read-only array of a loaded layer, one entry per cell.
+
+        Color-space layers (``"hue"``, ``"saturation"``, ``"lightness"``,
+        ``"value"``, ``"luminance"``, ``"L"``, ``"a"``, ``"b"``) are also
+        available once a color layer is loaded.
+
+        Args:
+            name: Layer name passed to ``load_layer`` (e.g. "brightness").
+
+        Returns:
+            ``(rows, cols)`` float array for numeric layers, or
+            ``(rows, cols, 3)`` uint8 array for color layers.
+
+        Raises:
+            KeyError: If the layer has not been loaded.
+        """
+        grid_layer = self._get_layer(name)
+        if grid_layer is None:
+            raise KeyError(f"Layer '{name}' not loaded on this grid")
+        view = grid_layer.values.view()
+        view.flags.writeable = False
+        return view
+
+    def _layer_or_default(self, name: str, default: float) -> np.ndarray:
+        """A numeric layer's array (or *default*), with per-cell values laid over it."""
+        if name in self._layers:
+            values = self.layer_array(name)
+        else:
+            values = np.full((self._rows, self._cols), default)
+        if name not in self._extra_keys:
+            return values
+        # Some cell holds its own value for this key, as cell.<name> reads it
+        values = values.astype(float)
+        for (row, col), extras in self._cell_extras.items():
+            raw = extras.get(name)
+            if raw is not None:
+                values[row, col] = float(raw)
+        values.flags.writeable = False
+        return values
+
+    @property
+    def brightness_array(self) -> np.ndarray:
+        """
+        Brightness of every cell as a ``(rows, cols)`` array.
+
+        Matches ``cell.brightness`` (0.5 everywhere if no image is loaded).
+        """
+        return self._layer_or_default("brightness", 0.5)
+
+    @property
+    def alpha_array(self) -> np.ndarray:
+        """
+        Alpha of every cell as a ``(rows, cols)`` array.
+
+        Matches ``cell.alpha`` (1.0 everywhere if no alpha is loaded).
+        """
+        return self._layer_or_default("alpha", 1.0)
+
+    def select(self, mask: np.ndarray | CellMask) -> CellMask:
+        """
+        Select cells with a boolean array.
+
+        The array is indexed ``[row, col]``, so comparisons on
+        ``brightness_array`` or ``layer_array()`` can be passed directly.
+
+        Args:
+            mask: Bool array of shape ``(rows, cols)``, or a CellMask.
+
+        Returns:
+            A CellMask that iterates the selected cells.
+
+        Raises:
+            ValueError: If the shape does not match the grid.
+            TypeError: If the array is not boolean.
+
+        Example:
+            ```python
+            for cell in grid.select(grid.brightness_array > 0.6):
+                cell.add_dot(color="white")
+            ```
+        """
+        if isinstance(mask, CellMask):
+            if mask.grid is not self:
+                raise ValueError("Mask belongs to a different grid")
+            return mask
+        return CellMask(self, mask)
+
+    def mask_where(
+        self,
+        layer: str,
+        *,
+        lt: float | None = None,
+        le: float | None = None,
+        gt: float | None = None,
+        ge: float | None = None,
+    ) -> CellMask:
+        """
+        Select cells whose layer value lies in a range.
+
+        All given bounds must hold. With no bounds, every cell is selected.
+
+        Args:
+            layer: Name of a numeric layer (e.g. "brightness").
+            lt: Select values strictly less than this.
+            le: Select values less than or equal to this.
+            gt: Select values strictly greater than this.
+            ge: Select values greater than or equal to this.
+
+        Returns:
+            A CellMask that iterates the selected cells.
+
+        Raises:
+            KeyError: If the layer has not been loaded.
+            ValueError: If the layer is a color layer.
+
+        Example:
+            ```python
+            midtones = grid.mask_where("brightness", ge=0.3, lt=0.7)
+            for cell in midtones & ~grid.mask_where("alpha", lt=0.5):
+                cell.add_line(start="left", end="right")
+            ```
+        """
+        values = self.layer_array(layer)
+        if values.ndim != 2:
+            raise ValueError(f"Layer '{layer}' is a color layer; mask_where needs a numeric one")
+        mask = np.ones(values.shape, dtype=bool)
+        if lt is not None:
+            mask &= values < lt
+        if le is not None:
+            mask &= values <= le
+        if gt is not None:
+            mask &= values > gt
+        if ge is not None:
+            mask &= values >= ge
+        return CellMask(self, mask)
+
+    # =========================================================================
+    # NEIGHBORHOOD OPERATIONS
+    # =========================================================================
+
+    def _numeric_layer(self, layer: str, operation: str) -> np.ndarray:
+        """Array of a numeric layer, with the errors every operation shares."""
+        values = self.layer_array(layer)
+        if values.ndim != 2:
+            raise ValueError(f"Layer '{layer}' is a color layer; {operation} needs a numeric one")
+        return values
+
+    def convolve(
+        self,
+        layer: str,
+        kernel: np.ndarray | list[list[float]],
+        name: str | None = None,
+        edge: EdgeMode = "nearest",
+    ) -> np.ndarray:
+        """
+        Convolve a numeric layer with a kernel and store the result as a layer.
+
+        The whole grid is processed in one vectorized pass; cells then
+        read the result through ``cell.data[name]``.
+
+        Args:
+            layer: Name of a numeric layer (e.g. "brightness").
+            kernel: 2D kernel with odd dimensions, indexed ``[row, col]``.
+            name: Layer name for the result. Default ``"<layer>_convolved"``.
+            edge: How cells beyond the border are filled:
+                "nearest" (repeat the edge cell), "reflect" (mirror),
+                "wrap" (opposite side) or "zero".
+
+        Returns:
+            The result as a read-only ``(rows, cols)`` array.
+
+        Raises:
+            KeyError: If the layer has not been loaded.
+            ValueError: If the layer is a color layer, the kernel is not
+                2D with odd dimensions, or the edge mode is unknown.
+
+        Example:
+            ```python
+            blur = [[1, 2, 1], [2, 4, 2], [1, 2, 1]]
+            grid.convolve("brightness", np.array(blur) / 16, name="soft")
+            for cell in grid:
+                cell.add_dot(radius=0.4 * cell.data["soft"])
+            ```
+        """
+        values = self._numeric_layer(layer, "convolve")
+        kernel = check_kernel(kernel)
+        result = correlate(values, kernel[::-1, ::-1], edge)
+        name = name or f"{layer}_convolved"
+        self._set_layer(name, GridLayer(result))
+        return self.layer_array(name)
+
+    def neighbor_mean(
+        self,
+        layer: str = "brightness",
+        name: str | None = None,
+        diagonals: bool = True,
+        include_self: bool = False,
+        edge: EdgeMode | Literal["ignore"] = "ignore",
+    ) -> np.ndarray:
+        """
+        Average of each cell's neighbors, stored as a layer.
+
+        The vectorized counterpart of averaging over ``cell.neighbors_all``
+        (or ``cell.neighbors`` with ``diagonals=False``) for every cell.
+
+        Args:
+            layer: Name of a numeric layer.
+            name: Layer name for the result. Default ``"<layer>_neighbor_mean"``.
+            diagonals: Use all 8 neighbors (True) or only the 4 cardinal ones.
+            include_self: Include the cell's own value in the average.
+            edge: "ignore" averages only the neighbors that exist (like
+                skipping ``None`` neighbors); any ``convolve`` edge mode
+                fills the missing ones instead.
+
+        Returns:
+            The result as a read-only ``(rows, cols)`` array.
+
+        Raises:
+            KeyError: If the layer has not been loaded.
+            ValueError: If the layer is a color layer or the edge mode is unknown.
+
+        Example:
+            ```python
+            grid.neighbor_mean("brightness", name="around")
+            for cell in grid.select(grid.brightness_array > grid.layer_array("around")):
+                cell.add_dot(color="white")
+            ```
+        """
+        values = self._numeric_layer(layer, "neighbor_mean")
+        kernel = np.ones((3, 3)) if diagonals else np.array([[0, 1, 0], [1, 1, 1], [0, 1, 0]])
+        kernel = kernel.astype(np.float64)
+        kernel[1, 1] = 1.0 if include_self else 0.0
+        if edge == "ignore":
+            totals = correlate(values, kernel, "zero")
+            counts = correlate(np.ones_like(values), kernel, "zero")
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result = np.where(counts > 0, totals / counts, values)
+        else:
+            result = correlate(values, kernel / kernel.sum(), edge)
+        name = name or f"{layer}_neighbor_mean"
+        self._set_layer(name, GridLayer(result))
+        return self.layer_array(name)
+
+    def gradient(
+        self,
+        layer: str = "brightness",
+        name: str = "gradient",
+        edge: EdgeMode = "nearest",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gradient magnitude and direction of a layer (Sobel operator).
+
+        Stores two layers: ``"<name>_magnitude"`` (change per cell) and
+        ``"<name>_direction"`` (degrees, 0 = rightward, 90 = downward,
+        pointing towards increasing values). Edges run perpendicular to
+        the direction, so ``direction + 90`` follows them.
+
+        Args:
+            layer: Name of a numeric layer.
+            name: Prefix for the two result layers.
+            edge: Border handling, as in ``convolve``.
+
+        Returns:
+            ``(magnitude, direction)`` as read-only ``(rows, cols)`` arrays.
+
+        Raises:
+            KeyError: If the layer has not been loaded.
+            ValueError: If the layer is a color layer or the edge mode is unknown.
+
+        Example:
+            ```python
+            grid.gradient("brightness")
+            strong = grid.mask_where("gradient_magnitude", gt=0.1)
+            for cell in strong:
+                angle = cell.data["gradient_direction"] + 90
+                cell.add_line(start="left", end="right").rotate(angle)
+            ```
+        """
+        values = self._numeric_layer(layer, "gradient")
+        gx = correlate(values, SOBEL_X, edge)
+        gy = correlate(values, SOBEL_Y, edge)
+        magnitude_name, direction_name = f"{name}_magnitude", f"{name}_direction"
+        self._set_layer(magnitude_name, GridLayer(np.hypot(gx, gy)))
+        self._set_layer(direction_name, GridLayer(np.degrees(np.arctan2(gy, gx))))
+        return self.layer_array(magnitude_name), self.layer_array(direction_name)
+
+    # =========================================================================
+    # DITHERING
+    # =========================================================================
+
+    def dither(
+        self,
+        layer: str = "brightness",
+        method: str = "floyd-steinberg",
+        levels: int = 2,
+        name: str | None = None,
+        *,
+        serpentine: bool = True,
+        size: int | None = None,
+        seed: int = 0,
+    ) -> np.ndarray:
+        """
+        Quantize a 0-1 layer to a few levels with dithering, stored as a layer.
+
+        Error diffusion carries each cell's rounding error on to its
+        unvisited neighbors; threshold screens compare every cell with a
+        tiled matrix instead. Both are vectorized (error diffusion works
+        one anti-diagonal of cells at a time), so million-cell grids take
+        a fraction of a second.
+
+        Args:
+            layer: Name of a numeric layer on the 0-1 scale.
+            method: Error diffusion ("floyd-steinberg", "atkinson",
+                "jarvis", "stucki") or a threshold screen ("bayer" ordered
+                dither, "blue-noise", or "halftone" clustered dots).
+            levels: Number of output values, evenly spaced from 0 to 1.
+            name: Layer name for the result. Default ``"<layer>_dithered"``.
+            serpentine: Alternate the error-diffusion direction row by row,
+                which breaks up directional artifacts.
+            size: Screen size in cells: Bayer matrix size (power of two,
+                default 8), blue-noise tile (default 64) or halftone dot
+                pitch (default 6).
+            seed: Random seed of the blue-noise tile.
+
+        Returns:
+            The result as a read-only ``(rows, cols)`` array.
+
+        Raises:
+            KeyError: If the layer has not been loaded.
+            ValueError: If the layer is a color layer, the method is
+                unknown, or levels/size are invalid.
+
+        Example:
+            ```python
+            grid.dither("brightness", "atkinson")
+            for cell in grid.mask_where("brightness_dithered", lt=0.5):
+                cell.add_dot(radius=0.5, color="black")
+            ```
+        """
+        values = self._numeric_layer(layer, "dither")
+        result = dither(values, method, levels, serpentine=serpentine, size=size, seed=seed)
+        name = name or f"{layer}_dithered"
+        self._set_layer(name, GridLayer(result))
+        return self.layer_array(name)
 
     def __repr__(self) -> str:
         return (
@@ -0,0 +1,209 @@
+"""Grid-level data layers and the per-cell ``data`` view over them."""
+
+from __future__ import annotations
+
+import numbers
+from collections.abc import Iterator, MutableMapping
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+from ..color import Color
+from ..image.integral import SummedAreaTable
+
+if TYPE_CHECKING:
+    from .grid import Grid
+
+LayerKind = Literal["scalar", "hex", "rgb"]
+
+
+class GridLayer:
+    """
+    One named data layer of a grid, stored as a single array.
+
+    Instead of every cell holding its own copy of image data, the grid
+    keeps one ``(rows, cols)`` array per layer and cells read from it.
+    This makes loading a layer a single NumPy operation and lets region
+    statistics come from a cached summed-area table.
+
+    Kinds:
+        - ``"scalar"``: float values, read back as ``float``
+        - ``"hex"``: RGB values, read back as ``"#rrggbb"`` strings
+        - ``"rgb"``: RGB values, read back as ``(r, g, b)`` tuples
+
+    Color kinds are stored as a ``(rows, cols, 3)`` uint8 array.
+    """
+
+    def __init__(self, values: np.ndarray, kind: LayerKind = "scalar") -> None:
+        """
+        Create a layer (typically called by Grid, not directly).
+
+        Args:
+            values: ``(rows, cols)`` array for scalar layers, or
+                ``(rows, cols, 3)`` array for color layers.
+            kind: How values are read back through ``cell.data``.
+        """
+        if kind == "scalar":
+            if values.ndim != 2:
+                raise ValueError(f"Scalar layer values must be 2D, got {values.ndim}D")
+            values = np.asarray(values, dtype=np.float64)
+        elif kind in ("hex", "rgb"):
+            if values.ndim != 3 or values.shape[2] != 3:
+                raise ValueError(f"Color layer values must be (rows, cols, 3), got {values.shape}")
+            values = np.asarray(values, dtype=np.uint8)
+        else:
+            raise ValueError(f"Unknown layer kind '{kind}'")
+        self._values = values
+        self._kind: LayerKind = kind
+        self._tables: dict[int | None, SummedAreaTable] = {}
+        self._version = 0
+
+    @property
+    def values(self) -> np.ndarray:
+        """The underlying array (row-major, one entry per cell)."""
+        return self._values
+
+    @property
+    def kind(self) -> LayerKind:
+        """How values are presented to cells: "scalar", "hex" or "rgb"."""
+        return self._kind
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every write, for caches derived from this layer."""
+        return self._version
+
+    @property
+    def channels(self) -> int:
+        """1 for scalar layers, 3 for color layers."""
+        return 1 if self._kind == "scalar" else 3
+
+    def get(self, row: int, col: int) -> Any:
+        """Value for one cell, in the layer's presentation type."""
+        if self._kind == "scalar":
+            return float(self._values[row, col])
+        r, g, b = self._values[row, col].tolist()
+        if self._kind == "hex":
+            return f"#{r:02x}{g:02x}{b:02x}"
+        return (r, g, b)
+
+    def rgb_at(self, row: int, col: int) -> tuple[int, int, int]:
+        """RGB tuple for one cell of a color layer (no hex round-trip)."""
+        r, g, b = self._values[row, col].tolist()
+        return (r, g, b)
+
+    def set(self, row: int, col: int, value: Any) -> None:
+        """Write one cell's value and discard cached tables."""
+        if self._kind == "scalar":
+            self._values[row, col] = float(value)
+        else:
+            self._values[row, col] = Color(value).to_rgb()
+        self.invalidate()
+
+    def table(self, channel: int | None = None) -> SummedAreaTable:
+        """
+        Summed-area table of this layer, built on first use and cached.
+
+        Args:
+            channel: For color layers, 0/1/2 selects red/green/blue.
+                Must be None for scalar layers.
+        """
+        table = self._tables.get(channel)
+        if table is None:
+            if self._kind == "scalar":
+                if channel is not None:
+                    raise ValueError("Scalar layers have no channels")
+                table = SummedAreaTable(self._values)
+            else:
+                if channel is None:
+                    raise ValueError("Color layers need a channel (0=red, 1=green, 2=blue)")
+                table = SummedAreaTable(self._values[:, :, channel])
+            self._tables[channel] = table
+        return table
+
+    def invalidate(self) -> None:
+        """Discard cached tables after modifying ``values`` in place."""
+        self._tables.clear()
+        self._version += 1
+
+    def __repr__(self) -> str:
+        rows, cols = self._values.shape[:2]
+        return f"GridLayer({cols}x{rows}, kind={self._kind!r})"
+
+
+class CellData(MutableMapping):
+    """
+    The ``cell.data`` mapping: a view over grid layers plus free-form keys.
+
+    Keys that name a grid layer (``"brightness"``, ``"color"``, ...) read
+    and write the grid's array directly. Any other key is custom per-cell
+    data, stored sparsely on the grid so cells without custom data cost
+    nothing.
+
+    A value a layer can't hold as written (text in a scalar layer, a
+    color name in a color layer) is kept for the cell like custom data,
+    so it reads back unchanged; colors still update the layer's array.
+    Reloading the layer discards such values.
+    """
+
+    __slots__ = ("_col", "_grid", "_row")
+
+    def __init__(self, grid: Grid, row: int, col: int) -> None:
+        self._grid = grid
+        self._row = row
+        self._col = col
+
+    def __getitem__(self, key: str) -> Any:
+        grid = self._grid
+        if key in grid._extra_keys:
+            extras = grid._cell_extras.get((self._row, self._col))
+            if extras is not None and key in extras:
+                return extras[key]
+        layer = grid._layers.get(key)
+        if layer is None:
+            raise KeyError(key)
+        return layer.get(self._row, self._col)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        grid = self._grid
+        layer = grid._layers.get(key)
+        if layer is not None:
+            if layer.kind == "scalar":
+                exact = isinstance(value, numbers.Real)
+                if exact:
+                    layer.set(self._row, self._col, value)
+            else:
+                try:
+                    layer.set(self._row, self._col, value)
+                except (TypeError, ValueError):
+                    exact = False
+                else:
+                    exact = layer.get(self._row, self._col) == value
+            if exact:
+                extras = grid._cell_extras.get((self._row, self._col))
+                if extras is not None:
+                    extras.pop(key, None)
+                return
+        grid._cell_extras.setdefault((self._row, self._col), {})[key] = value
+        grid._extra_keys.add(key)
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._grid._layers:
+            raise TypeError(f"'{key}' is a grid layer and cannot be removed from a single cell")
+        extras = self._grid._cell_extras.get((self._row, self._col))
+        if extras is None:
+            raise KeyError(key)
+        del extras[key]
+
+    def __iter__(self) -> Iterator[str]:
+        layers = self._grid._layers
+        yield from layers
+        extras = self._grid._cell_extras.get((self._row, self._col))
+        if extras:
+            yield from (key for key in extras if key not in layers)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
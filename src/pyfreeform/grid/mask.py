@@ -0,0 +1,140 @@
+"""CellMask - A boolean selection of grid cells backed by a NumPy array."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .cell import Cell
+    from .grid import Grid
+
+
+class CellMask:
+    """
+    A selection of cells in one grid, stored as a ``(rows, cols)`` bool array.
+
+    Masks come from ``grid.select()`` and ``grid.mask_where()``. Building
+    one is a single NumPy comparison, and cells are only created when the
+    mask is iterated, so selecting from a million-cell grid never calls
+    Python code per cell.
+
+    Masks compose with ``&``, ``|``, ``^`` and ``~``; the other operand
+    may be another mask of the same grid or a plain bool array.
+
+    Example:
+        ```python
+        dark = grid.mask_where("brightness", lt=0.3)
+        edge = grid.select(grid.brightness_array > 0.6) & ~dark
+        for cell in edge:
+            cell.add_dot(radius=0.2)
+        ```
+    """
+
+    __slots__ = ("_grid", "_mask")
+
+    # Make ``bool_array & mask`` defer to CellMask.__rand__ instead of
+    # NumPy broadcasting over the mask object.
+    __array_ufunc__ = None
+
+    def __init__(self, grid: Grid, mask: np.ndarray) -> None:
+        """
+        Wrap a bool array (typically called by Grid, not directly).
+
+        Args:
+            grid: The grid the mask selects from.
+            mask: Bool array of shape ``(rows, cols)``.
+
+        Raises:
+            ValueError: If the shape does not match the grid.
+            TypeError: If the array is not boolean.
+        """
+        mask = np.asarray(mask)
+        shape = (grid.num_rows, grid.num_columns)
+        if mask.shape != shape:
+            raise ValueError(f"Mask shape {mask.shape} does not match grid shape {shape}")
+        if mask.dtype != np.bool_:
+            raise TypeError(f"Mask must be a bool array, got dtype {mask.dtype}")
+        self._grid = grid
+        self._mask = mask
+
+    @property
+    def grid(self) -> Grid:
+        """The grid this mask selects from."""
+        return self._grid
+
+    @property
+    def array(self) -> np.ndarray:
+        """The underlying ``(rows, cols)`` bool array."""
+        return self._mask
+
+    @property
+    def count(self) -> int:
+        """Number of selected cells."""
+        return int(np.count_nonzero(self._mask))
+
+    def indices(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Row and column indices of the selected cells, row by row.
+
+        Returns:
+            ``(rows, cols)`` tuple of int arrays, suitable for indexing
+            layer arrays directly.
+        """
+        return np.nonzero(self._mask)
+
+    def any(self) -> bool:
+        """True if at least one cell is selected."""
+        return bool(self._mask.any())
+
+    def cells(self) -> list[Cell]:
+        """The selected cells as a list (row by row, left to right)."""
+        return list(self)
+
+    def __iter__(self) -> Iterator[Cell]:
+        """Iterate over selected cells, creating each one on demand."""
+        cell_at = self._grid._cell
+        rows, cols = self.indices()
+        for row, col in zip(rows.tolist(), cols.tolist(), strict=True):
+            yield cell_at(row, col)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, cell: object) -> bool:
+        row, col = getattr(cell, "row", None), getattr(cell, "col", None)
+        if getattr(cell, "grid", None) is not self._grid or row is None:
+            return False
+        return bool(self._mask[row, col])
+
+    # --- Composition ---
+
+    def _operand(self, other: Any) -> np.ndarray:
+        """Bool array of the other operand of a binary operator."""
+        if isinstance(other, CellMask):
+            if other._grid is not self._grid:
+                raise ValueError("Cannot combine masks from different grids")
+            return other._mask
+        return CellMask(self._grid, other)._mask
+
+    def __and__(self, other: Any) -> CellMask:
+        return CellMask(self._grid, self._mask & self._operand(other))
+
+    def __or__(self, other: Any) -> CellMask:
+        return CellMask(self._grid, self._mask | self._operand(other))
+
+    def __xor__(self, other: Any) -> CellMask:
+        return CellMask(self._grid, self._mask ^ self._operand(other))
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __invert__(self) -> CellMask:
+        return CellMask(self._grid, ~self._mask)
+
+    def __repr__(self) -> str:
+        return f"CellMask({self.count} of {self._mask.size} cells)"
@@ -1,6 +1,18 @@
 """Image processing for PyFreeform."""
 
+from .cache import ImageCache
+from .filters import FilterPipeline
 from .image import Image
+from .integral import RegionStats, SummedAreaTable
 from .layer import Layer
+from .tiled import TiledImage
 
-__all__ = ["Image", "Layer"]
+__all__ = [
+    "FilterPipeline",
+    "Image",
+    "ImageCache",
+    "Layer",
+    "RegionStats",
+    "SummedAreaTable",
+    "TiledImage",
+]
@@ -0,0 +1,200 @@
+"""ImageCache - On-disk cache of decoded and resampled images."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import weakref
+from pathlib import Path
+
+import numpy as np
+
+from .image import Image
+
+
+class ImageCache:
+    """
+    An opt-in directory of ``.npy`` files that skips repeated image work.
+
+    Loading the same photo over and over repeats the decode, the RGBA
+    and float conversion, and the LANCZOS resample to the grid size.
+    An ImageCache stores the decoded pixels and each resampled size as
+    NumPy files, keyed by the source file and the resize parameters, and
+    reads them back memory-mapped on later runs. Warm images wrap the
+    read-only memory maps directly (see ``Image.from_array``).
+
+    Source files are identified by path, size and modification time, or
+    by a hash of their contents with ``hash_contents=True`` (slower, but
+    stable across checkouts and copies). When the directory grows past
+    ``max_bytes`` the least recently used entries are deleted.
+
+    Example:
+        ```python
+        cache = ImageCache(".pyfreeform-cache", max_bytes=2_000_000_000)
+        for style in styles:
+            scene = Scene.from_image("photo.jpg", grid_size=60, cache=cache)
+            ...
+        ```
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = 1 << 30,
+        hash_contents: bool = False,
+    ) -> None:
+        """
+        Create (or reuse) a cache directory.
+
+        Args:
+            directory: Where cache files live. Created if missing.
+            max_bytes: Size limit for the directory, enforced after each write.
+            hash_contents: Key source files by a hash of their bytes instead
+                of path, size and modification time.
+
+        Raises:
+            ValueError: If max_bytes is negative.
+        """
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must not be negative, got {max_bytes}")
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._hash_contents = hash_contents
+        # Images returned by load(), so resize() can find their cache key
+        self._keys: weakref.WeakKeyDictionary[Image, str] = weakref.WeakKeyDictionary()
+
+    @property
+    def directory(self) -> Path:
+        """The cache directory."""
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int:
+        """Size limit of the cache directory."""
+        return self._max_bytes
+
+    @property
+    def size_bytes(self) -> int:
+        """Current total size of the cached files."""
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def _entries(self) -> list[Path]:
+        return list(self._directory.glob("*.npy"))
+
+    def _source_key(self, path: Path, frame: int) -> str:
+        """Cache key of a source file (and animation frame)."""
+        digest = hashlib.sha256()
+        if self._hash_contents:
+            with path.open("rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        else:
+            stat = path.stat()
+            digest.update(f"{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}".encode())
+        digest.update(f"|frame={frame}".encode())
+        return digest.hexdigest()[:32]
+
+    def _read(self, name: str) -> np.ndarray | None:
+        """Memory-map a cached array and mark it as recently used."""
+        entry = self._directory / f"{name}.npy"
+        try:
+            array = np.load(entry, mmap_mode="r")
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        # Another process may evict the entry once it is mapped
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(entry)
+        return array
+
+    def _write(self, name: str, array: np.ndarray) -> None:
+        """Store an array atomically, then evict down to the size limit."""
+        entry = self._directory / f"{name}.npy"
+        partial = entry.with_suffix(f".{os.getpid()}.tmp")
+        with partial.open("wb") as f:
+            np.save(f, array)
+        os.replace(partial, entry)
+        self._evict(keep=entry)
+
+    def _evict(self, keep: Path | None = None) -> None:
+        """Delete least recently used entries until the cache fits its limit."""
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # Removed by a concurrent process
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            if entry == keep:
+                continue
+            entry.unlink(missing_ok=True)
+            total -= size
+
+    def load(self, path: str | Path, frame: int = 0) -> Image:
+        """
+        Load an image file, decoding it only on a cache miss.
+
+        Equivalent to ``Image.load(path, frame)``.
+
+        Args:
+            path: Path to the image file.
+            frame: For animated images (GIF), which frame to load.
+
+        Returns:
+            The decoded Image.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            ValueError: If the file can't be decoded as an image.
+        """
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Image file not found: {path}")
+        key = self._source_key(path, frame)
+        pixels = self._read(key)
+        if pixels is None:
+            image = Image.load(path, frame=frame)
+            # Image.load channels are whole numbers 0-255; store them as bytes
+            self._write(key, image.to_array(np.uint8))
+        else:
+            image = Image.from_array(pixels)
+        self._keys[image] = key
+        return image
+
+    def resize(self, image: Image, width: int, height: int) -> Image:
+        """
+        ``image.resize(width, height)``, cached for images from ``load()``.
+
+        Images that did not come from this cache are resized normally.
+
+        Args:
+            image: Source image.
+            width: Target width.
+            height: Target height.
+
+        Returns:
+            A new Image with the specified dimensions.
+        """
+        key = self._keys.get(image)
+        if key is None:
+            return image.resize(width, height)
+        entry = f"{key}-{width}x{height}-lanczos"
+        pixels = self._read(entry)
+        if pixels is None:
+            resized = image.resize(width, height)
+            self._write(entry, resized.to_array())
+            return resized
+        return Image.from_array(pixels)
+
+    def clear(self) -> None:
+        """Delete every cached file."""
+        for entry in self._entries():
+            entry.unlink(missing_ok=True)
+
+    def __repr__(self) -> str:
+        return f"ImageCache({str(self._directory)!r}, max_bytes={self._max_bytes})"
@@ -0,0 +1,121 @@
+"""Vectorized color-space conversions for whole RGB arrays."""
+
+from __future__ import annotations
+
+import numpy as np
+
+# Layer name -> the conversion that produces it. Conversions yield
+# several layers at once, so asking for "hue" also caches saturation
+# and lightness.
+COLOR_SPACE_LAYERS: dict[str, str] = {
+    "hue": "hsl",
+    "saturation": "hsl",
+    "lightness": "hsl",
+    "value": "hsv",
+    "luminance": "luminance",
+    "L": "lab",
+    "a": "lab",
+    "b": "lab",
+}
+
+# sRGB (D65) -> CIE XYZ, and the D65 reference white
+_RGB_TO_XYZ = np.array(
+    [
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ]
+)
+_WHITE_D65 = np.array([0.95047, 1.0, 1.08883])
+_REC709 = np.array([0.2126, 0.7152, 0.0722])
+_LAB_DELTA = 6 / 29
+
+
+def _unit(red: np.ndarray, green: np.ndarray, blue: np.ndarray) -> np.ndarray:
+    """Stack 0-255 channels into a ``(..., 3)`` array scaled to 0-1."""
+    return np.clip(np.stack([red, green, blue], axis=-1), 0, 255) / 255.0
+
+
+def _linear(rgb: np.ndarray) -> np.ndarray:
+    """Undo the sRGB transfer curve."""
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def hsl(
+    red: np.ndarray, green: np.ndarray, blue: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Hue, saturation and lightness of 0-255 channel arrays.
+
+    Matches ``Color.to_hsl()`` (without its rounding): hue in degrees
+    0-360, saturation and lightness 0.0-1.0.
+    """
+    rgb = _unit(red, green, blue)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    high = rgb.max(axis=-1)
+    low = rgb.min(axis=-1)
+    delta = high - low
+    lightness = (high + low) / 2
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        saturation = np.where(lightness <= 0.5, delta / (high + low), delta / (2.0 - high - low))
+        hue = np.where(
+            high == r,
+            (g - b) / delta,
+            np.where(high == g, 2.0 + (b - r) / delta, 4.0 + (r - g) / delta),
+        )
+    gray = delta == 0
+    saturation[gray] = 0.0
+    hue[gray] = 0.0
+    return (hue * 60.0) % 360.0, saturation, lightness
+
+
+def luminance(red: np.ndarray, green: np.ndarray, blue: np.ndarray) -> np.ndarray:
+    """Relative luminance (linear-light Rec. 709 weights), 0.0-1.0."""
+    return _linear(_unit(red, green, blue)) @ _REC709
+
+
+def lab(
+    red: np.ndarray, green: np.ndarray, blue: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    CIE L*a*b* (D65) of 0-255 channel arrays.
+
+    L runs 0-100; a and b are roughly -128 to 127.
+    """
+    xyz = (_linear(_unit(red, green, blue)) @ _RGB_TO_XYZ.T) / _WHITE_D65
+    f = np.where(
+        xyz > _LAB_DELTA**3,
+        np.cbrt(xyz),
+        xyz / (3 * _LAB_DELTA**2) + 4 / 29,
+    )
+    fx, fy, fz = f[..., 0], f[..., 1], f[..., 2]
+    return 116.0 * fy - 16.0, 500.0 * (fx - fy), 200.0 * (fy - fz)
+
+
+def color_space_layers(
+    name: str, red: np.ndarray, green: np.ndarray, blue: np.ndarray
+) -> dict[str, np.ndarray]:
+    """
+    Compute the layer *name* together with its siblings from one conversion.
+
+    Args:
+        name: A key of ``COLOR_SPACE_LAYERS``.
+        red: Red channel (0-255).
+        green: Green channel (0-255).
+        blue: Blue channel (0-255).
+
+    Returns:
+        Dict of layer name to array (e.g. hue, saturation and lightness).
+
+    Raises:
+        KeyError: If *name* is not a color-space layer.
+    """
+    space = COLOR_SPACE_LAYERS[name]
+    if space == "hsl":
+        return dict(zip(("hue", "saturation", "lightness"), hsl(red, green, blue), strict=True))
+    if space == "hsv":
+        return {"value": np.clip(np.maximum(np.maximum(red, green), blue), 0, 255) / 255.0}
+    if space == "luminance":
+        return {"luminance": luminance(red, green, blue)}
+    return dict(zip(("L", "a", "b"), lab(red, green, blue), strict=True))
@@ -0,0 +1,225 @@
+"""Vectorized dithering and halftone screens for 2D value arrays."""
+
+from __future__ import annotations
+
+import functools
+
+import numpy as np
+
+# Error-diffusion kernels: (row offset, column offset, weight) for a
+# left-to-right scan. Weights are fractions of the quantization error.
+DIFFUSION_KERNELS: dict[str, tuple[tuple[int, int, float], ...]] = {
+    "floyd-steinberg": ((0, 1, 7 / 16), (1, -1, 3 / 16), (1, 0, 5 / 16), (1, 1, 1 / 16)),
+    # Atkinson spreads only 6/8 of the error: crisper, with blown highlights
+    "atkinson": (
+        (0, 1, 1 / 8),
+        (0, 2, 1 / 8),
+        (1, -1, 1 / 8),
+        (1, 0, 1 / 8),
+        (1, 1, 1 / 8),
+        (2, 0, 1 / 8),
+    ),
+    "jarvis": tuple(
+        (dy, dx, w / 48)
+        for dy, row in enumerate(([0, 0, 0, 7, 5], [3, 5, 7, 5, 3], [1, 3, 5, 3, 1]))
+        for dx, w in zip(range(-2, 3), row, strict=True)
+        if w
+    ),
+    "stucki": tuple(
+        (dy, dx, w / 42)
+        for dy, row in enumerate(([0, 0, 0, 8, 4], [2, 4, 8, 4, 2], [1, 2, 4, 2, 1]))
+        for dx, w in zip(range(-2, 3), row, strict=True)
+        if w
+    ),
+}
+
+# Threshold screens, tiled over the array
+ORDERED_METHODS = ("bayer", "blue-noise", "halftone")
+
+DITHER_METHODS = (*DIFFUSION_KERNELS, *ORDERED_METHODS)
+
+
+def dither(
+    values: np.ndarray,
+    method: str = "floyd-steinberg",
+    levels: int = 2,
+    serpentine: bool = True,
+    size: int | None = None,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Quantize a 0-1 array to *levels* evenly spaced values, dithered.
+
+    Args:
+        values: 2D array on the 0-1 scale.
+        method: An error-diffusion kernel ("floyd-steinberg", "atkinson",
+            "jarvis", "stucki") or a threshold screen ("bayer",
+            "blue-noise", "halftone").
+        levels: Number of output values (2 = black and white).
+        serpentine: Alternate the kernel direction on every other row
+            (error diffusion only).
+        size: Screen size in cells: the Bayer matrix size (a power of
+            two, default 8), the blue-noise tile (default 64) or the
+            halftone dot pitch (default 6).
+        seed: Random seed of the blue-noise tile.
+
+    Returns:
+        Float array of the same shape with values ``k / (levels - 1)``.
+
+    Raises:
+        ValueError: If the method is unknown, levels is less than 2, or
+            size is invalid for the method.
+    """
+    if levels < 2:
+        raise ValueError(f"levels must be at least 2, got {levels}")
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim != 2:
+        raise ValueError(f"Expected a 2D array, got {values.ndim}D")
+    if method in DIFFUSION_KERNELS:
+        return _error_diffuse(values, DIFFUSION_KERNELS[method], levels, serpentine)
+    if method == "bayer":
+        screen = bayer_matrix(8 if size is None else size)
+    elif method == "blue-noise":
+        screen = blue_noise(64 if size is None else size, seed)
+    elif method == "halftone":
+        screen = halftone_screen(6 if size is None else size)
+    else:
+        raise ValueError(
+            f"Unknown dither method '{method}'. Use one of: {', '.join(DITHER_METHODS)}"
+        )
+    return _ordered(values, screen, levels)
+
+
+# =========================================================================
+# THRESHOLD SCREENS
+# =========================================================================
+
+
+@functools.lru_cache(maxsize=16)
+def bayer_matrix(size: int) -> np.ndarray:
+    """
+    Bayer ordered-dither thresholds, ``size x size``, in (0, 1).
+
+    Raises:
+        ValueError: If size is not a power of two.
+    """
+    if size < 1 or size & (size - 1):
+        raise ValueError(f"Bayer matrix size must be a power of two, got {size}")
+    matrix = np.zeros((1, 1))
+    while len(matrix) < size:
+        # M(2n) = [[4M, 4M + 2], [4M + 3, 4M + 1]]
+        matrix = np.block([[4 * matrix, 4 * matrix + 2], [4 * matrix + 3, 4 * matrix + 1]])
+    return _read_only((matrix + 0.5) / matrix.size)
+
+
+@functools.lru_cache(maxsize=16)
+def blue_noise(size: int, seed: int = 0) -> np.ndarray:
+    """
+    A tileable ``size x size`` blue-noise threshold tile in (0, 1).
+
+    White noise is high-pass filtered in the frequency domain (so the
+    tile wraps seamlessly), then rank-transformed to uniform thresholds.
+    """
+    if size < 2:
+        raise ValueError(f"Blue-noise size must be at least 2, got {size}")
+    noise = np.random.default_rng(seed).standard_normal((size, size))
+    fy = np.fft.fftfreq(size)[:, None]
+    fx = np.fft.fftfreq(size)[None, :]
+    # Suppress the low frequencies that make white noise look clumpy
+    highpass = 1.0 - np.exp(-(fx**2 + fy**2) / (2 * 0.1**2))
+    filtered = np.fft.ifft2(np.fft.fft2(noise) * highpass).real
+    ranks = np.argsort(np.argsort(filtered, axis=None)).reshape(size, size)
+    return _read_only((ranks + 0.5) / ranks.size)
+
+
+@functools.lru_cache(maxsize=16)
+def halftone_screen(pitch: int) -> np.ndarray:
+    """
+    Clustered-dot thresholds with a dot every *pitch* cells, in (0, 1).
+
+    Dots grow from the screen cell centers, like a printed AM halftone.
+    """
+    if pitch < 2:
+        raise ValueError(f"Halftone pitch must be at least 2, got {pitch}")
+    phase = 2 * np.pi * (np.arange(pitch) + 0.5) / pitch
+    # Euclidean-style spot function, highest at the screen cell centers
+    spot = -(np.cos(phase)[:, None] + np.cos(phase)[None, :])
+    ranks = np.argsort(np.argsort(-spot, axis=None, kind="stable")).reshape(pitch, pitch)
+    return _read_only((ranks + 0.5) / ranks.size)
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def _ordered(values: np.ndarray, screen: np.ndarray, levels: int) -> np.ndarray:
+    """Threshold each value against the tiled screen."""
+    height, width = values.shape
+    reps = (-(-height // screen.shape[0]), -(-width // screen.shape[1]))
+    thresholds = np.tile(screen, reps)[:height, :width]
+    steps = levels - 1
+    quantized = np.floor(np.clip(values, 0.0, 1.0) * steps + thresholds)
+    return np.clip(quantized, 0, steps) / steps
+
+
+# =========================================================================
+# ERROR DIFFUSION
+# =========================================================================
+
+
+def _error_diffuse(
+    values: np.ndarray,
+    kernel: tuple[tuple[int, int, float], ...],
+    levels: int,
+    serpentine: bool,
+) -> np.ndarray:
+    """
+    Error diffusion, one anti-diagonal wavefront at a time.
+
+    Cell ``(y, x)`` only receives error from cells earlier in the scan:
+    to its left in the same row, and from rows above within the
+    kernel's reach. With ``slope`` larger than every ``dx / dy`` of the
+    kernel, all cells with the same ``slope * y + x`` are independent of
+    each other, so each wavefront is quantized and spreads its error in
+    a few whole-array operations. A 1000 x 1000 grid takes about 3000
+    such steps instead of a million per-cell ones.
+
+    With *serpentine*, odd rows spread their error to the next rows
+    mirrored left-to-right. Like a serpentine scan this cancels the
+    directional "worm" patterns of a fixed kernel, while keeping every
+    wavefront independent.
+    """
+    height, width = values.shape
+    steps = levels - 1
+    reach = max(max(abs(dx), dy) for dy, dx, _ in kernel)
+    slope = 1 + max((abs(dx) // dy for dy, dx, _ in kernel if dy > 0), default=0)
+
+    # Work on a flat, padded buffer so every tap is a constant index offset
+    stride = width + 2 * reach
+    buffer = np.zeros((height + reach, stride))
+    buffer[:height, reach : reach + width] = values
+    flat = buffer.ravel()
+    out = np.empty((height, width))
+    out_flat = out.ravel()
+    mirror = np.array([1, -1 if serpentine else 1])
+
+    ys_all = np.arange(height)
+    for front in range(slope * (height - 1) + width):
+        # Rows whose column front - slope * y lies inside the grid
+        first = max(0, -(-(front - width + 1) // slope))
+        last = min(height - 1, front // slope)
+        ys = ys_all[first : last + 1]
+        xs = front - slope * ys
+        index = ys * stride + xs + reach
+        current = flat[index]
+        quantized = np.clip(np.rint(current * steps), 0, steps) / steps
+        error = current - quantized
+        out_flat[ys * width + xs] = quantized
+        signs = mirror[ys & 1]
+        for dy, dx, weight in kernel:
+            if dy == 0:
+                flat[index + dx] += weight * error
+            else:
+                flat[index + dy * stride + signs * dx] += weight * error
+    return out
@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
+import itertools
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
 from PIL import Image as PILImage
 
+from .colorspace import COLOR_SPACE_LAYERS, color_space_layers
+from .integral import RegionStats
 from .layer import Layer
 from .resize import (
     downscale_array,
     fit_dimensions,
+    halve_array,
     resize_array,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
+
+    from numpy.typing import DTypeLike
+
+    from .filters import FilterPipeline
 
 
 class Image:
@@ -27,6 +35,14 @@ class Image:
     or a computed property (brightness, grayscale). Layers are created
     lazily when accessed.
 
+    Color-space layers are computed for the whole image on first access
+    and cached:
+
+    - ``"hue"`` (degrees 0-360), ``"saturation"``, ``"lightness"`` (HSL, 0-1)
+    - ``"value"`` (HSV value, 0-1)
+    - ``"luminance"`` (relative luminance, 0-1)
+    - ``"L"`` (0-100), ``"a"``, ``"b"`` (CIE L*a*b*)
+
     Attributes:
         width: Image width in pixels
         height: Image height in pixels
@@ -44,6 +60,7 @@ class Image:
     # Standard layer names
     CHANNEL_LAYERS = ("red", "green", "blue", "alpha")
     COMPUTED_LAYERS = ("brightness", "grayscale")
+    COLOR_SPACE_LAYERS = tuple(COLOR_SPACE_LAYERS)
 
     def __init__(
         self,
@@ -81,6 +98,10 @@ class Image:
 
         self._width = shape[1]
         self._height = shape[0]
+        # Stacked buffer wrapped by from_array(), returned by to_array()
+        self._array: np.ndarray | None = None
+        # Pyramid levels 1, 2, ... (level 0 is the image itself), built on demand
+        self._levels: list[Image] = []
 
     @classmethod
     def load(cls, path: str | Path, frame: int = 0) -> Image:
@@ -101,15 +122,7 @@ class Image:
             FileNotFoundError: If the file doesn't exist.
             ValueError: If the file can't be decoded as an image.
         """
-        path = Path(path)
-
-        if not path.exists():
-            raise FileNotFoundError(f"Image file not found: {path}")
-
-        try:
-            pil_img = PILImage.open(path)
-        except Exception as e:
-            raise ValueError(f"Could not open image: {e}") from e
+        pil_img = _open(Path(path))
 
         # Handle animated images (GIF, WebP)
         n_frames = getattr(pil_img, "n_frames", 1)
@@ -151,6 +164,92 @@ class Image:
             alpha=arr[:, :, 3].astype(np.float64),
         )
 
+    @classmethod
+    def from_array(cls, array: np.ndarray | PILImage.Image, copy: bool = False) -> Image:
+        """
+        Wrap an existing pixel array without converting it.
+
+        The channel layers are views into *array*, in its own dtype
+        (``uint8``, ``float32``, ...), so no pixel data is copied or
+        converted. Values are read on the usual 0-255 scale. Writes through
+        the layers reach the original buffer, and read-only buffers (such
+        as memory maps opened with ``mmap_mode="r"``) stay read-only.
+
+        Args:
+            array: ``(height, width, 3)`` RGB or ``(height, width, 4)`` RGBA
+                array, or a ``(height, width)`` grayscale array (all three
+                color layers then share it). A Pillow image in mode
+                ``"L"``, ``"RGB"`` or ``"RGBA"`` is exported once as-is;
+                other modes are converted to RGBA first.
+            copy: Copy the array first, so the image owns its pixels.
+
+        Returns:
+            A new Image backed by *array*.
+
+        Raises:
+            ValueError: If the array shape is not an image shape.
+            TypeError: If the array is not numeric.
+
+        Example:
+            ```python
+            field = (noise(512, 512, 3) * 255).astype(np.float32)
+            img = Image.from_array(field)
+            img.to_array() is field   # True
+            ```
+        """
+        if isinstance(array, PILImage.Image) and array.mode not in ("L", "RGB", "RGBA"):
+            array = array.convert("RGBA")
+        array = np.asarray(array)
+        if array.dtype.kind not in "iuf":
+            raise TypeError(f"Image arrays must be numeric, got dtype {array.dtype}")
+        if array.ndim == 3 and array.shape[2] == 1:
+            array = array[..., 0]
+        if not (array.ndim == 2 or (array.ndim == 3 and array.shape[2] in (3, 4))):
+            raise ValueError(
+                f"Image arrays must be (height, width), (height, width, 3) or "
+                f"(height, width, 4), got shape {array.shape}"
+            )
+        if copy:
+            array = array.copy()
+
+        if array.ndim == 2:
+            channels = {"red": array, "green": array, "blue": array}
+        else:
+            channels = dict(zip(cls.CHANNEL_LAYERS, np.moveaxis(array, -1, 0), strict=False))
+
+        image = cls.__new__(cls)
+        image._layers = {name: Layer(data, copy=False) for name, data in channels.items()}
+        image._width = array.shape[1]
+        image._height = array.shape[0]
+        image._array = array if array.ndim == 3 else None
+        image._levels = []
+        return image
+
+    def to_array(self, dtype: DTypeLike | None = None) -> np.ndarray:
+        """
+        The channels as one ``(height, width, 3)`` or ``(height, width, 4)`` array.
+
+        For an image made by ``from_array()`` this is the wrapped buffer
+        itself (no copy) as long as its channel layers still point into
+        it. Otherwise the channels are stacked into a new array.
+
+        Args:
+            dtype: Result dtype. Defaults to the channels' own dtype; a
+                different dtype always copies.
+
+        Returns:
+            Array of red, green, blue (and alpha when present), 0-255.
+        """
+        names = [name for name in self.CHANNEL_LAYERS if name in self._layers]
+        array = self._array
+        if array is None or not all(
+            np.may_share_memory(self._layers[name].data, array) for name in names
+        ):
+            array = np.stack([self._layers[name].data for name in names], axis=-1)
+        if dtype is not None and array.dtype != dtype:
+            return array.astype(dtype)
+        return array
+
     @staticmethod
     def frame_count(path: str | Path) -> int:
         """
@@ -169,6 +268,51 @@ class Image:
         with PILImage.open(path) as pil_img:
             return getattr(pil_img, "n_frames", 1)
 
+    @classmethod
+    def iter_frames(
+        cls,
+        source: str | Path | Iterable[str | Path],
+        start: int = 0,
+        stop: int | None = None,
+    ) -> Iterator[Image]:
+        """
+        Decode the frames of an animation (or an image sequence) in order.
+
+        An animated GIF or WebP is opened once and decoded frame after
+        frame, instead of being reopened and re-seeked for every frame as
+        ``Image.load(path, frame=i)`` does. Each frame wraps its decoded
+        RGBA ``uint8`` pixels directly (see ``from_array``).
+
+        Args:
+            source: Path to an (animated) image file, or an iterable of
+                image paths to treat as consecutive frames.
+            start: Index of the first frame to yield.
+            stop: Index to stop before (default: the last frame).
+
+        Yields:
+            One Image per frame.
+
+        Raises:
+            FileNotFoundError: If a file doesn't exist.
+            ValueError: If a file can't be decoded as an image.
+
+        Example:
+            ```python
+            for i, frame in enumerate(Image.iter_frames("clip.gif")):
+                ...
+            ```
+        """
+        if isinstance(source, str | Path):
+            with _open(Path(source)) as pil_img:
+                n_frames = getattr(pil_img, "n_frames", 1)
+                for index in range(start, n_frames if stop is None else min(stop, n_frames)):
+                    pil_img.seek(index)
+                    yield cls.from_array(np.asarray(pil_img.convert("RGBA")))
+            return
+        for path in itertools.islice(source, start, stop):
+            with _open(Path(path)) as pil_img:
+                yield cls.from_array(np.asarray(pil_img.convert("RGBA")))
+
     @property
     def width(self) -> int:
         """Image width in pixels."""
@@ -208,9 +352,10 @@ class Image:
             self._layers["brightness"] = Layer(brightness)
 
         if "grayscale" not in self._layers:
-            # Simple average
+            # Simple average (accumulated in float, wrapped uint8 channels would overflow)
             grayscale = (
-                self._layers["red"].data + self._layers["green"].data + self._layers["blue"].data
+                np.add(self._layers["red"].data, self._layers["green"].data, dtype=np.float64)
+                + self._layers["blue"].data
             ) / 3
             self._layers["grayscale"] = Layer(grayscale)
 
@@ -220,7 +365,9 @@ class Image:
 
         Args:
             layer_name: One of 'red', 'green', 'blue', 'alpha',
-                        'brightness', or 'grayscale'.
+                        'brightness', 'grayscale', or a color-space
+                        layer ('hue', 'saturation', 'lightness', 'value',
+                        'luminance', 'L', 'a', 'b').
 
         Returns:
             The requested Layer.
@@ -230,6 +377,15 @@ class Image:
         """
         if layer_name in self.COMPUTED_LAYERS:
             self._ensure_computed_layers()
+        elif layer_name in self.COLOR_SPACE_LAYERS and layer_name not in self._layers:
+            computed = color_space_layers(
+                layer_name,
+                self._layers["red"].data,
+                self._layers["green"].data,
+                self._layers["blue"].data,
+            )
+            for name, values in computed.items():
+                self._layers[name] = Layer(values)
 
         if layer_name not in self._layers:
             raise KeyError(f"Layer '{layer_name}' not found")
@@ -297,6 +453,113 @@ class Image:
             return self._layers["alpha"][x, y] / 255.0
         return 1.0
 
+    def region_stats(
+        self, x0: int, y0: int, x1: int, y1: int, layer: str = "brightness"
+    ) -> RegionStats:
+        """
+        Statistics of one layer over a pixel rectangle ``[x0, x1) x [y0, y1)``.
+
+        Constant time per call, via the layer's cached summed-area table.
+
+        Raises:
+            KeyError: If the layer doesn't exist.
+            ValueError: If the rectangle is empty.
+        """
+        return self[layer].integral.stats(x0, y0, x1, y1)
+
+    def strips(self, rows: int = 256) -> Iterator[tuple[int, np.ndarray]]:
+        """
+        The image as horizontal RGBA bands, top to bottom.
+
+        Args:
+            rows: Pixel rows per band.
+
+        Yields:
+            ``(y0, pixels)`` with pixels as a ``(rows, width, 4)`` float array
+            (alpha is 255 when the image has none).
+        """
+        channels = [self._layers[name].data for name in ("red", "green", "blue")]
+        alpha = self._layers["alpha"].data if self.has_alpha else None
+        for y0 in range(0, self._height, rows):
+            band = np.empty((min(rows, self._height - y0), self._width, 4))
+            for i, channel in enumerate(channels):
+                band[..., i] = channel[y0 : y0 + rows]
+            band[..., 3] = 255.0 if alpha is None else alpha[y0 : y0 + rows]
+            yield y0, band
+
+    # --- Image pyramid ---
+
+    @property
+    def pyramid_depth(self) -> int:
+        """Number of pyramid levels, down to a 1x1 image (level 0 is this image)."""
+        return (max(self._width, self._height) - 1).bit_length() + 1
+
+    def pyramid_level(self, level: int) -> Image:
+        """
+        This image reduced ``2 ** level`` times by repeated 2x2 box averaging.
+
+        Levels are built on first use, each from the one above it, and
+        cached; level 0 is the image itself. Pixel ``(x, y)`` of level *k*
+        is the average of the source pixels
+        ``[x * 2**k, (x + 1) * 2**k) x [y * 2**k, (y + 1) * 2**k)``, with
+        the source edge repeated where odd sizes round up.
+
+        The pyramid is not updated if channel data is later modified in
+        place.
+
+        Args:
+            level: Pyramid level, from 0 to ``pyramid_depth - 1``.
+
+        Returns:
+            The reduced Image.
+
+        Raises:
+            ValueError: If the level is out of range.
+
+        Example:
+            ```python
+            thumb = img.pyramid_level(3)   # 1/8 size, box-filtered
+            ```
+        """
+        if not 0 <= level < self.pyramid_depth:
+            raise ValueError(f"Pyramid level {level} out of range (0-{self.pyramid_depth - 1})")
+        while len(self._levels) < level:
+            above = self._levels[-1] if self._levels else self
+            halved = {
+                name: halve_array(above._layers[name].data)
+                for name in self.CHANNEL_LAYERS
+                if name in above._layers
+            }
+            self._levels.append(
+                Image(
+                    red=halved["red"],
+                    green=halved["green"],
+                    blue=halved["blue"],
+                    alpha=halved.get("alpha"),
+                )
+            )
+        return self._levels[level - 1] if level else self
+
+    def _pyramid_source(
+        self, width: int, height: int
+    ) -> tuple[Image, tuple[float, float, float, float]]:
+        """
+        The smallest pyramid level that is still at least ``width x height``.
+
+        Returns the level and the box it holds this image's pixels in:
+        odd sizes are edge-padded while halving, so a level can run a
+        fraction of a pixel past the original right and bottom edges.
+        """
+        level = 0
+        while (
+            level + 1 < self.pyramid_depth
+            and self._width >> (level + 1) >= width
+            and self._height >> (level + 1) >= height
+        ):
+            level += 1
+        scale = 1 << level
+        return self.pyramid_level(level), (0.0, 0.0, self._width / scale, self._height / scale)
+
     # --- Transformation methods (return new Image) ---
 
     def downscale(self, factor: int) -> Image:
@@ -311,9 +574,11 @@ class Image:
         Returns:
             A new, smaller Image.
         """
+        # Computed layers are rebuilt from the new channels on demand
         new_layers = {}
-        for name, layer in self._layers.items():
-            new_layers[name] = downscale_array(layer.data, factor)
+        for name in self.CHANNEL_LAYERS:
+            if name in self._layers:
+                new_layers[name] = downscale_array(self._layers[name].data, factor)
 
         return Image(
             red=new_layers["red"],
@@ -327,6 +592,9 @@ class Image:
         Resize to exact dimensions.
 
         May distort aspect ratio. For aspect-preserving resize, use fit().
+        Large reductions resample from the nearest pyramid level (see
+        ``pyramid_level()``) rather than from the full-resolution pixels,
+        which is cheaper when one image is resized to several sizes.
 
         Args:
             width: Target width.
@@ -335,9 +603,12 @@ class Image:
         Returns:
             A new Image with the specified dimensions.
         """
+        # Computed layers are rebuilt from the new channels on demand
+        source, box = self._pyramid_source(width, height)
         new_layers = {}
-        for name, layer in self._layers.items():
-            new_layers[name] = resize_array(layer.data, width, height)
+        for name in self.CHANNEL_LAYERS:
+            if name in source._layers:
+                new_layers[name] = resize_array(source._layers[name].data, width, height, box=box)
 
         return Image(
             red=new_layers["red"],
@@ -391,6 +662,50 @@ class Image:
 
         raise ValueError("At least one of cols or rows must be specified")
 
+    def filter(
+        self,
+        pipeline: FilterPipeline,
+        channels: tuple[str, ...] = ("red", "green", "blue"),
+    ) -> Image:
+        """
+        Run a filter pipeline on each of the given channels.
+
+        Channels not listed (alpha by default) are carried over unchanged.
+        Computed layers of the result reflect the filtered channels.
+
+        Args:
+            pipeline: The filters to apply.
+            channels: Channel layers to filter.
+
+        Returns:
+            A new, filtered Image. Filtered channels keep the pipeline's
+            working precision (float32 by default).
+
+        Raises:
+            KeyError: If a channel is not a channel layer of this image.
+
+        Example:
+            ```python
+            prep = FilterPipeline().levels(15, 240).unsharp(sigma=1.5, amount=0.8)
+            grid = Grid.from_image(Image.load("photo.jpg").filter(prep), cols=80)
+            ```
+        """
+        for name in channels:
+            if name not in self.CHANNEL_LAYERS or name not in self._layers:
+                raise KeyError(f"Layer '{name}' is not a channel of this image")
+        image = Image.__new__(Image)
+        # Filtered channels are new arrays already; only carried-over ones are copied
+        image._layers = {
+            name: pipeline.apply(layer) if name in channels else Layer(layer.data)
+            for name, layer in self._layers.items()
+            if name in self.CHANNEL_LAYERS
+        }
+        image._width = self._width
+        image._height = self._height
+        image._array = None
+        image._levels = []
+        return image
+
     def __repr__(self) -> str:
         alpha_str = "+alpha" if self.has_alpha else ""
         return f"Image({self._width}x{self._height}{alpha_str})"
@@ -404,3 +719,13 @@ class Image:
         for y in range(self._height):
             for x in range(self._width):
                 yield x, y, self.rgb_at(x, y)
+
+
+def _open(path: Path) -> PILImage.Image:
+    """Open an image file with Pillow, with the loader's error types."""
+    if not path.exists():
+        raise FileNotFoundError(f"Image file not found: {path}")
+    try:
+        return PILImage.open(path)
+    except Exception as e:
+        raise ValueError(f"Could not open image: {e}") from e
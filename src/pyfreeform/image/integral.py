@@ -0,0 +1,176 @@
+"""SummedAreaTable - Constant-time rectangle statistics over a 2D array."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
+class RegionStats:
+    """
+    Summary statistics of the values inside a rectangular region.
+
+    Attributes:
+        count: Number of samples (pixels or cells) in the region.
+        sum: Sum of all values.
+        mean: Average value.
+        variance: Population variance of the values.
+
+    Example:
+        ```python
+        stats = image["brightness"].integral.stats(0, 0, 100, 50)
+        stats.mean, stats.std
+        ```
+    """
+
+    count: int
+    sum: float
+    mean: float
+    variance: float
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation."""
+        return math.sqrt(self.variance)
+
+    def scaled(self, factor: float) -> RegionStats:
+        """Return the stats of the same region with every value multiplied by *factor*."""
+        return RegionStats(
+            count=self.count,
+            sum=self.sum * factor,
+            mean=self.mean * factor,
+            variance=self.variance * factor * factor,
+        )
+
+
+class SummedAreaTable:
+    """
+    Integral image of a 2D array.
+
+    After a single O(width x height) build, the sum, mean and variance
+    of any axis-aligned rectangle cost four lookups, regardless of the
+    rectangle's size.
+
+    Rectangles are half-open ``[x0, x1) x [y0, y1)`` in (x, y) order,
+    matching ``Layer[x, y]``. Coordinates are clamped to the array.
+    All query methods also accept NumPy arrays of coordinates and then
+    answer every rectangle in one vectorized pass.
+
+    Example:
+        ```python
+        table = SummedAreaTable(layer.data)
+        table.mean(10, 10, 20, 20)        # average of a 10x10 block
+        table.stats(0, 0, *layer.shape[::-1])
+        ```
+    """
+
+    def __init__(self, data: np.ndarray) -> None:
+        """
+        Build the table.
+
+        Args:
+            data: A 2D numpy array of values.
+
+        Raises:
+            ValueError: If data is not 2-dimensional.
+        """
+        if data.ndim != 2:
+            raise ValueError(f"SummedAreaTable data must be 2D, got {data.ndim}D")
+        values = np.asarray(data, dtype=np.float64)
+        self._height, self._width = values.shape
+        self._sum = self._integrate(values)
+        # Built on first variance query; plain sums/means never need it.
+        self._values: np.ndarray | None = values
+        self._sum_sq: np.ndarray | None = None
+
+    @staticmethod
+    def _integrate(values: np.ndarray) -> np.ndarray:
+        """Cumulative sum over both axes, padded with a leading zero row/column."""
+        table = np.zeros((values.shape[0] + 1, values.shape[1] + 1), dtype=np.float64)
+        np.cumsum(values, axis=0, out=table[1:, 1:])
+        np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+        return table
+
+    @property
+    def width(self) -> int:
+        """Width of the source array."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Height of the source array."""
+        return self._height
+
+    def _clamp(self, x0, y0, x1, y1):
+        """Clamp rectangle corners to the table and order them."""
+        x0 = np.clip(np.asarray(x0, dtype=np.intp), 0, self._width)
+        x1 = np.clip(np.asarray(x1, dtype=np.intp), 0, self._width)
+        y0 = np.clip(np.asarray(y0, dtype=np.intp), 0, self._height)
+        y1 = np.clip(np.asarray(y1, dtype=np.intp), 0, self._height)
+        return x0, y0, np.maximum(x0, x1), np.maximum(y0, y1)
+
+    @staticmethod
+    def _lookup(table: np.ndarray, x0, y0, x1, y1):
+        return table[y1, x1] - table[y0, x1] - table[y1, x0] + table[y0, x0]
+
+    def count(self, x0, y0, x1, y1):
+        """Number of elements in the rectangle (after clamping)."""
+        x0, y0, x1, y1 = self._clamp(x0, y0, x1, y1)
+        return (x1 - x0) * (y1 - y0)
+
+    def sum(self, x0, y0, x1, y1):
+        """Sum of the values in ``[x0, x1) x [y0, y1)``."""
+        x0, y0, x1, y1 = self._clamp(x0, y0, x1, y1)
+        return self._lookup(self._sum, x0, y0, x1, y1)
+
+    def mean(self, x0, y0, x1, y1):
+        """Mean of the values in the rectangle (NaN for empty rectangles)."""
+        x0, y0, x1, y1 = self._clamp(x0, y0, x1, y1)
+        n = (x1 - x0) * (y1 - y0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.true_divide(self._lookup(self._sum, x0, y0, x1, y1), n)
+
+    def variance(self, x0, y0, x1, y1):
+        """Population variance of the values in the rectangle (NaN for empty rectangles)."""
+        if self._sum_sq is None:
+            self._sum_sq = self._integrate(np.square(self._values))
+            self._values = None
+        x0, y0, x1, y1 = self._clamp(x0, y0, x1, y1)
+        n = (x1 - x0) * (y1 - y0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.true_divide(self._lookup(self._sum, x0, y0, x1, y1), n)
+            mean_sq = np.true_divide(self._lookup(self._sum_sq, x0, y0, x1, y1), n)
+        # E[x²] - E[x]² can dip just below zero from float cancellation.
+        return np.maximum(mean_sq - mean * mean, 0.0)
+
+    def stats(self, x0: int, y0: int, x1: int, y1: int) -> RegionStats:
+        """
+        All statistics for a single rectangle.
+
+        Args:
+            x0: Left edge (inclusive).
+            y0: Top edge (inclusive).
+            x1: Right edge (exclusive).
+            y1: Bottom edge (exclusive).
+
+        Returns:
+            RegionStats for the rectangle.
+
+        Raises:
+            ValueError: If the clamped rectangle is empty.
+        """
+        n = int(self.count(x0, y0, x1, y1))
+        if n == 0:
+            raise ValueError(f"Empty region ({x0}, {y0}) - ({x1}, {y1})")
+        return RegionStats(
+            count=n,
+            sum=float(self.sum(x0, y0, x1, y1)),
+            mean=float(self.mean(x0, y0, x1, y1)),
+            variance=float(self.variance(x0, y0, x1, y1)),
+        )
+
+    def __repr__(self) -> str:
+        return f"SummedAreaTable({self._width}x{self._height})"
@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import numpy as np
 
+from .dither import dither
+from .integral import SummedAreaTable
+
+if TYPE_CHECKING:
+    from .filters import FilterPipeline
+
 
 class Layer:
     """
@@ -25,19 +33,23 @@ class Layer:
         ```
     """
 
-    def __init__(self, data: np.ndarray) -> None:
+    def __init__(self, data: np.ndarray, copy: bool = True) -> None:
         """
         Create a layer from a numpy array.
 
         Args:
             data: A 2D numpy array of values.
+            copy: Copy the values into a new float64 array. With False the
+                array (or view) is wrapped as-is, keeping its dtype; writes
+                through the layer then reach the original buffer.
 
         Raises:
             ValueError: If data is not 2-dimensional.
         """
         if data.ndim != 2:
             raise ValueError(f"Layer data must be 2D, got {data.ndim}D")
-        self._data = data.astype(np.float64)
+        self._data = data.astype(np.float64) if copy else data
+        self._integral: SummedAreaTable | None = None
 
     @property
     def data(self) -> np.ndarray:
@@ -85,6 +97,29 @@ class Layer:
         """
         x, y = pos
         self._data[y, x] = value
+        self._integral = None
+
+    @property
+    def integral(self) -> SummedAreaTable:
+        """
+        Summed-area table of this layer, built on first access and cached.
+
+        Gives O(1) sum, mean and variance for any pixel rectangle.
+        Writes through ``layer[x, y] = v`` discard the cached table;
+        if you modify ``layer.data`` in place, call ``invalidate()``.
+
+        Example:
+            ```python
+            image["brightness"].integral.mean(0, 0, 64, 64)
+            ```
+        """
+        if self._integral is None:
+            self._integral = SummedAreaTable(self._data)
+        return self._integral
+
+    def invalidate(self) -> None:
+        """Discard cached derived data after modifying ``data`` in place."""
+        self._integral = None
 
     def normalize(self) -> Layer:
         """
@@ -114,6 +149,56 @@ class Layer:
         clamped = np.clip(self._data, 0, 255)
         return Layer(clamped)
 
+    def filter(self, pipeline: FilterPipeline, in_place: bool = False) -> Layer:
+        """
+        Run a filter pipeline on this layer.
+
+        Args:
+            pipeline: The filters to apply.
+            in_place: Overwrite this layer's data instead of returning a new layer.
+
+        Returns:
+            The filtered layer.
+
+        Example:
+            ```python
+            edges = img["brightness"].filter(FilterPipeline().blur(2).unsharp(amount=2))
+            ```
+        """
+        return pipeline.apply(self, in_place=in_place)
+
+    def dither(
+        self,
+        method: str = "floyd-steinberg",
+        levels: int = 2,
+        serpentine: bool = True,
+        size: int | None = None,
+        seed: int = 0,
+    ) -> Layer:
+        """
+        Return a new layer quantized to *levels* values with dithering.
+
+        Values are on the 0-255 scale; the result holds *levels* evenly
+        spaced values from 0 to 255. See ``Grid.dither`` for the methods.
+
+        Args:
+            method: Error-diffusion kernel or threshold screen.
+            levels: Number of output values.
+            serpentine: Alternate the error-diffusion direction row by row.
+            size: Screen size for the threshold-screen methods.
+            seed: Random seed of the blue-noise screen.
+
+        Returns:
+            A new dithered Layer.
+
+        Example:
+            ```python
+            ink = img["brightness"].dither("stucki", levels=3)
+            ```
+        """
+        quantized = dither(self._data / 255.0, method, levels, serpentine, size, seed)
+        return Layer(quantized * 255.0, copy=False)
+
     def copy(self) -> Layer:
         """Return a copy of this layer."""
         return Layer(self._data.copy())
@@ -45,6 +45,7 @@ def resize_array(
     width: int,
     height: int,
     resample: int = PILImage.Resampling.LANCZOS,
+    box: tuple[float, float, float, float] | None = None,
 ) -> np.ndarray:
     """
     Resize a 2D numpy array to new dimensions.
@@ -56,6 +57,8 @@ def resize_array(
         width: Target width.
         height: Target height.
         resample: PIL resampling filter (default: LANCZOS for quality).
+        box: Optional ``(left, top, right, bottom)`` source region to
+            resample, in (possibly fractional) pixels. Default: the whole array.
 
     Returns:
         Resized numpy array.
@@ -71,7 +74,7 @@ def resize_array(
     # Normalize to 0-255 for PIL, resample, then restore the original range.
     normalized = ((arr - min_val) / (max_val - min_val) * 255).astype(np.uint8)
     pil_img = PILImage.fromarray(normalized)
-    resized_pil = pil_img.resize((width, height), resample=resample)
+    resized_pil = pil_img.resize((width, height), resample=resample, box=box)
     resized = np.array(resized_pil, dtype=np.float64)
     return resized / 255 * (max_val - min_val) + min_val
 
@@ -103,3 +106,24 @@ def downscale_array(arr: np.ndarray, factor: int) -> np.ndarray:
     # Reshape and average
     reshaped = trimmed.reshape(new_height, factor, new_width, factor)
     return reshaped.mean(axis=(1, 3))
+
+
+def halve_array(arr: np.ndarray) -> np.ndarray:
+    """
+    Halve a 2D array with a 2x2 box filter (one image-pyramid step).
+
+    Odd sizes round up: the last row or column is paired with a copy of
+    itself, so output pixel ``i`` always covers input pixels ``2i`` and
+    ``2i + 1``.
+
+    Args:
+        arr: 2D numpy array (any numeric dtype).
+
+    Returns:
+        Float64 array of shape ``(ceil(height / 2), ceil(width / 2))``.
+    """
+    height, width = arr.shape
+    if height % 2 or width % 2:
+        arr = np.pad(arr, ((0, height % 2), (0, width % 2)), mode="edge")
+    half_height, half_width = arr.shape[0] // 2, arr.shape[1] // 2
+    return arr.reshape(half_height, 2, half_width, 2).mean(axis=(1, 3), dtype=np.float64)
@@ -0,0 +1,326 @@
+"""Weighted blue-noise stippling from image brightness."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from .image import Image
+from .layer import Layer
+from .resize import resize_array
+
+# Points per r^2 of area at the starting radius. Random packings saturate
+# near 0.7, so N points are placed well before darts stop finding room.
+_PACKING = 0.55
+
+# Lightest density that still receives stipples at full spacing; below
+# it the spacing stops growing (keeps neighbour searches bounded).
+_DENSITY_FLOOR = 0.01
+
+# Raster pixels per stipple used for sampling and relaxation
+_PIXELS_PER_POINT = 8
+
+# Largest candidate-by-offset block gathered at once
+_GATHER_ENTRIES = 1 << 22
+
+
+def stipple(
+    source: Image | Layer | np.ndarray,
+    count: int,
+    *,
+    width: float | None = None,
+    height: float | None = None,
+    relax: int = 0,
+    gamma: float = 1.0,
+    seed: int | None = 0,
+) -> np.ndarray:
+    """
+    Place *count* points with density following the darkness of an image.
+
+    Points are drawn by variable-radius Poisson-disk sampling: each new
+    point keeps a distance ``r ~ 1 / sqrt(darkness)`` from its
+    neighbours, so dark areas get dense, evenly spread points and white
+    areas none. Candidates are tested in large batches against a hash
+    grid, so no Python loop runs per point.
+
+    ``relax`` adds weighted Lloyd iterations (weighted Voronoi
+    stippling): every point moves to the darkness-weighted centroid of
+    its Voronoi region, computed for all points at once by jump flooding
+    over a raster.
+
+    Args:
+        source: An Image (its brightness is used), a brightness Layer
+            (0-255), or a 2D array of densities (0-1, higher = more points).
+        count: Number of points.
+        width: Width of the output coordinate space. Default: source width.
+        height: Height of the output coordinate space. Default: source height.
+        relax: Number of Lloyd relaxation iterations (0 = none).
+        gamma: Contrast of the density (``darkness ** gamma``).
+        seed: Random seed (None for a different result every call).
+
+    Returns:
+        ``(count, 2)`` array of ``(x, y)`` points.
+
+    Raises:
+        ValueError: If count is negative, relax is negative, or the
+            source has no dark pixels to place points on.
+
+    Example:
+        ```python
+        points = stipple(Image.load("portrait.jpg"), 20_000, relax=8)
+        scene.place(DotCloud(points, radius=0.8))
+        ```
+    """
+    if count < 0:
+        raise ValueError(f"count must not be negative, got {count}")
+    if relax < 0:
+        raise ValueError(f"relax must not be negative, got {relax}")
+    density = _density(source, gamma)
+    source_height, source_width = density.shape
+    width = source_width if width is None else width
+    height = source_height if height is None else height
+    if count == 0:
+        return np.empty((0, 2))
+
+    # Work on a raster with a fixed number of pixels per point
+    scale = math.sqrt(_PIXELS_PER_POINT * count / density.size)
+    raster_w = max(1, round(source_width * scale))
+    raster_h = max(1, round(source_height * scale))
+    if (raster_w, raster_h) != (source_width, source_height):
+        density = np.clip(resize_array(density, raster_w, raster_h), 0.0, 1.0)
+    if not density.any():
+        raise ValueError("Source has no dark pixels to place points on")
+
+    rng = np.random.default_rng(seed)
+    points = _poisson_disk(density, count, rng)
+    if relax:
+        # No Voronoi region extends past the widest Poisson-disk spacing
+        reach = math.sqrt(_PACKING * density.sum() / count / _DENSITY_FLOOR)
+        points = _relax(density, points, relax, reach)
+    return points * (width / raster_w, height / raster_h)
+
+
+def _density(source: Image | Layer | np.ndarray, gamma: float) -> np.ndarray:
+    """Point density (0-1) of a stippling source."""
+    if isinstance(source, Image):
+        source = source["brightness"]
+    if isinstance(source, Layer):
+        density = 1.0 - np.clip(source.data, 0, 255) / 255.0
+    else:
+        density = np.clip(np.asarray(source, dtype=np.float64), 0.0, 1.0)
+        if density.ndim != 2:
+            raise ValueError(f"Expected a 2D density array, got {density.ndim}D")
+    return density**gamma if gamma != 1 else density
+
+
+# =========================================================================
+# POISSON-DISK SAMPLING
+# =========================================================================
+
+
+def _poisson_disk(density: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Batched dart throwing with a spacing of ``r0 / sqrt(density)``.
+
+    Darts are importance-sampled from the density, then rejected if an
+    accepted point lies within the dart's radius. The hash grid's cells
+    are small enough to hold at most one point. When batches stop
+    finding room before *count* points are placed, the radius shrinks
+    (accepted points stay valid, being farther apart than required).
+    """
+    height, width = density.shape
+    cdf = np.cumsum(density, axis=None)
+    r0 = math.sqrt(_PACKING * cdf[-1] / count)
+    inv_sqrt = (1.0 / np.sqrt(np.maximum(density, _DENSITY_FLOOR))).ravel()
+    spread = float(inv_sqrt.max() / inv_sqrt.min())  # Largest radius / smallest
+
+    points = np.empty((count, 2))
+    total = 0
+    batch = max(256, count // 8)
+    grid = _HashGrid(width, height, r0 * float(inv_sqrt.min()), spread)
+    while total < count:
+        # Importance-sample darts: pixel by density, uniform inside the pixel
+        pixel = np.searchsorted(cdf, rng.random(batch) * cdf[-1], "right")
+        pixel = np.minimum(pixel, cdf.size - 1)
+        darts = np.column_stack((pixel % width, pixel // width)) + rng.random((batch, 2))
+        radii = r0 * inv_sqrt[pixel]
+
+        keys = grid.keys(darts)
+        ok = ~grid.conflicts(points, darts, radii, keys)
+        darts, radii, keys = darts[ok], radii[ok], keys[ok]
+
+        # Darts of one batch must also keep their distance from each other:
+        # keep the first dart per cell, then drop darts near an earlier one
+        _, first = np.unique(keys, return_index=True)
+        first.sort()
+        darts, radii, keys = darts[first], radii[first], keys[first]
+        batch_grid = grid.empty_like()
+        batch_grid.cells[keys] = np.arange(len(darts))
+        ok = ~batch_grid.conflicts(darts, darts, radii, keys, earlier_only=True)
+        accepted = np.flatnonzero(ok)[: count - total]
+
+        points[total : total + len(accepted)] = darts[accepted]
+        grid.cells[keys[accepted]] = np.arange(total, total + len(accepted))
+        total += len(accepted)
+
+        if len(accepted) < 0.01 * batch and total < count:
+            # Saturated before reaching count: tighten the spacing
+            r0 *= 0.85
+            grid = _HashGrid(width, height, r0 * float(inv_sqrt.min()), spread)
+            grid.cells[grid.keys(points[:total])] = np.arange(total)
+    return points
+
+
+class _HashGrid:
+    """
+    Flat grid of point indices (-1 = empty) with cells small enough to
+    hold at most one point of spacing *r_min*.
+
+    The grid has a border of empty cells as wide as the largest search
+    reach, so neighbour lookups are plain offsets with no bounds checks.
+    """
+
+    def __init__(self, width: int, height: int, r_min: float, spread: float) -> None:
+        self.size = r_min / math.sqrt(2)
+        self.pad = math.ceil(spread * math.sqrt(2)) + 1
+        self.cols = math.ceil(width / self.size) + 1 + 2 * self.pad
+        self.rows = math.ceil(height / self.size) + 1 + 2 * self.pad
+        self.cells = np.full(self.rows * self.cols, -1, dtype=np.int32)
+
+    def empty_like(self) -> _HashGrid:
+        grid = object.__new__(_HashGrid)
+        grid.size, grid.pad, grid.cols, grid.rows = self.size, self.pad, self.cols, self.rows
+        grid.cells = np.full_like(self.cells, -1)
+        return grid
+
+    def keys(self, points: np.ndarray) -> np.ndarray:
+        """Flat cell index of each point."""
+        cell = (points // self.size).astype(np.intp) + self.pad
+        return cell[:, 1] * self.cols + cell[:, 0]
+
+    def conflicts(
+        self,
+        points: np.ndarray,
+        darts: np.ndarray,
+        radii: np.ndarray,
+        keys: np.ndarray,
+        earlier_only: bool = False,
+    ) -> np.ndarray:
+        """
+        Whether each dart has a stored point closer than its radius.
+
+        Darts are grouped by how many cells their radius spans, so each
+        group gathers a fixed block of neighbour cells in one operation;
+        distances are only computed for the occupied ones. With
+        *earlier_only*, stored indices refer to *darts* and only those
+        before the dart itself count.
+        """
+        conflict = np.zeros(len(darts), dtype=bool)
+        reach = np.ceil(radii / self.size).astype(np.intp)
+        for span in np.unique(reach):
+            offsets = np.arange(-span, span + 1)
+            dy, dx = (a.ravel() for a in np.meshgrid(offsets, offsets, indexing="ij"))
+            # Skip corner cells lying entirely beyond the radius
+            near = np.maximum(np.abs(dy) - 1, 0) ** 2 + np.maximum(np.abs(dx) - 1, 0) ** 2
+            shifts = (dy * self.cols + dx)[near < span**2]
+            group = np.flatnonzero(reach == span)
+            step = max(1, _GATHER_ENTRIES // len(shifts))
+            for start in range(0, len(group), step):
+                members = group[start : start + step]
+                neighbours = self.cells[keys[members, None] + shifts]
+                owner, column = np.nonzero(neighbours >= 0)
+                other = neighbours[owner, column]
+                dart = members[owner]
+                if earlier_only:
+                    dart, other = dart[other < dart], other[other < dart]
+                gap = points[other] - darts[dart]
+                close = np.einsum("ij,ij->i", gap, gap) < radii[dart] ** 2
+                conflict[dart[close]] = True
+        return conflict
+
+
+# =========================================================================
+# LLOYD RELAXATION
+# =========================================================================
+
+
+def _relax(density: np.ndarray, points: np.ndarray, iterations: int, reach: float) -> np.ndarray:
+    """
+    Weighted Lloyd relaxation: move every point to the density-weighted
+    centroid of its Voronoi region, *iterations* times.
+
+    Voronoi regions come from jump flooding the raster. After the first
+    iteration the previous regions are reused as a starting guess, so
+    only jumps as long as the largest point movement are needed.
+    """
+    height, width = density.shape
+    weights = density.ravel()
+    xs = np.tile(np.arange(width) + 0.5, height)
+    ys = np.repeat(np.arange(height) + 0.5, width)
+    labels = None
+    for _ in range(iterations):
+        labels = _nearest_labels(points, width, height, reach, labels)
+        flat = labels.ravel()
+        found = flat >= 0
+        owners, w = flat[found], weights[found]
+        mass = np.bincount(owners, weights=w, minlength=len(points))
+        moved = points.copy()
+        has_mass = mass > 0
+        for axis, coords in enumerate((xs, ys)):
+            totals = np.bincount(owners, weights=w * coords[found], minlength=len(points))
+            moved[has_mass, axis] = totals[has_mass] / mass[has_mass]
+        reach = 2 * float(np.abs(moved - points).max(initial=0.0)) + 1
+        points = moved
+    return points
+
+
+def _nearest_labels(
+    points: np.ndarray,
+    width: int,
+    height: int,
+    reach: float,
+    labels: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Index of the nearest point for every raster pixel (jump flooding).
+
+    Each pass lets every pixel adopt the point of a neighbour ``step``
+    pixels away in the 8 directions if it is closer. Steps halve from
+    the largest power of two below *reach* (the farthest any pixel can
+    be from its point, or from its point in *labels*) down to 1,
+    followed by one extra pass at step 1 for accuracy.
+    """
+    labels = np.full((height, width), -1, dtype=np.intp) if labels is None else labels.copy()
+    px = np.clip(points[:, 0].astype(np.intp), 0, width - 1)
+    py = np.clip(points[:, 1].astype(np.intp), 0, height - 1)
+    labels[py, px] = np.arange(len(points))
+    centers_x = np.arange(width) + 0.5
+    centers_y = (np.arange(height) + 0.5)[:, None]
+    # A trailing point at infinity stands in for "no label" (index -1)
+    point_x = np.append(points[:, 0], np.inf)
+    point_y = np.append(points[:, 1], np.inf)
+
+    def distance(candidate: np.ndarray) -> np.ndarray:
+        return (point_x[candidate] - centers_x) ** 2 + (point_y[candidate] - centers_y) ** 2
+
+    best = distance(labels)
+    steps = [1]
+    while steps[0] * 2 < min(reach, max(width, height)):
+        steps.insert(0, steps[0] * 2)
+    for step in [*steps, 1]:
+        for oy in (-step, 0, step):
+            for ox in (-step, 0, step):
+                if oy == ox == 0 or abs(oy) >= height or abs(ox) >= width:
+                    continue
+                shifted = np.full_like(labels, -1)
+                dst_y = slice(max(0, oy), height + min(0, oy))
+                dst_x = slice(max(0, ox), width + min(0, ox))
+                src_y = slice(max(0, -oy), height + min(0, -oy))
+                src_x = slice(max(0, -ox), width + min(0, -ox))
+                shifted[dst_y, dst_x] = labels[src_y, src_x]
+                d = distance(shifted)
+                closer = d < best
+                labels[closer] = shifted[closer]
+                best[closer] = d[closer]
+    return labels
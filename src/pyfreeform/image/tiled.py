@@ -0,0 +1,429 @@
+"""TiledImage - Read very large image files a window at a time."""
+
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from PIL import Image as PILImage
+
+from .colorspace import COLOR_SPACE_LAYERS, color_space_layers
+from .integral import RegionStats
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Pillow raw modes we can memory-map directly: bytes per pixel
+_MAPPABLE_MODES = {"RGB": 3, "RGBA": 4, "RGBX": 4, "L": 1}
+
+# Perceptual luminance weights, as used by Image["brightness"]
+_LUMA = np.array([0.299, 0.587, 0.114])
+
+CELL_STATISTICS = ("std", "min", "max")
+
+
+class TiledImage:
+    """
+    A large image file that is never decoded in full.
+
+    ``Image.load`` holds every pixel as four float64 channels (32 bytes
+    per pixel), which rules out scans and satellite tiles of tens of
+    thousands of pixels on a side. A TiledImage instead reads rectangular
+    windows on demand:
+
+    - Uncompressed files (raw TIFF strips or tiles, PPM/PGM) are
+      memory-mapped, so only the pixels being read are ever in memory.
+    - Other formats (compressed TIFF, PNG, JPEG, ...) cannot be decoded
+      piecewise by Pillow (it hands compressed TIFF to libtiff as one
+      piece), and a decode needs the whole image in memory (1-4 bytes
+      per pixel, by mode). A ``strips()`` pass decodes the file and lets
+      go of it when the pass ends. The first ``read()`` decodes it and
+      keeps it for the reads that follow, until ``release()``.
+
+    Pass it to ``Grid.from_image`` or ``Scene.from_image`` to build a
+    grid by streaming the file strip by strip, accumulating per-cell
+    area averages directly into grid-sized arrays. ``cell.sample_image``
+    and ``cell.region_stats`` keep working through on-demand reads.
+
+    Example:
+        ```python
+        scan = TiledImage.open("scan_30k.tif")
+        scene = Scene.from_image(scan, grid_size=300)
+        ```
+    """
+
+    def __init__(self, path: str | Path, max_pixels: int | None = None) -> None:
+        """
+        Open an image file without decoding its pixels.
+
+        Use ``TiledImage.open()`` for the same thing with a classmethod.
+
+        Args:
+            path: Path to the image file.
+            max_pixels: Largest image to accept if the file has to be
+                decoded in full (see the class docstring): a guard against
+                decompression bombs. Defaults to Pillow's
+                ``PIL.Image.MAX_IMAGE_PIXELS``; raise it for trusted
+                files. Memory-mapped files are never decoded and accept
+                any size.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            ValueError: If the file can't be opened as an image, or has to
+                be decoded and is larger than *max_pixels*.
+        """
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Image file not found: {path}")
+
+        pil_img = _open_unchecked(path)
+        self._path = path
+        self._width, self._height = pil_img.size
+        self._has_alpha = pil_img.mode in ("RGBA", "LA", "PA") or "transparency" in pil_img.info
+        try:
+            self._tiles = self._map_tiles(pil_img)
+        finally:
+            pil_img.close()
+        # Full decode kept for read() on files that can't be mapped
+        self._decoded: PILImage.Image | None = None
+
+        limit = PILImage.MAX_IMAGE_PIXELS if max_pixels is None else max_pixels
+        if self._tiles is None and limit is not None and self._width * self._height > limit:
+            raise ValueError(
+                f"Image {self._width}x{self._height} has to be decoded in full and is "
+                f"larger than max_pixels={limit}; pass a larger max_pixels if the "
+                f"file is trusted"
+            )
+
+    @classmethod
+    def open(cls, path: str | Path, max_pixels: int | None = None) -> TiledImage:
+        """Open an image file for windowed reading (see the class docstring)."""
+        return cls(path, max_pixels)
+
+    def _map_tiles(
+        self, pil_img: PILImage.Image
+    ) -> list[tuple[tuple[int, int, int, int], np.ndarray]] | None:
+        """Memory-map every tile of an uncompressed file, or None if not possible."""
+        tiles = []
+        # Tiles are (codec, extents, offset, args) tuples on every Pillow version
+        for codec, extents, offset, args in pil_img.tile:
+            args = args if isinstance(args, tuple) else (args,)
+            rawmode = args[0]
+            stride = args[1] if len(args) > 1 else 0
+            ystep = args[2] if len(args) > 2 else 1
+            if codec != "raw" or rawmode not in _MAPPABLE_MODES or ystep != 1:
+                return None
+            x0, y0, x1, y1 = extents
+            depth = _MAPPABLE_MODES[rawmode]
+            row_bytes = (x1 - x0) * depth
+            stride = stride or row_bytes
+            mapped = np.memmap(
+                self._path,
+                dtype=np.uint8,
+                mode="r",
+                offset=offset,
+                shape=(y1 - y0, stride),
+            )
+            tiles.append(((x0, y0, x1, y1), mapped[:, :row_bytes].reshape(y1 - y0, x1 - x0, depth)))
+        return tiles or None
+
+    # --- Properties ---
+
+    @property
+    def path(self) -> Path:
+        """The image file."""
+        return self._path
+
+    @property
+    def width(self) -> int:
+        """Image width in pixels."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Image height in pixels."""
+        return self._height
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Image size as (width, height) tuple."""
+        return (self._width, self._height)
+
+    @property
+    def has_alpha(self) -> bool:
+        """Whether this image has an alpha channel."""
+        return self._has_alpha
+
+    @property
+    def is_mapped(self) -> bool:
+        """True if pixels are read straight from the file (bounded memory)."""
+        return self._tiles is not None
+
+    # --- Reading ---
+
+    def read(self, x0: int, y0: int, x1: int, y1: int) -> np.ndarray:
+        """
+        Read a pixel rectangle ``[x0, x1) x [y0, y1)`` as 8-bit RGBA.
+
+        Coordinates are clamped to the image.
+
+        Returns:
+            ``(height, width, 4)`` uint8 array.
+        """
+        x0, x1 = max(0, x0), min(self._width, x1)
+        y0, y1 = max(0, y0), min(self._height, y1)
+        out = np.empty((max(0, y1 - y0), max(0, x1 - x0), 4), dtype=np.uint8)
+        if out.size == 0:
+            return out
+
+        if self._tiles is None:
+            if self._decoded is None:
+                with _open_unchecked(self._path) as pil_img:
+                    pil_img.load()
+                    # Detached from the file, in the file's own mode
+                    self._decoded = pil_img.copy()
+            out[...] = np.asarray(self._decoded.crop((x0, y0, x1, y1)).convert("RGBA"))
+            return out
+
+        for (tx0, ty0, tx1, ty1), pixels in self._tiles:
+            ix0, iy0 = max(x0, tx0), max(y0, ty0)
+            ix1, iy1 = min(x1, tx1), min(y1, ty1)
+            if ix0 >= ix1 or iy0 >= iy1:
+                continue
+            src = pixels[iy0 - ty0 : iy1 - ty0, ix0 - tx0 : ix1 - tx0]
+            dst = out[iy0 - y0 : iy1 - y0, ix0 - x0 : ix1 - x0]
+            depth = src.shape[2]
+            if depth == 1:
+                dst[..., :3] = src
+            else:
+                dst[..., :3] = src[..., :3]
+            if depth == 4 and self._has_alpha:
+                dst[..., 3] = src[..., 3]
+            else:
+                dst[..., 3] = 255
+        return out
+
+    def strips(self, rows: int = 256) -> Iterator[tuple[int, np.ndarray]]:
+        """
+        Read the whole image as horizontal bands, top to bottom.
+
+        Args:
+            rows: Pixel rows per band.
+
+        Yields:
+            ``(y0, pixels)`` with pixels as a ``(rows, width, 4)`` uint8 array.
+        """
+        if self._tiles is not None:
+            for y0 in range(0, self._height, rows):
+                yield y0, self.read(0, y0, self._width, y0 + rows)
+            return
+        if self._decoded is not None:
+            yield from self._decoded_strips(self._decoded, rows)
+            return
+        # Decode once for the whole pass, converting one band at a time
+        with _open_unchecked(self._path) as pil_img:
+            pil_img.load()
+            yield from self._decoded_strips(pil_img, rows)
+
+    def _decoded_strips(
+        self, pil_img: PILImage.Image, rows: int
+    ) -> Iterator[tuple[int, np.ndarray]]:
+        """``strips()`` of an already decoded image."""
+        for y0 in range(0, self._height, rows):
+            band = pil_img.crop((0, y0, self._width, min(y0 + rows, self._height)))
+            yield y0, np.asarray(band.convert("RGBA"))
+
+    def release(self) -> None:
+        """
+        Drop the decoded pixels ``read()`` keeps for files that can't be mapped.
+
+        The next ``read()`` decodes the file again. A no-op for mapped
+        files, which hold no decoded pixels.
+        """
+        if self._decoded is not None:
+            self._decoded.close()
+            self._decoded = None
+
+    def rgba_at(self, x: int, y: int) -> tuple[int, int, int, int]:
+        """RGBA color at a position, as integers 0-255."""
+        r, g, b, a = self.read(x, y, x + 1, y + 1)[0, 0].tolist()
+        return (r, g, b, a)
+
+    def rgb_at(self, x: int, y: int) -> tuple[int, int, int]:
+        """RGB color at a position, as integers 0-255."""
+        return self.rgba_at(x, y)[:3]
+
+    def hex_at(self, x: int, y: int) -> str:
+        """Hex color string at a position."""
+        r, g, b = self.rgb_at(x, y)
+        return f"#{r:02x}{g:02x}{b:02x}"
+
+    def alpha_at(self, x: int, y: int) -> float:
+        """Alpha (opacity) at a position, 0.0-1.0."""
+        return self.rgba_at(x, y)[3] / 255.0
+
+    def region_stats(
+        self, x0: int, y0: int, x1: int, y1: int, layer: str = "brightness"
+    ) -> RegionStats:
+        """
+        Statistics of one layer over a pixel rectangle, read from the file.
+
+        Takes the same layer names as ``Image[...]``; values use the same
+        scales (0-255 for channels and brightness).
+
+        Raises:
+            KeyError: If the layer name is unknown.
+            ValueError: If the rectangle is empty.
+        """
+        pixels = self.read(x0, y0, x1, y1).astype(np.float64)
+        if pixels.size == 0:
+            raise ValueError(f"Empty region ({x0}, {y0}) - ({x1}, {y1})")
+        channels = {
+            "red": pixels[..., 0],
+            "green": pixels[..., 1],
+            "blue": pixels[..., 2],
+            "alpha": pixels[..., 3],
+        }
+        if layer in channels:
+            values = channels[layer]
+        elif layer == "brightness":
+            values = pixels[..., :3] @ _LUMA
+        elif layer == "grayscale":
+            values = pixels[..., :3].mean(axis=-1)
+        elif layer in COLOR_SPACE_LAYERS:
+            values = color_space_layers(layer, *(pixels[..., i] for i in range(3)))[layer]
+        else:
+            raise KeyError(f"Layer '{layer}' not found")
+        total = float(values.sum())
+        return RegionStats(
+            count=values.size,
+            sum=total,
+            mean=total / values.size,
+            variance=float(values.var()),
+        )
+
+    def __repr__(self) -> str:
+        alpha_str = "+alpha" if self._has_alpha else ""
+        how = "mapped" if self.is_mapped else "decoded"
+        return f"TiledImage({self._width}x{self._height}{alpha_str}, {how})"
+
+
+def _open_unchecked(path: Path) -> PILImage.Image:
+    """
+    ``PIL.Image.open`` without its decompression-bomb check.
+
+    Only reads the header. Pillow applies its check inside ``open`` from a
+    module-wide setting, so rather than switch that off for every thread,
+    this walks the registered format plugins itself; callers check the
+    size against their own limit.
+
+    Raises:
+        ValueError: If no plugin recognises the file.
+    """
+    PILImage.init()
+    with path.open("rb") as fp:
+        prefix = fp.read(16)
+    for name in PILImage.ID:
+        factory, accept = PILImage.OPEN[name]
+        accepted = accept is None or accept(prefix)
+        # Pillow's accept functions return a string to explain a refusal
+        if not accepted or isinstance(accepted, str):
+            continue
+        try:
+            return factory(str(path), str(path))
+        except (SyntaxError, IndexError, TypeError, struct.error, OSError):
+            continue
+    raise ValueError(f"Could not open image: cannot identify image file {str(path)!r}")
+
+
+def accumulate_cells(
+    strips: Iterable[tuple[int, np.ndarray]],
+    width: int,
+    height: int,
+    cols: int,
+    rows: int,
+    stats: tuple[str, ...] = (),
+) -> dict[str, np.ndarray]:
+    """
+    Area-average RGBA pixels into a ``rows x cols`` grid, one strip at a time.
+
+    Pixel ``(x, y)`` belongs to cell ``(y * rows // height, x * cols // width)``.
+    Only one strip is held at a time; everything else is grid-sized.
+
+    Args:
+        strips: ``(y0, pixels)`` bands covering the image top to bottom,
+            pixels as ``(band_rows, width, 4)`` arrays on the 0-255 scale.
+        width: Image width in pixels.
+        height: Image height in pixels.
+        cols: Grid columns (at most ``width``).
+        rows: Grid rows (at most ``height``).
+        stats: Extra per-cell statistics of pixel brightness, any of
+            "std", "min", "max". Returned as ``"brightness_<stat>"``, 0-1.
+
+    Returns:
+        Dict with ``"red"``, ``"green"``, ``"blue"``, ``"alpha"`` means
+        (0-255) and any requested statistics, each ``(rows, cols)``.
+
+    Raises:
+        ValueError: If the grid has more cells than the image has pixels
+            along an axis, or a statistic is unknown.
+    """
+    if cols > width or rows > height:
+        raise ValueError(
+            f"Grid {cols}x{rows} has more cells than the {width}x{height} image has pixels"
+        )
+    for stat in stats:
+        if stat not in CELL_STATISTICS:
+            raise ValueError(
+                f"Unknown statistic '{stat}'. Use one of: {', '.join(CELL_STATISTICS)}"
+            )
+
+    # First pixel column of each cell column (ceil(c * width / cols))
+    col_starts = -((-np.arange(cols) * width) // cols)
+    col_counts = np.diff(np.append(col_starts, width))
+    row_counts = np.zeros(rows)
+    sums = np.zeros((rows, cols, 4))
+    squares = np.zeros((rows, cols)) if "std" in stats else None
+    lows = np.full((rows, cols), np.inf) if "min" in stats else None
+    highs = np.full((rows, cols), -np.inf) if "max" in stats else None
+
+    for y0, strip in strips:
+        band = strip.shape[0]
+        cell_rows = (np.arange(y0, y0 + band) * rows) // height
+        # Pixel rows are sorted, so each cell row is one contiguous run
+        starts = np.flatnonzero(np.r_[True, cell_rows[1:] != cell_rows[:-1]])
+        targets = cell_rows[starts]
+        per_cell = np.add.reduceat(strip, col_starts, axis=1, dtype=np.float64)
+        sums[targets] += np.add.reduceat(per_cell, starts, axis=0)
+        row_counts[targets] += np.diff(np.append(starts, band))
+
+        if stats:
+            brightness = strip[..., :3] @ _LUMA.astype(np.float32)
+            if squares is not None:
+                sq = np.add.reduceat(np.square(brightness), col_starts, axis=1, dtype=np.float64)
+                squares[targets] += np.add.reduceat(sq, starts, axis=0)
+            if lows is not None:
+                low = np.minimum.reduceat(
+                    np.minimum.reduceat(brightness, col_starts, axis=1), starts
+                )
+                lows[targets] = np.minimum(lows[targets], low)
+            if highs is not None:
+                high = np.maximum.reduceat(
+                    np.maximum.reduceat(brightness, col_starts, axis=1), starts
+                )
+                highs[targets] = np.maximum(highs[targets], high)
+
+    counts = row_counts[:, None] * col_counts[None, :]
+    means = sums / counts[..., None]
+    result = {name: means[..., i] for i, name in enumerate(("red", "green", "blue", "alpha"))}
+    if squares is not None:
+        mean_brightness = means[..., :3] @ _LUMA
+        variance = np.maximum(squares / counts - mean_brightness**2, 0.0)
+        result["brightness_std"] = np.sqrt(variance) / 255.0
+    if lows is not None:
+        result["brightness_min"] = lows / 255.0
+    if highs is not None:
+        result["brightness_max"] = highs / 255.0
+    return result
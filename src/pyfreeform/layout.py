@@ -21,6 +21,8 @@ from __future__ import annotations
 
 from typing import Literal
 
+import numpy as np
+
 from .core.entity import Entity
 from .core.relcoord import RelCoord
 from .core.surface import Surface
@@ -218,25 +220,21 @@ def distribute(
     is_x = axis == "x"
 
     # Measure each entity's size along the distribution axis
-    sizes = []
-    for e in items:
-        rb = e.relative_bounds()
-        sizes.append(rb[2] - rb[0] if is_x else rb[3] - rb[1])
+    bounds = np.array([e.relative_bounds() for e in items])
+    sizes = bounds[:, 2] - bounds[:, 0] if is_x else bounds[:, 3] - bounds[:, 1]
 
-    total_size = sum(sizes)
-    available = (end - start) - total_size
+    available = (end - start) - sizes.sum()
     gap = available / (n - 1) if n > 1 else 0
 
-    # Place sequentially: leading edge at pos, center at pos + size/2
-    pos = start
-    for i, e in enumerate(items):
-        target_center = pos + sizes[i] / 2
+    # Leading edges follow each other: center at leading edge + size/2
+    leading = start + np.concatenate(([0.0], np.cumsum(sizes[:-1] + gap)))
+    targets = (leading + sizes / 2).tolist()
+    for e, target_center in zip(items, targets, strict=True):
         e_center = e.relative_anchor("center")
         if is_x:
             _reposition(e, target_center - e_center.rx, 0)
         else:
             _reposition(e, 0, target_center - e_center.ry)
-        pos += sizes[i] + gap
 
     return items
 
@@ -0,0 +1,323 @@
+"""TileLibrary - Photo mosaics from a library of tile images."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from PIL import Image as PILImage
+
+from .entities.picture import Picture
+from .image.colorspace import lab
+from .image.tiled import accumulate_cells
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from .grid.grid import Grid
+
+# Distance-matrix entries computed per chunk of cells (bounds peak memory)
+_CHUNK_ENTRIES = 1 << 22
+
+
+class TileLibrary:
+    """
+    A searchable library of tile images for photo mosaics.
+
+    Every tile is summarised once by a descriptor: the CIE L*a*b* color
+    of a ``detail x detail`` box-filtered thumbnail (``detail=1`` is the
+    mean color). Descriptors can be saved and reloaded, so a library of
+    thousands of tiles is decoded only once.
+
+    Matching computes the descriptors of all grid cells in one pass and
+    finds each cell's nearest tiles with a chunked matrix product, so no
+    Python loop runs per cell and tile. An optional repetition penalty
+    spreads the choice over more of the library.
+
+    Example:
+        ```python
+        library = TileLibrary.build(Path("tiles").glob("*.jpg"), detail=2)
+        library.save("tiles.npz")
+
+        scene = Scene.from_image("portrait.jpg", grid_size=80)
+        library.place(scene.grid, repeat_penalty=4.0)
+        scene.save("mosaic.svg")
+        ```
+    """
+
+    def __init__(
+        self,
+        paths: list[str],
+        descriptors: np.ndarray,
+        aspects: np.ndarray,
+        detail: int = 1,
+    ) -> None:
+        """
+        Create a library from precomputed descriptors.
+
+        Use ``TileLibrary.build()`` or ``TileLibrary.load()`` instead.
+
+        Args:
+            paths: Tile image paths.
+            descriptors: ``(len(paths), detail * detail * 3)`` Lab descriptors.
+            aspects: Width-to-height ratio of each tile.
+            detail: Thumbnail size the descriptors were computed at.
+
+        Raises:
+            ValueError: If the arrays don't match the paths or detail.
+        """
+        descriptors = np.asarray(descriptors, dtype=np.float64)
+        if descriptors.shape != (len(paths), detail * detail * 3):
+            raise ValueError(
+                f"Expected descriptors of shape {(len(paths), detail * detail * 3)}, "
+                f"got {descriptors.shape}"
+            )
+        if len(aspects) != len(paths):
+            raise ValueError(f"Expected {len(paths)} aspect ratios, got {len(aspects)}")
+        self._paths = list(paths)
+        self._descriptors = descriptors
+        self._aspects = np.asarray(aspects, dtype=np.float64)
+        self._detail = detail
+        self._norms = np.einsum("ij,ij->i", descriptors, descriptors)
+
+    @classmethod
+    def build(cls, paths: Iterable[str | Path], detail: int = 1) -> TileLibrary:
+        """
+        Decode tile images and compute their descriptors.
+
+        JPEG tiles are decoded at reduced scale (Pillow draft mode), which
+        is all a small thumbnail needs.
+
+        Args:
+            paths: Tile image files.
+            detail: Thumbnail size per side. 1 matches on mean color;
+                2-4 also match the rough layout of light and color.
+
+        Returns:
+            A new TileLibrary.
+
+        Raises:
+            ValueError: If detail is less than 1 or there are no tiles.
+        """
+        if detail < 1:
+            raise ValueError(f"detail must be at least 1, got {detail}")
+        names: list[str] = []
+        aspects: list[float] = []
+        thumbnails: list[np.ndarray] = []
+        for path in paths:
+            with PILImage.open(path) as tile:
+                aspects.append(tile.width / tile.height)
+                tile.draft("RGB", (detail * 8, detail * 8))
+                thumbnail = tile.convert("RGB").resize((detail, detail), PILImage.Resampling.BOX)
+                thumbnails.append(np.asarray(thumbnail, dtype=np.float64))
+            names.append(str(path))
+        if not names:
+            raise ValueError("TileLibrary needs at least one tile")
+        rgb = np.stack(thumbnails)
+        return cls(names, _lab_descriptors(rgb), np.array(aspects), detail)
+
+    @classmethod
+    def load(cls, path: str | Path) -> TileLibrary:
+        """
+        Load a library saved with ``save()``.
+
+        Args:
+            path: The ``.npz`` file.
+
+        Returns:
+            The TileLibrary.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                [str(p) for p in data["paths"]],
+                data["descriptors"],
+                data["aspects"],
+                int(data["detail"]),
+            )
+
+    def save(self, path: str | Path) -> None:
+        """
+        Save the descriptors (not the tile images) to an ``.npz`` file.
+
+        Args:
+            path: Destination file.
+        """
+        np.savez_compressed(
+            path,
+            paths=np.array(self._paths, dtype=str),
+            descriptors=self._descriptors,
+            aspects=self._aspects,
+            detail=np.array(self._detail),
+        )
+
+    @property
+    def paths(self) -> list[str]:
+        """Tile image paths, in index order."""
+        return list(self._paths)
+
+    @property
+    def detail(self) -> int:
+        """Thumbnail size of the descriptors."""
+        return self._detail
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __repr__(self) -> str:
+        return f"TileLibrary({len(self)} tiles, detail={self._detail})"
+
+    # --- Matching ---
+
+    def cell_descriptors(self, grid: Grid) -> np.ndarray:
+        """
+        Descriptors of every cell, comparable with the tile descriptors.
+
+        With ``detail=1`` these come from the grid's color layer; finer
+        descriptors average the source image over ``detail x detail``
+        sub-cells in a single streamed pass.
+
+        Args:
+            grid: A grid loaded from an image.
+
+        Returns:
+            ``(rows * cols, detail * detail * 3)`` array, row by row.
+
+        Raises:
+            ValueError: If the grid has no image data.
+        """
+        rows, cols, detail = grid.num_rows, grid.num_columns, self._detail
+        if detail == 1:
+            try:
+                rgb = grid.layer_array("color").astype(np.float64)
+            except KeyError:
+                raise ValueError("Grid has no color layer to match tiles against") from None
+        else:
+            image = grid.source_image
+            if image is None:
+                raise ValueError("Grid was not created from an image — no source image to match")
+            means = accumulate_cells(
+                image.strips(), image.width, image.height, cols * detail, rows * detail, ()
+            )
+            rgb = np.stack([means[name] for name in ("red", "green", "blue")], axis=-1)
+            # (rows*d, cols*d, 3) -> (rows, cols, d, d, 3): one thumbnail per cell
+            rgb = rgb.reshape(rows, detail, cols, detail, 3).transpose(0, 2, 1, 3, 4)
+        return _lab_descriptors(rgb.reshape(rows * cols, detail, detail, 3))
+
+    def nearest(self, descriptors: np.ndarray, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The *k* nearest tiles of each descriptor (Euclidean Lab distance).
+
+        Args:
+            descriptors: ``(n, detail * detail * 3)`` query descriptors.
+            k: Number of neighbours per query (capped at the library size).
+
+        Returns:
+            ``(indices, distances)``, both ``(n, k)``, nearest first.
+        """
+        k = max(1, min(k, len(self)))
+        queries = np.asarray(descriptors, dtype=np.float64)
+        indices = np.empty((len(queries), k), dtype=np.intp)
+        distances = np.empty((len(queries), k))
+        step = max(1, _CHUNK_ENTRIES // len(self))
+        for start in range(0, len(queries), step):
+            chunk = queries[start : start + step]
+            # |q - t|^2 = |q|^2 - 2 q.t + |t|^2, one matrix product per chunk
+            squared = chunk @ self._descriptors.T
+            squared *= -2
+            squared += self._norms
+            squared += np.einsum("ij,ij->i", chunk, chunk)[:, None]
+            if k < len(self):
+                best = np.argpartition(squared, k - 1, axis=1)[:, :k]
+            else:
+                best = np.broadcast_to(np.arange(k), squared.shape).copy()
+            best_squared = np.take_along_axis(squared, best, axis=1)
+            order = np.argsort(best_squared, axis=1)
+            indices[start : start + len(chunk)] = np.take_along_axis(best, order, axis=1)
+            distances[start : start + len(chunk)] = np.sqrt(
+                np.maximum(np.take_along_axis(best_squared, order, axis=1), 0)
+            )
+        return indices, distances
+
+    def match(self, grid: Grid, repeat_penalty: float = 0.0, candidates: int = 8) -> np.ndarray:
+        """
+        Choose a tile for every cell of *grid*.
+
+        Args:
+            grid: A grid loaded from an image.
+            repeat_penalty: Added to a tile's distance (in Lab units) for
+                every time it has already been used. 0 always picks the
+                nearest tile.
+            candidates: Nearest tiles considered per cell when a penalty
+                is set.
+
+        Returns:
+            ``(rows, cols)`` array of tile indices.
+        """
+        descriptors = self.cell_descriptors(grid)
+        if repeat_penalty <= 0:
+            indices, _ = self.nearest(descriptors, 1)
+            return indices[:, 0].reshape(grid.num_rows, grid.num_columns)
+
+        indices, distances = self.nearest(descriptors, candidates)
+        uses = np.zeros(len(self), dtype=np.int64)
+        chosen = np.empty(len(descriptors), dtype=np.intp)
+        for cell, (options, cost) in enumerate(zip(indices, distances, strict=True)):
+            pick = options[np.argmin(cost + repeat_penalty * uses[options])]
+            uses[pick] += 1
+            chosen[cell] = pick
+        return chosen.reshape(grid.num_rows, grid.num_columns)
+
+    def place(
+        self,
+        grid: Grid,
+        assignment: np.ndarray | None = None,
+        *,
+        repeat_penalty: float = 0.0,
+        fit: str = "slice",
+        href: Callable[[str], str] | None = None,
+        z_index: int = 0,
+    ) -> list[Picture]:
+        """
+        Fill every cell of *grid* with its matching tile.
+
+        Tiles become Picture entities, so each tile used is stored once
+        in the SVG and referenced from every cell that shows it.
+
+        Args:
+            grid: A grid loaded from an image.
+            assignment: Tile indices from ``match()`` (computed if omitted).
+            repeat_penalty: Passed to ``match()`` when computing the assignment.
+            fit: How tiles fill cells ("slice", "meet" or "stretch").
+            href: Maps a tile path to the href written to the SVG
+                (e.g. a relative URL). Default: the path itself.
+            z_index: Layer ordering of the pictures.
+
+        Returns:
+            The placed pictures, row by row.
+        """
+        if assignment is None:
+            assignment = self.match(grid, repeat_penalty=repeat_penalty)
+        hrefs = [href(p) for p in self._paths] if href is not None else self._paths
+        pictures = []
+        for cell in grid:
+            index = assignment[cell.row, cell.col]
+            picture = Picture(
+                cell.x,
+                cell.y,
+                cell.width,
+                cell.height,
+                href=hrefs[index],
+                aspect=self._aspects[index],
+                fit=fit,
+                z_index=z_index,
+            )
+            cell.place(picture)
+            pictures.append(picture)
+        return pictures
+
+
+def _lab_descriptors(rgb: np.ndarray) -> np.ndarray:
+    """Flatten ``(n, d, d, 3)`` RGB thumbnails into ``(n, d * d * 3)`` Lab vectors."""
+    L, a, b = lab(rgb[..., 0], rgb[..., 1], rgb[..., 2])
+    return np.stack([L, a, b], axis=-1).reshape(len(rgb), -1)
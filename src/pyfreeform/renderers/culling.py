@@ -0,0 +1,399 @@
+"""Viewport culling - skip content entirely outside the visible area."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..animation.models import DrawAnimation, PropertyAnimation
+from ..color import Color
+
+if TYPE_CHECKING:
+    from ..core.connection import Connection
+    from ..core.entity import Entity
+
+Box = tuple[float, float, float, float]
+
+# Properties whose animation changes how content looks, not where it is
+_PAINT_PROPS = frozenset(
+    {"opacity", "fill", "stroke", "color", "fill_opacity", "stroke_opacity", "stroke_color"}
+)
+
+# Samples along curved connections, and the slack added for what lies between
+_CONNECTION_SAMPLES = 64
+
+_UNBOUNDED: Box = (-math.inf, -math.inf, math.inf, math.inf)
+
+
+def cull(
+    entities: list[Entity],
+    connections: list[Connection],
+    viewbox: tuple[float, float, float, float],
+    animated: bool = False,
+) -> tuple[list[Entity], list[Connection]]:
+    """
+    Keep only the entities and connections that can appear in *viewbox*.
+
+    Bounds are read once per item and tested against the viewBox in a
+    single array operation. Culling is conservative: anything whose
+    extent can't be bounded (such as a path-following animation) is
+    always kept.
+
+    Args:
+        entities: Entities in render order.
+        connections: Connections in render order.
+        viewbox: ``(x, y, width, height)`` of the visible area.
+        animated: Bound each item over its whole animation (for animated
+            output) instead of its static pose.
+
+    Returns:
+        The visible ``(entities, connections)``, order preserved.
+    """
+    x, y, w, h = viewbox
+    visible_box = (x, y, x + w, y + h)
+    entity_boxes, connection_boxes = content_bounds(entities, connections, animated)
+    keep_entities = _intersecting(entity_boxes, visible_box)
+    keep_connections = _intersecting(connection_boxes, visible_box)
+    return (
+        [e for e, keep in zip(entities, keep_entities, strict=True) if keep],
+        [c for c, keep in zip(connections, keep_connections, strict=True) if keep],
+    )
+
+
+def content_bounds(
+    entities: list[Entity],
+    connections: list[Connection],
+    animated: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Visual bounds of entities and connections as ``(n, 4)`` arrays.
+
+    Rows are ``(min_x, min_y, max_x, max_y)``; items that can't be
+    bounded get infinite rows.
+
+    Args:
+        entities: The entities.
+        connections: The connections.
+        animated: Bound each item over its whole animation.
+    """
+    entity_boxes = [animated_bounds(e) if animated else visual_bounds(e) for e in entities]
+    connection_boxes = [_connection_bounds(c, animated) for c in connections]
+    return (
+        np.array(entity_boxes, dtype=np.float64).reshape(-1, 4),
+        np.array(connection_boxes, dtype=np.float64).reshape(-1, 4),
+    )
+
+
+def tile_buckets(
+    boxes: np.ndarray,
+    area: tuple[float, float, float, float],
+    tile_size: tuple[float, float],
+    overlap: float = 0.0,
+) -> list[np.ndarray]:
+    """
+    Assign boxes to the tiles of a regular grid, in one vectorized pass.
+
+    Tile ``(row, col)`` covers ``tile_size`` from the area's corner,
+    widened by *overlap* on every side. Each box is assigned to every
+    tile it touches, without testing every box against every tile.
+
+    Args:
+        boxes: ``(n, 4)`` bounds.
+        area: ``(x, y, width, height)`` the tiles cover.
+        tile_size: ``(width, height)`` of a tile.
+        overlap: Margin each tile extends into its neighbours.
+
+    Returns:
+        One array of box indices per tile, row by row, each in
+        ascending (render) order.
+    """
+    x, y, width, height = area
+    tw, th = tile_size
+    cols, rows = max(1, math.ceil(width / tw)), max(1, math.ceil(height / th))
+    item, tile = _cell_pairs(boxes, (x, y), (tw, th), (cols, rows), overlap)
+    order = np.argsort(tile, kind="stable")
+    sizes = np.bincount(tile, minlength=rows * cols)
+    return np.split(item[order], np.cumsum(sizes)[:-1])
+
+
+def _cell_pairs(
+    boxes: np.ndarray,
+    origin: tuple[float, float],
+    cell_size: tuple[float, float],
+    shape: tuple[int, int],
+    overlap: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Every ``(box index, cell index)`` pair of a box touching a grid cell.
+
+    Cells are numbered row by row in a ``(columns, rows)`` *shape* grid;
+    pairs come out in box order.
+    """
+    x, y = origin
+    tw, th = cell_size
+    cols, rows = shape
+    with np.errstate(invalid="ignore"):
+        # Cell c spans [x + c*tw - overlap, x + (c+1)*tw + overlap]
+        c0 = np.ceil((boxes[:, 0] - x - overlap) / tw - 1)
+        c1 = np.floor((boxes[:, 2] - x + overlap) / tw)
+        r0 = np.ceil((boxes[:, 1] - y - overlap) / th - 1)
+        r1 = np.floor((boxes[:, 3] - y + overlap) / th)
+    c0, c1 = np.clip(c0, 0, cols - 1), np.clip(c1, -1, cols - 1)
+    r0, r1 = np.clip(r0, 0, rows - 1), np.clip(r1, -1, rows - 1)
+    span_cols = np.maximum(c1 - c0 + 1, 0).astype(np.int64)
+    span_rows = np.maximum(r1 - r0 + 1, 0).astype(np.int64)
+    counts = span_cols * span_rows
+
+    # One pair per overlap, generated in box order
+    item = np.repeat(np.arange(len(boxes)), counts)
+    local = np.arange(len(item)) - np.repeat(np.cumsum(counts) - counts, counts)
+    width_rep = np.maximum(np.repeat(span_cols, counts), 1)
+    row = np.repeat(r0.astype(np.int64), counts) + local // width_rep
+    col = np.repeat(c0.astype(np.int64), counts) + local % width_rep
+    return item, row * cols + col
+
+
+def occlude(
+    entities: list[Entity],
+    connections: list[Connection],
+    animated: bool = False,
+) -> tuple[list[Entity], list[Connection]]:
+    """
+    Drop content hidden under a later opaque rectangle.
+
+    Occluders are plain ``Rect`` entities (such as ``add_fill()``
+    backgrounds) with a solid fill at full opacity and no rotation or
+    scale; when *animated*, they must not be animated either. An item is
+    hidden when its visual bounds lie inside an occluder's fill area and
+    the occluder is drawn after it: a higher z_index, or the same one and
+    added later (connections draw before entities of the same z_index).
+
+    Occluders are bucketed into a uniform grid and each item is only
+    tested against the occluders in the cell holding its center, so the
+    pass is linear in the content rather than quadratic. Text is never
+    hidden, since its rendered size depends on the viewer's fonts.
+
+    Args:
+        entities: Entities in render order.
+        connections: Connections in render order.
+        animated: Bound items over their whole animation, and only let
+            unanimated rects occlude.
+
+    Returns:
+        The ``(entities, connections)`` still visible, order preserved.
+    """
+    occluders = [i for i, e in enumerate(entities) if _is_occluder(e, animated)]
+    if not occluders:
+        return entities, connections
+    entity_boxes, connection_boxes = content_bounds(entities, connections, animated)
+    boxes = np.concatenate([entity_boxes, connection_boxes])
+    # Draw order: by z_index, connections first, then addition order
+    z = np.array([e.z_index for e in entities] + [c.z_index for c in connections])
+    kind = np.repeat([1, 0], [len(entities), len(connections)])
+    rank = np.empty(len(boxes), dtype=np.int64)
+    rank[np.lexsort((np.arange(len(boxes)), kind, z))] = np.arange(len(boxes))
+
+    occluders = np.array(occluders)
+    cover = np.array([entities[i].bounds() for i in occluders], dtype=np.float64)
+    origin = cover[:, :2].min(axis=0)
+    extent = cover[:, 2:].max(axis=0) - origin
+    # About the typical occluder size, but never more cells than occluders
+    n = len(occluders)
+    cell = max(
+        float(np.median(np.maximum(cover[:, 2] - cover[:, 0], cover[:, 3] - cover[:, 1]))),
+        math.sqrt(extent[0] * extent[1] / n),
+        max(extent) / n,
+        1e-9,
+    )
+    shape = (max(1, math.ceil(extent[0] / cell)), max(1, math.ceil(extent[1] / cell)))
+    occ, occ_cell = _cell_pairs(cover, tuple(origin), (cell, cell), shape)
+    order = np.argsort(occ_cell, kind="stable")
+    occ = occ[order]
+    counts = np.bincount(occ_cell, minlength=shape[0] * shape[1])
+    starts = np.cumsum(counts) - counts
+
+    # Each item meets the occluders of the cell its center is in
+    with np.errstate(invalid="ignore"):
+        center = (boxes[:, :2] + boxes[:, 2:]) / 2
+        col = np.floor((center[:, 0] - origin[0]) / cell)
+        row = np.floor((center[:, 1] - origin[1]) / cell)
+    candidate = (
+        np.isfinite(boxes).all(axis=1)
+        & (col >= 0)
+        & (col < shape[0])
+        & (row >= 0)
+        & (row < shape[1])
+    )
+    candidate[: len(entities)] &= np.array([type(e).__name__ != "Text" for e in entities])
+    items = np.flatnonzero(candidate)
+    cells = (row[items] * shape[0] + col[items]).astype(np.int64)
+    per_item = counts[cells]
+    item = np.repeat(items, per_item)
+    local = np.arange(len(item)) - np.repeat(np.cumsum(per_item) - per_item, per_item)
+    j = occ[np.repeat(starts[cells], per_item) + local]
+    b, c = boxes[item], cover[j]
+    hidden_pairs = (
+        (c[:, 0] <= b[:, 0])
+        & (c[:, 1] <= b[:, 1])
+        & (c[:, 2] >= b[:, 2])
+        & (c[:, 3] >= b[:, 3])
+        & (rank[occluders[j]] > rank[item])
+    )
+    hidden = np.zeros(len(boxes), dtype=bool)
+    hidden[item[hidden_pairs]] = True
+    return (
+        [e for e, h in zip(entities, hidden[: len(entities)].tolist(), strict=True) if not h],
+        [c for c, h in zip(connections, hidden[len(entities) :].tolist(), strict=True) if not h],
+    )
+
+
+def _is_occluder(entity: Entity, animated: bool) -> bool:
+    """Whether *entity* is an untransformed rect painting a solid, opaque fill."""
+    if type(entity).__name__ != "Rect" or (animated and entity._animations):
+        return False
+    if entity.rotation != 0 or entity.scale_factor != 1.0 or entity.opacity < 1.0:
+        return False
+    if entity.fill_opacity is not None and entity.fill_opacity < 1.0:
+        return False
+    fill = entity._fill
+    # Colors the library doesn't know (e.g. "transparent") may not be opaque
+    return isinstance(fill, Color) and (
+        fill.to_hex().startswith("#") or fill.to_hex() in Color.NAMED_COLORS
+    )
+
+
+def _intersecting(boxes: np.ndarray, rect: Box) -> np.ndarray:
+    """Boolean mask of the boxes that touch *rect*."""
+    b = boxes
+    return (b[:, 0] <= rect[2]) & (b[:, 2] >= rect[0]) & (b[:, 1] <= rect[3]) & (b[:, 3] >= rect[1])
+
+
+def visual_bounds(entity: Entity) -> Box:
+    """
+    Visual bounds of the entity's static pose, as rendered.
+
+    ``Text.bounds()`` measures the string unrotated and in a straight
+    line. Rotated text gets the box around its rotated corners instead,
+    and text laid out along a path (textPath) can't be bounded.
+    """
+    box = entity.bounds(visual=True)
+    if type(entity).__name__ != "Text":
+        return box
+    if entity.has_textpath:
+        return _UNBOUNDED
+    if entity.rotation % 360 == 0:
+        return box
+    center = entity.rotation_center
+    rad = math.radians(entity.rotation)
+    cos_a, sin_a = math.cos(rad), math.sin(rad)
+    xs, ys = [], []
+    for px in (box[0], box[2]):
+        for py in (box[1], box[3]):
+            dx, dy = px - center.x, py - center.y
+            xs.append(center.x + dx * cos_a - dy * sin_a)
+            ys.append(center.y + dx * sin_a + dy * cos_a)
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def animated_bounds(entity: Entity) -> Box:
+    """
+    Visual bounds covering every pose the entity's animations reach.
+
+    Moves widen the box by their full travel; spins and scales grow it to
+    a circle around their pivot that any rotated or scaled pose fits in.
+    Animations of other geometry (a radius, a path to follow) give an
+    unbounded box, so the entity is never culled.
+    """
+    box = visual_bounds(entity)
+    if any(getattr(spec, "_animations", None) for spec in getattr(entity, "_vertex_specs", ())):
+        # Polygon vertices bound to animated entities move with them
+        return _UNBOUNDED
+    if not entity._animations:
+        return box
+
+    x1, y1, x2, y2 = box
+    moved = False
+    pivots: list[tuple[float, float] | None] = []
+    growth = 1.0
+    for anim in entity._animations:
+        if isinstance(anim, DrawAnimation):
+            continue
+        if not isinstance(anim, PropertyAnimation) or not anim.keyframes:
+            return _UNBOUNDED
+        if anim.prop in _PAINT_PROPS:
+            continue
+        values = [kf.value for kf in anim.keyframes]
+        if anim.prop in ("at_rx", "at_ry"):
+            surface = entity._surface
+            if surface is None:
+                return _UNBOUNDED
+            if anim.prop == "at_rx":
+                shifts = [surface.x + v * surface.width - entity.x for v in values]
+                x1, x2 = x1 + min(0.0, *shifts), x2 + max(0.0, *shifts)
+            else:
+                shifts = [surface.y + v * surface.height - entity.y for v in values]
+                y1, y2 = y1 + min(0.0, *shifts), y2 + max(0.0, *shifts)
+            moved = True
+        elif anim.prop in ("rotation", "scale", "scale_factor"):
+            if anim.prop != "rotation":
+                current = entity.scale_factor or 1.0
+                growth = max(growth, *(abs(v) / current for v in values))
+            pivots.append(_pivot(anim, entity))
+        else:
+            return _UNBOUNDED
+
+    if not pivots:
+        return (x1, y1, x2, y2)
+    for pivot in pivots:
+        if pivot is None and moved:
+            # The entity's own center travels with it: every pose lies
+            # within one diagonal of the swept box
+            cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+            radius = math.hypot(x2 - x1, y2 - y1) * (0.5 + growth)
+        else:
+            # Turning about a fixed point keeps the entity inside the
+            # circle through the box corner farthest from it
+            cx, cy = pivot if pivot is not None else entity.rotation_center
+            radius = growth * max(
+                math.hypot(px - cx, py - cy) for px in (x1, x2) for py in (y1, y2)
+            )
+        x1, y1 = min(x1, cx - radius), min(y1, cy - radius)
+        x2, y2 = max(x2, cx + radius), max(y2, cy + radius)
+    return (x1, y1, x2, y2)
+
+
+def _pivot(anim: PropertyAnimation, entity: Entity) -> tuple[float, float] | None:
+    """The fixed pivot of a spin or scale, or None for the entity's own center."""
+    surface = entity._surface
+    if anim.pivot is None or surface is None:
+        return None
+    return (surface.x + anim.pivot.rx * surface.width, surface.y + anim.pivot.ry * surface.height)
+
+
+def _connection_bounds(conn: Connection, animated: bool) -> Box:
+    """Visual bounds of a connection, or unbounded if it follows an animation."""
+    if animated and (
+        conn._animations or any(getattr(end, "_animations", None) for end in (conn.start, conn.end))
+    ):
+        return _UNBOUNDED
+    if conn._shape_kind == "line":
+        points = [conn.start_point, conn.end_point]
+        slack = 0.0
+    else:
+        points = [conn.point_at(i / _CONNECTION_SAMPLES) for i in range(_CONNECTION_SAMPLES + 1)]
+        # Between samples a smooth curve strays at most a small fraction
+        # of its size from the chords
+        span = max(max(p.x for p in points) - min(p.x for p in points), 0.0) + max(
+            max(p.y for p in points) - min(p.y for p in points), 0.0
+        )
+        slack = span / _CONNECTION_SAMPLES
+    # Caps and arrowhead markers scale with the stroke width
+    pad = slack + conn.width * 4
+    return (
+        min(p.x for p in points) - pad,
+        min(p.y for p in points) - pad,
+        max(p.x for p in points) + pad,
+        max(p.y for p in points) + pad,
+    )
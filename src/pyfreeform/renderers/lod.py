@@ -0,0 +1,278 @@
+"""Level of detail - drop or simplify geometry too small to see."""
+
+from __future__ import annotations
+
+import copy
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..color import Color
+from ..core.bezier import clamp_control_points
+from ..core.coord import Coord
+from ..gradient import Gradient
+from .culling import Box, animated_bounds, content_bounds, visual_bounds
+
+if TYPE_CHECKING:
+    from ..core.connection import Connection
+    from ..core.entity import Entity
+    from ..entities.dot_cloud import DotCloud
+    from ..entities.path import Path
+
+# A Path gets one Bézier segment per this many minimum features of its size
+_FEATURES_PER_SEGMENT = 16
+
+# Paths smaller than this many minimum features collapse to a line or a dot
+_COLLAPSE_FEATURES = 4
+
+# Dot de-duplication tracks what was drawn where in buckets this many
+# minimum features across; larger items mark their whole layer
+_DEDUP_BUCKET_FEATURES = 16
+_MAX_STAMP_BUCKETS = 64
+
+
+def simplify(
+    entities: list[Entity],
+    connections: list[Connection],
+    px_per_unit: float,
+    min_feature_px: float,
+    animated: bool = False,
+) -> tuple[list[Entity], list[Connection]]:
+    """
+    Reduce content to the detail visible at an output resolution.
+
+    Scene entities are never modified: simplified items are copies, or
+    new entities standing in for the originals.
+
+    - Entities and connections smaller than *min_feature_px* in both
+      directions are dropped.
+    - Paths get fewer Bézier segments the smaller they are on screen;
+      tiny open paths become a ``Line`` between their ends and tiny
+      filled closed paths a ``Dot``.
+    - Dots of the same color, size and layer whose centers fall within
+      one minimum feature of each other are drawn once. DotClouds drop
+      their sub-feature dots and coinciding duplicates the same way.
+
+    Animated entities are left untouched when *animated* is set, since
+    their size on screen changes while they play.
+
+    Args:
+        entities: Entities in render order.
+        connections: Connections in render order.
+        px_per_unit: Output pixels per scene unit.
+        min_feature_px: Smallest detail worth drawing, in output pixels.
+        animated: Whether the output plays entity animations.
+
+    Returns:
+        The simplified ``(entities, connections)``, order preserved.
+    """
+    feature = min_feature_px / px_per_unit
+    entity_boxes, connection_boxes = content_bounds([], connections, animated)
+    entity_boxes = np.array(
+        [_rough_bounds(e, animated) for e in entities], dtype=np.float64
+    ).reshape(-1, 4)
+    entity_size = np.maximum(
+        entity_boxes[:, 2] - entity_boxes[:, 0], entity_boxes[:, 3] - entity_boxes[:, 1]
+    )
+    connection_size = np.maximum(
+        connection_boxes[:, 2] - connection_boxes[:, 0],
+        connection_boxes[:, 3] - connection_boxes[:, 1],
+    )
+
+    result: list[Entity] = []
+    stamps = _DrawStamps(_DEDUP_BUCKET_FEATURES * feature)
+    # Dot look and place -> draw position of its latest copy
+    drawn_dots: dict[tuple, int] = {}
+    for entity, box, size in zip(
+        entities, entity_boxes.tolist(), entity_size.tolist(), strict=True
+    ):
+        still = not (animated and entity._animations)
+        if still and size < feature:
+            continue
+        kind = type(entity).__name__
+        if still and kind == "Dot":
+            # Same look, same layer, same pixel, and nothing drawn over
+            # the first copy since: the second one changes nothing
+            key = (
+                round((box[0] + box[2]) / 2 / feature),
+                round((box[1] + box[3]) / 2 / feature),
+                round(size / feature),
+                entity.color,
+                entity.opacity,
+                entity.z_index,
+            )
+            previous = drawn_dots.get(key)
+            if previous is not None and stamps.latest(box, entity.z_index) <= previous:
+                continue
+            drawn_dots[key] = len(result)
+        elif still and kind == "Path":
+            entity = _simplify_path(entity, box, size, feature)
+        elif still and kind == "DotCloud":
+            entity = _simplify_cloud(entity, feature)
+        stamps.mark(box, entity.z_index, len(result))
+        result.append(entity)
+
+    kept = [
+        c for c, size in zip(connections, connection_size.tolist(), strict=True) if size >= feature
+    ]
+    return result, kept
+
+
+class _DrawStamps:
+    """
+    Which content was drawn last over each area, per layer.
+
+    Space is split into square buckets; each remembers the draw position
+    of the latest item whose box touches it. Items too large to stamp
+    bucket by bucket mark their whole layer instead. Buckets are coarse,
+    so an area may look drawn over when it wasn't, never the reverse.
+    """
+
+    def __init__(self, bucket: float) -> None:
+        self._bucket = bucket
+        self._stamps: dict[tuple[int, int, int], int] = {}
+        self._covered: dict[int, int] = {}
+        self._top: dict[int, int] = {}
+
+    def mark(self, box: Box, z: int, position: int) -> None:
+        """Record that the item at draw *position* covers *box* in layer *z*."""
+        self._top[z] = position
+        cells = self._cells(box)
+        if cells is None:
+            self._covered[z] = position
+            return
+        for i, j in cells:
+            self._stamps[z, i, j] = position
+
+    def latest(self, box: Box, z: int) -> int:
+        """Draw position of the latest item touching *box* in layer *z*, or -1."""
+        cells = self._cells(box)
+        if cells is None:
+            return self._top.get(z, -1)
+        stamps = self._stamps
+        touching = max((stamps.get((z, i, j), -1) for i, j in cells), default=-1)
+        return max(touching, self._covered.get(z, -1))
+
+    def _cells(self, box: Box) -> list[tuple[int, int]] | None:
+        """Buckets touched by *box*, or None if there are too many."""
+        if not all(map(math.isfinite, box)):
+            return None
+        size = self._bucket
+        i1, j1 = math.floor(box[0] / size), math.floor(box[1] / size)
+        i2, j2 = math.floor(box[2] / size), math.floor(box[3] / size)
+        if (i2 - i1 + 1) * (j2 - j1 + 1) > _MAX_STAMP_BUCKETS:
+            return None
+        return [(i, j) for i in range(i1, i2 + 1) for j in range(j1, j2 + 1)]
+
+
+def _rough_bounds(entity: Entity, animated: bool) -> Box:
+    """
+    Visual bounds, or a cheap box around them for untransformed Paths.
+
+    Exact Path bounds solve for every segment's extrema. A Bézier curve
+    lies inside the box of its control points, which is close enough to
+    judge its size on screen and never too small.
+    """
+    if animated and (entity._animations or getattr(entity, "_vertex_specs", None)):
+        return animated_bounds(entity)
+    if type(entity).__name__ != "Path" or entity.rotation != 0 or entity.scale_factor != 1.0:
+        return visual_bounds(entity)
+    points = [p for segment in entity._bezier_segments for p in segment]
+    if not points:
+        return entity.bounds(visual=True)
+    pad = entity.width / 2
+    return (
+        min(p.x for p in points) - pad,
+        min(p.y for p in points) - pad,
+        max(p.x for p in points) + pad,
+        max(p.y for p in points) + pad,
+    )
+
+
+def _simplify_path(
+    path: Path,
+    box: list[float],
+    size: float,
+    feature: float,
+) -> Entity:
+    """A Path with as many segments as its size on screen needs."""
+    from ..entities.dot import Dot
+    from ..entities.line import Line
+
+    if size < _COLLAPSE_FEATURES * feature:
+        if not path.closed:
+            start, end = path.point_at(0.0), path.point_at(1.0)
+            return Line(
+                start.x,
+                start.y,
+                end.x,
+                end.y,
+                width=path.width * path.scale_factor,
+                color=path._color if isinstance(path._color, Gradient) else path.color,
+                z_index=path.z_index,
+                cap=path.cap,
+                start_cap=path.start_cap,
+                end_cap=path.end_cap,
+                opacity=path.opacity if path.stroke_opacity is None else path.stroke_opacity,
+            )
+        if isinstance(path._fill, Color):
+            return Dot(
+                (box[0] + box[2]) / 2,
+                (box[1] + box[3]) / 2,
+                radius=size / 2,
+                color=path.fill,
+                z_index=path.z_index,
+                opacity=path.opacity if path.fill_opacity is None else path.fill_opacity,
+            )
+
+    segments = path._bezier_segments
+    # The transform pivots on the path's own midpoint, so merging
+    # segments of a rotated or scaled path would move it
+    if path.rotation != 0 or path.scale_factor != 1.0:
+        return path
+    target = max(1, math.ceil(size / (_FEATURES_PER_SEGMENT * feature)))
+    group = math.ceil(len(segments) / target)
+    if group <= 1:
+        return path
+    simplified = copy.copy(path)
+    simplified._bezier_segments = [
+        _merge_segments(segments[i : i + group]) for i in range(0, len(segments), group)
+    ]
+    return simplified
+
+
+def _merge_segments(segments: list) -> tuple:
+    """
+    One cubic standing in for consecutive Hermite-fitted cubics.
+
+    Each fitted segment's control points are the end tangents scaled by
+    its parameter span; the merged segment spans ``len(segments)`` times
+    as much, so its end tangents are scaled up by the same factor.
+    """
+    n = len(segments)
+    p0, cp1 = segments[0][0], segments[0][1]
+    cp2, p3 = segments[-1][2], segments[-1][3]
+    cp1 = Coord(p0.x + (cp1.x - p0.x) * n, p0.y + (cp1.y - p0.y) * n)
+    cp2 = Coord(p3.x + (cp2.x - p3.x) * n, p3.y + (cp2.y - p3.y) * n)
+    cp1, cp2 = clamp_control_points(p0, cp1, cp2, p3)
+    return (p0, cp1, cp2, p3)
+
+
+def _simplify_cloud(cloud: DotCloud, feature: float) -> DotCloud:
+    """A DotCloud without its sub-feature dots and coinciding duplicates."""
+    # The transform pivots on the dots' joint center, which dropping dots would move
+    if not len(cloud) or cloud.rotation != 0 or cloud.scale_factor != 1.0:
+        return cloud
+    radii = cloud._radii
+    visible = 2 * radii >= feature
+    # Quantize center and size to the feature; keep one dot per cell
+    keys = np.column_stack([np.round(cloud._offsets / feature), np.round(2 * radii / feature)])
+    _, first = np.unique(keys[visible], axis=0, return_index=True)
+    keep = np.flatnonzero(visible)[np.sort(first)]
+    if len(keep) == len(cloud):
+        return cloud
+    simplified = copy.copy(cloud)
+    simplified._offsets = cloud._offsets[keep]
+    simplified._radii = radii[keep]
+    return simplified
@@ -45,7 +45,7 @@ from .smil_reactive import (
     reactive_connection_anims,
     reactive_polygon_anims,
 )
-from .static import SVGRenderer, _build_svg_transform
+from .static import SVGRenderer, _assemble, _build_svg_transform
 
 if TYPE_CHECKING:
     from ...core.connection import Connection
@@ -302,6 +302,8 @@ class SMILRenderer(SVGRenderer):
     ``<animateMotion>`` children.
     """
 
+    animated = True
+
     # ------------------------------------------------------------------
     # Animation helpers
     # ------------------------------------------------------------------
@@ -1220,7 +1222,13 @@ class SMILRenderer(SVGRenderer):
     # Scene rendering with fill-layer batching
     # ------------------------------------------------------------------
 
-    def render_scene(self, scene: Scene) -> str:
+    def _render_document(
+        self,
+        scene: Scene,
+        all_entities: list[Entity],
+        all_connections: list[Connection],
+        tile: tuple[float, float, float, float] | None = None,
+    ) -> str:
         """Render a complete animated SVG with fill-layer batching.
 
         Extends the parent renderer with a pre-scan pass that detects
@@ -1229,9 +1237,6 @@ class SMILRenderer(SVGRenderer):
         single ``<animate>``, reducing the total number of SMIL animation
         elements the browser must evaluate.
         """
-        all_entities = scene.entities
-        all_connections = scene._collect_connections()
-
         # --- Pre-scan: identify batchable fill layers ---
         entity_fill_opts: dict[int, FillLayerOpt] = {}
         timing_groups: dict[tuple, list[tuple[Entity, FillLayerOpt]]] = {}
@@ -1259,12 +1264,10 @@ class SMILRenderer(SVGRenderer):
         # Initialize batch state for _build_layered_svg to detect
         self._batch_pending: dict[int, list[_PendingOverlay]] = {eid: [] for eid in batched_ids}
 
-        lines = self._build_svg_header(scene, all_entities, all_connections)
+        lines = self._build_svg_header(scene, all_entities, all_connections, tile)
 
         # --- Render entities and connections ---
-        renderables: list[tuple[int, str]] = []
-        renderables.extend((c.z_index, self.render_connection(c)) for c in all_connections)
-        renderables.extend((e.z_index, self.render_entity(e)) for e in all_entities)
+        layers = self._render_layers(all_entities, all_connections)
 
         # --- Emit batched overlay groups ---
         for group_key, members in active_batches.items():
@@ -1286,16 +1289,9 @@ class SMILRenderer(SVGRenderer):
                         i,
                         overlays_by_index[i],
                     )
-                    renderables.append((z_idx, overlay_svg))
+                    layers.setdefault(z_idx, []).append(f"  {overlay_svg}")
 
         # Clean up batch state
         del self._batch_pending
 
-        # --- Sort and assemble ---
-        renderables.sort(key=lambda x: x[0])
-        for _, svg in renderables:
-            if svg:
-                lines.append(f"  {svg}")
-
-        lines.append("</svg>")
-        return "\n".join(lines)
+        return _assemble(lines, layers)
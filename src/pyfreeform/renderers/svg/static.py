@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+import itertools
 from typing import TYPE_CHECKING
 
 from ...config.caps import svg_cap_and_marker_attrs
@@ -14,16 +16,20 @@ from ...core.svg_utils import (
     xml_escape,
 )
 from ..base import Renderer
+from ..culling import cull, occlude
+from ..lod import simplify
 
 if TYPE_CHECKING:
     from ...core.connection import Connection
     from ...core.entity import Entity
     from ...entities.curve import Curve
     from ...entities.dot import Dot
+    from ...entities.dot_cloud import DotCloud
     from ...entities.ellipse import Ellipse
     from ...entities.entity_group import EntityGroup
     from ...entities.line import Line
     from ...entities.path import Path
+    from ...entities.picture import Picture
     from ...entities.point import Point
     from ...entities.polygon import Polygon
     from ...entities.rect import Rect
@@ -39,18 +45,124 @@ class SVGRenderer(Renderer):
     use :class:`SMILRenderer` for animated SVG output.
     """
 
+    #: Whether output plays entity animations (widens viewport culling)
+    animated = False
+
+    def __init__(
+        self,
+        *,
+        min_feature_px: float | None = None,
+        output_scale: float = 1.0,
+        cull_occluded: bool = False,
+    ) -> None:
+        """
+        Create a renderer.
+
+        Args:
+            min_feature_px: Level of detail: drop or simplify geometry
+                smaller than this many output pixels. None (default)
+                renders everything exactly.
+            output_scale: Size the SVG will be displayed at, relative
+                to its own width and height (0.1 for a 2000 px scene
+                shown as a 200 px thumbnail). Only used for level of
+                detail.
+            cull_occluded: Skip content hidden under a later opaque,
+                untransformed rect (such as a cell's ``add_fill()``).
+
+        Raises:
+            ValueError: If min_feature_px is negative or output_scale
+                is not positive.
+        """
+        self._set_options(min_feature_px, output_scale, cull_occluded)
+
+    def with_options(
+        self,
+        *,
+        min_feature_px: float | None = None,
+        output_scale: float | None = None,
+        cull_occluded: bool | None = None,
+    ) -> SVGRenderer:
+        """
+        A copy of this renderer with some options replaced.
+
+        Options left as None keep this renderer's setting; the renderer
+        itself is not changed.
+
+        Args:
+            min_feature_px: Level of detail, as in ``__init__``.
+            output_scale: Display size, as in ``__init__``.
+            cull_occluded: Occlusion culling, as in ``__init__``.
+
+        Returns:
+            The configured copy.
+
+        Raises:
+            ValueError: If min_feature_px is negative or output_scale
+                is not positive.
+        """
+        renderer = copy.copy(self)
+        renderer._set_options(
+            self.min_feature_px if min_feature_px is None else min_feature_px,
+            self.output_scale if output_scale is None else output_scale,
+            self.cull_occluded if cull_occluded is None else cull_occluded,
+        )
+        return renderer
+
+    def _set_options(
+        self,
+        min_feature_px: float | None,
+        output_scale: float,
+        cull_occluded: bool,
+    ) -> None:
+        """Validate and store the rendering options."""
+        if min_feature_px is not None and min_feature_px < 0:
+            raise ValueError(f"min_feature_px must be non-negative, got {min_feature_px}")
+        if output_scale <= 0:
+            raise ValueError(f"output_scale must be positive, got {output_scale}")
+        self.min_feature_px = min_feature_px
+        self.output_scale = output_scale
+        self.cull_occluded = cull_occluded
+
     # ------------------------------------------------------------------
     # Scene rendering
     # ------------------------------------------------------------------
 
+    def _visible_content(self, scene: Scene) -> tuple[list[Entity], list[Connection]]:
+        """Entities and connections to render, after culling and level of detail."""
+        entities = scene.entities
+        connections = scene._collect_connections()
+        if scene._viewbox is not None:
+            entities, connections = cull(
+                entities, connections, scene._viewbox, animated=self.animated
+            )
+        if self.cull_occluded:
+            entities, connections = occlude(entities, connections, animated=self.animated)
+        if self.min_feature_px:
+            # Output pixels per scene unit: the viewBox is stretched to the scene width
+            px_per_unit = self.output_scale
+            if scene._viewbox is not None and scene._viewbox[2] > 0:
+                px_per_unit *= scene._width / scene._viewbox[2]
+            entities, connections = simplify(
+                entities, connections, px_per_unit, self.min_feature_px, animated=self.animated
+            )
+        return entities, connections
+
     def _build_svg_header(
         self,
         scene: Scene,
         all_entities: list[Entity],
         all_connections: list[Connection],
+        tile: tuple[float, float, float, float] | None = None,
     ) -> list[str]:
         """Build SVG preamble: XML declaration, ``<svg>`` open, ``<defs>``, background."""
-        if scene._viewbox is not None:
+        if tile is not None:
+            vb_x, vb_y, vb_w, vb_h = tile
+            svg_open = (
+                f'<svg xmlns="http://www.w3.org/2000/svg" '
+                f'width="{svg_num(vb_w)}" height="{svg_num(vb_h)}" '
+                f'viewBox="{svg_num(vb_x)} {svg_num(vb_y)} {svg_num(vb_w)} {svg_num(vb_h)}">'
+            )
+        elif scene._viewbox is not None:
             vb_x, vb_y, vb_w, vb_h = scene._viewbox
             display_h = vb_h * scene._width / vb_w if vb_w > 0 else scene._height
             svg_open = (
@@ -70,21 +182,23 @@ class SVGRenderer(Renderer):
             svg_open,
         ]
 
-        # Definitions (gradients, markers, path defs)
+        # Definitions (gradients, markers, path defs, picture symbols)
         markers = self._collect_markers(all_entities, all_connections)
         path_defs = self._collect_path_defs(all_entities)
         gradients = self._collect_gradients(all_entities, all_connections)
-        if markers or path_defs or gradients:
+        symbols = self._collect_symbols(all_entities)
+        if markers or path_defs or gradients or symbols:
             lines.append("  <defs>")
             lines.extend(f"    {svg}" for svg in gradients.values())
             lines.extend(f"    {svg}" for svg in markers.values())
             lines.extend(f"    {svg}" for svg in path_defs.values())
+            lines.extend(f"    {svg}" for svg in symbols.values())
             lines.append("  </defs>")
 
         # Background
         if scene._background:
-            if scene._viewbox is not None:
-                vb_x, vb_y, vb_w, vb_h = scene._viewbox
+            if tile is not None or scene._viewbox is not None:
+                vb_x, vb_y, vb_w, vb_h = tile or scene._viewbox
                 lines.append(
                     f'  <rect x="{vb_x}" y="{vb_y}" '
                     f'width="{vb_w}" height="{vb_h}" '
@@ -97,25 +211,44 @@ class SVGRenderer(Renderer):
 
     def render_scene(self, scene: Scene) -> str:
         """Render a complete SVG document."""
-        all_entities = scene.entities
-        all_connections = scene._collect_connections()
+        all_entities, all_connections = self._visible_content(scene)
+        return self._render_document(scene, all_entities, all_connections)
 
-        lines = self._build_svg_header(scene, all_entities, all_connections)
-
-        # Collect all renderables with z_index
-        renderables: list[tuple[int, str]] = []
-        renderables.extend((c.z_index, self.render_connection(c)) for c in all_connections)
-        renderables.extend((e.z_index, self.render_entity(e)) for e in all_entities)
-
-        # Sort by z_index (stable sort preserves add-order for ties)
-        renderables.sort(key=lambda x: x[0])
-
-        for _, svg in renderables:
+    def _render_document(
+        self,
+        scene: Scene,
+        all_entities: list[Entity],
+        all_connections: list[Connection],
+        tile: tuple[float, float, float, float] | None = None,
+    ) -> str:
+        """Render the given content of *scene*, optionally as one 1:1 tile of it."""
+        lines = self._build_svg_header(scene, all_entities, all_connections, tile)
+        layers = self._render_layers(all_entities, all_connections)
+        return _assemble(lines, layers)
+
+    def _render_layers(
+        self,
+        all_entities: list[Entity],
+        all_connections: list[Connection],
+    ) -> dict[int, list[str]]:
+        """
+        Render content into one bucket of SVG lines per z_index.
+
+        Within a bucket, connections come first, then entities, each in
+        the order given, the same order a stable sort by z_index gives.
+        Scenes use only a handful of layers, so filling buckets in one
+        pass replaces sorting every rendered element.
+        """
+        layers: dict[int, list[str]] = {}
+        for conn in all_connections:
+            svg = self.render_connection(conn)
             if svg:
-                lines.append(f"  {svg}")
-
-        lines.append("</svg>")
-        return "\n".join(lines)
+                layers.setdefault(conn.z_index, []).append(f"  {svg}")
+        for entity in all_entities:
+            svg = self.render_entity(entity)
+            if svg:
+                layers.setdefault(entity.z_index, []).append(f"  {svg}")
+        return layers
 
     # ------------------------------------------------------------------
     # Defs collection
@@ -131,6 +264,9 @@ class SVGRenderer(Renderer):
     def _collect_path_defs(self, entities: list[Entity]) -> dict[str, str]:
         return {pid: svg for entity in entities for pid, svg in entity.get_required_paths()}
 
+    def _collect_symbols(self, entities: list[Entity]) -> dict[str, str]:
+        return {sid: svg for entity in entities for sid, svg in entity.get_required_symbols()}
+
     def _collect_gradients(
         self, entities: list[Entity], connections: list[Connection]
     ) -> dict[str, str]:
@@ -155,6 +291,14 @@ class SVGRenderer(Renderer):
             f"{_build_svg_transform(dot)} />"
         )
 
+    def render_dotcloud(self, cloud: DotCloud) -> str:
+        """Render DotCloud as one SVG ``<path>`` of circles."""
+        return (
+            f'<path d="{cloud.to_path_d()}" fill="{cloud.color}"'
+            f"{opacity_attr(cloud.opacity)}"
+            f"{_build_svg_transform(cloud)} />"
+        )
+
     def render_rect(self, rect: Rect) -> str:
         """Render Rect as SVG ``<rect>``."""
         return (
@@ -304,6 +448,15 @@ class SVGRenderer(Renderer):
         parts.append("</g>")
         return "\n".join(parts)
 
+    def render_picture(self, picture: Picture) -> str:
+        """Render Picture as SVG ``<use>`` of its shared ``<symbol>``."""
+        return (
+            f'<use href="#{picture.symbol_id}" x="{svg_num(picture.x)}" y="{svg_num(picture.y)}"'
+            f' width="{svg_num(picture.width)}" height="{svg_num(picture.height)}"'
+            f"{opacity_attr(picture.opacity)}"
+            f"{_build_svg_transform(picture)} />"
+        )
+
     def render_point(self, point: Point) -> str:
         """Point is invisible — returns empty string."""
         return ""
@@ -340,6 +493,17 @@ class SVGRenderer(Renderer):
         )
 
 
+# ======================================================================
+# Shared helper: document assembly
+# ======================================================================
+
+
+def _assemble(header: list[str], layers: dict[int, list[str]]) -> str:
+    """Join the header and the z_index buckets, lowest layer first, into a document."""
+    body = itertools.chain.from_iterable(layers[z] for z in sorted(layers))
+    return "\n".join(itertools.chain(header, body, ("</svg>",)))
+
+
 # ======================================================================
 # Shared helper: SVG transform attribute
 # ======================================================================
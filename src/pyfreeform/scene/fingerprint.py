@@ -0,0 +1,161 @@
+"""Scene fingerprints - a stable hash of everything that affects the output."""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import hashlib
+import itertools
+import marshal
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .. import __version__
+from ..color import Color
+from ..core.connection import Connection
+from ..core.coord import Coord
+from ..core.entity import Entity
+from ..core.relcoord import RelCoord
+from ..core.surface import Surface
+
+if TYPE_CHECKING:
+    from ..renderers import Renderer
+    from .scene import Scene
+
+# Entity and connection attributes that never reach the output: back
+# references (encoded separately), metadata and lazily filled caches
+_SKIPPED = ("_surface", "_connections", "_data", "_resolving", "_bounds_memo", "_control")
+
+_ATOMS = frozenset({type(None), bool, int, float, str})
+
+# Marshal format 2 writes no back-references, so equal values give equal bytes
+_MARSHAL_VERSION = 2
+
+# Items encoded per marshal call
+_CHUNK = 1024
+
+
+class UnstableState(Exception):
+    """Raised for state with no stable encoding (functions, unknown objects)."""
+
+
+def scene_fingerprint(scene: Scene, renderer: Renderer) -> str:
+    """
+    Hash of everything that decides what *renderer* writes for *scene*.
+
+    Covers the scene's size, background and viewBox, its grids'
+    geometry, every entity's and connection's state (animations
+    included) in render order, the renderer's type and options, and
+    the library version. Cached values, user data and object identities
+    are left out, so the same script gives the same fingerprint in
+    every run.
+
+    Args:
+        scene: The scene to hash.
+        renderer: The renderer the output would come from.
+
+    Returns:
+        A hex digest.
+
+    Raises:
+        UnstableState: If some state, such as a function, can't be
+            encoded the same way in another run.
+    """
+    entities = scene.entities
+    connections = scene._collect_connections()
+    # Entities are referred to by render position, never by identity
+    refs: dict[int, int | str] = {id(item): i for i, item in enumerate(entities)}
+    refs.update((id(conn), -1 - i) for i, conn in enumerate(connections))
+
+    digest = hashlib.blake2b(digest_size=16)
+    header = [
+        __version__,
+        _qualname(renderer),
+        _encode(vars(renderer), refs),
+        _encode((scene._width, scene._height, scene._background, scene._viewbox), refs),
+    ]
+    for grid in scene._grids:
+        header.append(
+            _encode(
+                (grid._cols, grid._rows, grid._cell_width, grid._cell_height, grid._origin), refs
+            )
+        )
+    digest.update(marshal.dumps(tuple(header), _MARSHAL_VERSION))
+    items = itertools.chain(entities, connections)
+    while chunk := tuple(_encode_item(item, refs) for item in itertools.islice(items, _CHUNK)):
+        digest.update(marshal.dumps(chunk, _MARSHAL_VERSION))
+    return digest.hexdigest()
+
+
+def _encode_item(item: Entity | Connection, refs: dict[int, int | str]) -> tuple:
+    """An entity's or connection's own state, with its surface's frame."""
+    state = vars(item).copy()
+    surface = state.get("_surface")
+    for name in _SKIPPED:
+        state.pop(name, None)
+    values = [value if type(value) in _ATOMS else _encode(value, refs) for value in state.values()]
+    return (_qualname(item), _surface_frame(surface), tuple(state), tuple(values))
+
+
+def _encode(value: Any, refs: dict[int, int | str]) -> Any:
+    """Nested tuples of plain values that marshal the same in every run."""
+    kind = type(value)
+    if kind in _ATOMS:
+        return value
+    # Exact-type checks first: these make up most entity state
+    if kind is Coord:
+        return (value.x, value.y)
+    if kind is Color:
+        return ("Color", value.to_hex())
+    if kind is list or kind is tuple:
+        return tuple([_encode(v, refs) for v in value])
+    if isinstance(value, RelCoord):
+        return (value.rx, value.ry)
+    if isinstance(value, Entity | Connection):
+        ref = refs.get(id(value))
+        if ref is not None:
+            return ("ref", ref)
+        # Not drawn by the scene itself (group children, path guides)
+        refs[id(value)] = "cycle"
+        encoded = _encode_item(value, refs)
+        del refs[id(value)]
+        return encoded
+    if isinstance(value, Surface):
+        return _surface_frame(value)
+    if isinstance(value, list | tuple):
+        return tuple(_encode(v, refs) for v in value)
+    if isinstance(value, dict):
+        return tuple((_encode(k, refs), _encode(v, refs)) for k, v in value.items())
+    if isinstance(value, set | frozenset):
+        return tuple(sorted(repr(_encode(v, refs)) for v in value))
+    if isinstance(value, np.ndarray):
+        data = np.ascontiguousarray(value).tobytes()
+        return (value.dtype.str, value.shape, hashlib.blake2b(data, digest_size=16).hexdigest())
+    if isinstance(value, np.generic):
+        return _encode(value.item(), refs)
+    if isinstance(value, enum.Enum):
+        return (_qualname(value), value.name)
+    if isinstance(value, bool | int | float | str):
+        return (_qualname(value), repr(value))
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (
+            _qualname(value),
+            tuple(_encode(getattr(value, f.name), refs) for f in dataclasses.fields(value)),
+        )
+    if callable(value) or not hasattr(value, "__dict__"):
+        raise UnstableState(f"Cannot fingerprint {type(value).__name__} value {value!r}")
+    return (_qualname(value), _encode(vars(value), refs))
+
+
+def _surface_frame(surface: Surface | None) -> tuple | None:
+    """Where relative positions and sizes resolve against."""
+    if surface is None:
+        return None
+    frame = (surface._x, surface._y, surface._width, surface._height)
+    return (type(surface).__name__, *map(float, frame))
+
+
+def _qualname(value: Any) -> str:
+    kind = type(value)
+    return f"{kind.__module__}.{kind.__qualname__}"
@@ -0,0 +1,166 @@
+"""Dead-entity detection - entities that cannot affect the output."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ..animation.models import PropertyAnimation
+from ..color import Color
+from ..core.coord import Coord
+from ..renderers.culling import animated_bounds
+
+if TYPE_CHECKING:
+    from ..core.entity import Entity
+
+# Why an entity was pruned, in the order the checks run
+PRUNE_REASONS = ("transparent", "zero_size", "off_scene")
+
+# Animated properties that can make an invisible entity appear
+_REVIVING_PROPS = frozenset(
+    {
+        "opacity",
+        "fill_opacity",
+        "stroke_opacity",
+        "fill",
+        "stroke",
+        "color",
+        "r",
+        "rx",
+        "ry",
+        "width",
+        "height",
+        "stroke_width",
+        "font_size",
+        "scale",
+        "scale_factor",
+    }
+)
+
+
+def dead_reason(entity: Entity, area: tuple[float, float, float, float]) -> str | None:
+    """
+    Why *entity* cannot show up in the output, or None if it can.
+
+    An entity is dead when it is fully transparent (zero opacity, or no
+    paint on any of its parts), has zero size (a zero radius, width or
+    height, an empty text or group, a zero-width stroke with nothing
+    else drawn), or lies entirely outside *area*. Entities whose
+    animations bring a missing opacity, paint or size back are kept,
+    and off-area checks cover every pose their animations reach.
+
+    Args:
+        entity: The entity to check.
+        area: ``(min_x, min_y, max_x, max_y)`` of the visible area.
+
+    Returns:
+        One of ``PRUNE_REASONS``, or None.
+    """
+    reason = _invisible_reason(entity)
+    if reason is not None and not _revived(entity):
+        return reason
+    x1, y1, x2, y2 = animated_bounds(entity)
+    if x2 < area[0] or x1 > area[2] or y2 < area[1] or y1 > area[3]:
+        return "off_scene"
+    return None
+
+
+def _invisible_reason(entity: Entity) -> str | None:
+    """Transparency or zero-size reason, ignoring animations."""
+    opacity = getattr(entity, "opacity", 1.0)
+    if opacity == 0:
+        return "transparent"
+    parts = _parts(entity, opacity)
+    if parts is not None:
+        painted = [(part_opacity, width) for paint, part_opacity, width in parts if _paints(paint)]
+        if not any(part_opacity > 0 for part_opacity, _ in painted):
+            return "transparent"
+        if not any(part_opacity > 0 and width > 0 for part_opacity, width in painted):
+            return "zero_size"
+    if entity.scale_factor == 0 or _empty(entity):
+        return "zero_size"
+    return None
+
+
+def _parts(entity: Entity, opacity: float) -> list[tuple[Any, float, float]] | None:
+    """``(paint, opacity, stroke width)`` of each drawn part, or None if unknown."""
+    kind = type(entity).__name__
+
+    def own(value: float | None) -> float:
+        return opacity if value is None else value
+
+    if kind in ("Rect", "Ellipse", "Polygon"):
+        return [
+            (entity._fill, own(entity.fill_opacity), 1.0),
+            (entity._stroke, own(entity.stroke_opacity), entity.stroke_width),
+        ]
+    if kind == "Path":
+        parts = [(entity._color, own(entity.stroke_opacity), entity.width)]
+        if entity.closed:
+            parts.append((entity._fill, own(entity.fill_opacity), 1.0))
+        return parts
+    if kind in ("Line", "Curve"):
+        return [(entity._color, opacity, entity.width)]
+    if kind in ("Dot", "Text", "DotCloud"):
+        return [(entity._color, opacity, 1.0)]
+    return None
+
+
+def _paints(paint: Any) -> bool:
+    """Whether a fill or stroke value puts any color down."""
+    if paint is None:
+        return False
+    return not (isinstance(paint, Color) and paint.to_hex() in ("none", "transparent"))
+
+
+def _empty(entity: Entity) -> bool:
+    """Whether the entity's own geometry has no area to draw."""
+    kind = type(entity).__name__
+    if kind == "Dot":
+        return entity.radius == 0
+    if kind == "Ellipse":
+        return entity.rx == 0 or entity.ry == 0
+    if kind == "Rect":
+        return entity.width == 0 or entity.height == 0
+    if kind == "Text":
+        return not str(entity.content) or entity.font_size == 0
+    if kind == "EntityGroup":
+        return not entity._children
+    if kind == "DotCloud":
+        return len(entity) == 0
+    if kind == "Line":
+        # Round and square caps (and arrowheads) still draw a zero-length line
+        caps = (entity.start_cap or entity.cap, entity.end_cap or entity.cap)
+        return entity.start == entity.end and caps == ("butt", "butt")
+    return False
+
+
+def _revived(entity: Entity) -> bool:
+    """Whether an animation brings back opacity, paint or size."""
+    return any(
+        isinstance(anim, PropertyAnimation)
+        and anim.prop in _REVIVING_PROPS
+        and any(kf.value for kf in anim.keyframes)
+        for anim in entity._animations
+    )
+
+
+def referenced_entities(entities: list[Entity], connections: list) -> set[Entity]:
+    """
+    Entities other content depends on, which must stay in the scene.
+
+    Connection endpoints, polygon vertices and the targets of relative
+    or along-a-path bindings are often invisible helpers; removing them
+    would change or break what depends on them.
+    """
+    referenced: set[Entity] = set()
+    for conn in connections:
+        referenced.update((conn.start, conn.end))
+    for entity in entities:
+        for spec in getattr(entity, "_vertex_specs", ()):
+            target = spec[0] if isinstance(spec, tuple) else spec
+            if not isinstance(target, Coord):
+                referenced.add(target)
+        binding = entity.binding
+        if binding is not None:
+            referenced.update((binding.reference, binding.along))
+    return referenced
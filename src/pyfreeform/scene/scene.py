@@ -2,22 +2,47 @@
 
 from __future__ import annotations
 
+import itertools
+import json
+import math
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import numpy as np
 
 from ..color import Color
 from ..core.surface import Surface
+from ..grid.cell import Cell
+from ..grid.cell_group import CellGroup
 from ..grid.grid import Grid
 from ..image import Image
-from ..renderers import SMILRenderer
+from ..renderers import SMILRenderer, SVGRenderer
+from ..renderers.culling import content_bounds, tile_buckets
+from .fingerprint import UnstableState, scene_fingerprint
+from .prune import PRUNE_REASONS, dead_reason, referenced_entities
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Future
 
     from ..core.connection import Connection
     from ..core.entity import Entity
+    from ..core.spatial import SpatialIndex
+    from ..image import ImageCache, TiledImage
     from ..renderers import Renderer
 
+T = TypeVar("T")
+
+# Background of scenes made by from_image() and with_grid()
+_DEFAULT_BACKGROUND = "#1a1a2e"  # Midnight blue
+
+# Grid layers from_image() loads; stream_frames() drops any others between frames
+_IMAGE_LAYERS = ("color", "brightness", "alpha")
+
 
 class Scene(Surface):
     """
@@ -81,7 +106,7 @@ class Scene(Surface):
     @classmethod
     def from_image(
         cls,
-        source: str | Path | Image,
+        source: str | Path | Image | TiledImage,
         *,
         grid_size: int | None = 40,
         cell_size: int = 10,
@@ -89,6 +114,7 @@ class Scene(Surface):
         cell_width: float | None = None,
         cell_height: float | None = None,
         background: str | None = None,
+        cache: ImageCache | None = None,
     ) -> Scene:
         """
         Create a scene from an image file (one-liner for image-based art).
@@ -107,7 +133,8 @@ class Scene(Surface):
                 image dimensions ÷ cell size. Scene size ≈ image dimensions.
 
         Args:
-            source: Path to image file, or an Image object.
+            source: Path to image file, an Image, or a TiledImage for
+                files too large to load in memory.
             grid_size:  Number of columns (rows auto-calculated from aspect ratio).
                         Pass None to derive grid from image dimensions.
             cell_size: Base size of each cell in pixels.
@@ -115,6 +142,8 @@ class Scene(Surface):
             cell_width: Explicit cell width (overrides cell_size and cell_ratio).
             cell_height: Explicit cell height (overrides cell_size).
             background: Background color (defaults to dark blue).
+            cache: Optional ImageCache. Decoded pixels and resampled grid
+                layers are stored on first use and memory-mapped afterwards.
 
         Returns:
             Scene with grid loaded from image, ready to iterate.
@@ -126,7 +155,10 @@ class Scene(Surface):
             - cell.alpha: Float 0.0-1.0
         """
         # Load image if path provided
-        image = Image.load(source) if isinstance(source, str | Path) else source
+        if isinstance(source, str | Path):
+            image = cache.load(source) if cache is not None else Image.load(source)
+        else:
+            image = source
 
         # Create grid from image
         grid = Grid.from_image(
@@ -137,11 +169,12 @@ class Scene(Surface):
             cell_width=cell_width,
             cell_height=cell_height,
             load_layers=True,
+            cache=cache,
         )
 
         # Set default background if not specified
         if background is None:
-            background = "#1a1a2e"  # Midnight blue
+            background = _DEFAULT_BACKGROUND
 
         # Create scene sized to grid
         scene = cls(
@@ -199,7 +232,7 @@ class Scene(Surface):
 
         # Set default background if not specified
         if background is None:
-            background = "#1a1a2e"
+            background = _DEFAULT_BACKGROUND
 
         scene = cls(
             width=int(grid.pixel_width),
@@ -212,6 +245,177 @@ class Scene(Surface):
 
         return scene
 
+    # =========================================================================
+    # FRAME STREAMING
+    # =========================================================================
+
+    @classmethod
+    def stream_frames(
+        cls,
+        source: str | Path | Iterable[str | Path],
+        *,
+        grid_size: int | None = 40,
+        cell_size: int = 10,
+        cell_ratio: float = 1.0,
+        cell_width: float | None = None,
+        cell_height: float | None = None,
+        background: str | None = None,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> Iterator[Scene]:
+        """
+        One scene per frame of an animation, reusing a single grid.
+
+        Frames are decoded in one sequential pass (see
+        ``Image.iter_frames``). The scene and its grid are built for the
+        first frame; for every later frame of the same size the scene is
+        cleared and only the grid's data arrays are refreshed from the new
+        frame, so cells are not rebuilt.
+
+        The **same** Scene object is yielded each time: render or save it
+        before advancing. Per-cell values written through ``cell.data``
+        under custom names carry over from frame to frame.
+
+            for i, scene in enumerate(Scene.stream_frames("clip.gif", grid_size=60)):
+                for cell in scene.grid:
+                    cell.add_dot(color=cell.color, radius=cell.brightness / 2)
+                scene.save(f"frames/{i:04d}.svg")
+
+        Args:
+            source: Path to an animated GIF/WebP, or an iterable of image paths.
+            grid_size: Number of columns, as in ``from_image``.
+            cell_size: Base size of each cell in pixels.
+            cell_ratio: Width-to-height ratio (e.g., 2.0 for domino cells).
+            cell_width: Explicit cell width (overrides cell_size and cell_ratio).
+            cell_height: Explicit cell height (overrides cell_size).
+            background: Background color (defaults to dark blue).
+            start: Index of the first frame.
+            stop: Index to stop before (default: the last frame).
+
+        Yields:
+            The scene, loaded with each frame in turn.
+        """
+        options = {
+            "grid_size": grid_size,
+            "cell_size": cell_size,
+            "cell_ratio": cell_ratio,
+            "cell_width": cell_width,
+            "cell_height": cell_height,
+            "background": background,
+        }
+        scene = None
+        for image in Image.iter_frames(source, start, stop):
+            scene = cls._frame_scene(scene, image, options)
+            yield scene
+
+    @classmethod
+    def map_frames(
+        cls,
+        source: str | Path | Iterable[str | Path],
+        draw: Callable[[Scene, int], T],
+        *,
+        processes: int | None = None,
+        grid_size: int | None = 40,
+        cell_size: int = 10,
+        cell_ratio: float = 1.0,
+        cell_width: float | None = None,
+        cell_height: float | None = None,
+        background: str | None = None,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> list[T]:
+        """
+        Run ``draw(scene, index)`` for every frame, across worker processes.
+
+        The parent process decodes the frames in one sequential pass and
+        hands each one to a process pool. Every worker keeps one scene and
+        grid alive and refreshes it per frame, as ``stream_frames`` does.
+        At most two frames per worker are in flight at a time, so memory
+        stays bounded for long clips.
+
+        *draw* must be picklable (a module-level function) and should
+        return something small and picklable, such as the SVG text or
+        the path it saved to.
+
+            def render(scene, index):
+                for cell in scene.grid:
+                    cell.add_dot(color=cell.color)
+                path = f"frames/{index:04d}.svg"
+                scene.save(path)
+                return path
+
+            paths = Scene.map_frames("clip.gif", render, grid_size=60)
+
+        Args:
+            source: Path to an animated GIF/WebP, or an iterable of image paths.
+            draw: Called with the frame's scene and frame index.
+            processes: Worker processes (default: CPU count). 1 runs in
+                this process, without a pool.
+            grid_size: Number of columns, as in ``from_image``.
+            cell_size: Base size of each cell in pixels.
+            cell_ratio: Width-to-height ratio (e.g., 2.0 for domino cells).
+            cell_width: Explicit cell width (overrides cell_size and cell_ratio).
+            cell_height: Explicit cell height (overrides cell_size).
+            background: Background color (defaults to dark blue).
+            start: Index of the first frame.
+            stop: Index to stop before (default: the last frame).
+
+        Returns:
+            The results of *draw*, in frame order.
+
+        Raises:
+            ValueError: If processes is less than 1.
+        """
+        options = {
+            "grid_size": grid_size,
+            "cell_size": cell_size,
+            "cell_ratio": cell_ratio,
+            "cell_width": cell_width,
+            "cell_height": cell_height,
+            "background": background,
+        }
+        workers = (os.cpu_count() or 1) if processes is None else processes
+        if workers < 1:
+            raise ValueError(f"processes must be at least 1, got {processes}")
+        frames = enumerate(Image.iter_frames(source, start, stop), start)
+        if workers == 1:
+            scene = None
+            results = []
+            for index, image in frames:
+                scene = cls._frame_scene(scene, image, options)
+                results.append(draw(scene, index))
+            return results
+
+        results = []
+        pending: deque[Future[T]] = deque()
+        with ProcessPoolExecutor(workers) as pool:
+            for index, image in frames:
+                pending.append(
+                    pool.submit(_draw_frame, cls, draw, options, index, image.to_array())
+                )
+                if len(pending) >= 2 * workers:
+                    results.append(pending.popleft().result())
+            results.extend(future.result() for future in pending)
+        return results
+
+    @classmethod
+    def _frame_scene(cls, scene: Scene | None, image: Image, options: dict[str, Any]) -> Scene:
+        """Load *image* into *scene*'s grid, or build a new scene if it doesn't fit."""
+        grid = scene._primary_grid if scene is not None else None
+        source = grid.source_image if grid is not None else None
+        if source is None or source.size != image.size:
+            return cls.from_image(image, **options)
+        # Back to the state from_image() leaves a scene in; only custom
+        # cell.data values carry over
+        scene.clear(keep_grids=True)
+        scene._grids[:] = [grid]
+        scene._viewbox = None
+        scene.background = options["background"] or _DEFAULT_BACKGROUND
+        for name in [name for name in grid._layers if name not in _IMAGE_LAYERS]:
+            del grid._layers[name]
+        grid.load_image(image)
+        return scene
+
     # =========================================================================
     # PROPERTIES
     # =========================================================================
@@ -296,7 +500,10 @@ class Scene(Surface):
         """
         Remove an entity from the scene.
 
-        Searches both direct entities and grid cells.
+        Works for direct entities and for entities in the cells and cell
+        groups of the scene's grids. The entity's ``surface`` records
+        where it lives, so removal takes constant time however many
+        entities and cells the scene holds.
 
         Args:
             entity: The entity to remove.
@@ -304,17 +511,85 @@ class Scene(Surface):
         Returns:
             True if entity was found and removed.
         """
-        if entity in self._entities:
-            self._entities.remove(entity)
-            entity.surface = None
-            return True
-        # Check grids
-        for grid in self._grids:
-            for cell in grid:
-                if cell.remove(entity):
-                    return True
+        owner = entity.surface
+        if owner is self:
+            return super().remove(entity)
+        if isinstance(owner, Cell | CellGroup) and owner.grid in self._grids:
+            return owner.remove(entity)
         return False
 
+    def remove_many(self, entities: Iterable[Entity]) -> int:
+        """
+        Remove several entities at once.
+
+        Args:
+            entities: The entities to remove. Ones not in the scene are
+                skipped.
+
+        Returns:
+            The number of entities removed.
+        """
+        return sum(self.remove(entity) for entity in list(entities))
+
+    def remove_where(self, predicate: Callable[[Entity], bool]) -> int:
+        """
+        Remove every entity matching a condition.
+
+        Args:
+            predicate: Called with each entity (including those in grids);
+                entities it returns True for are removed.
+
+        Returns:
+            The number of entities removed.
+
+        Example:
+            ```python
+            scene.remove_where(lambda e: e.opacity < 0.05)
+            ```
+        """
+        return self.remove_many([entity for entity in self.entities if predicate(entity)])
+
+    def optimize(self) -> dict[str, int]:
+        """
+        Remove entities that cannot affect the rendered output.
+
+        Prunes entities that are fully transparent (zero opacity, or no
+        fill or stroke to paint), have zero size (zero radius, width or
+        height, a zero-width stroke, empty text), or lie entirely outside
+        the scene. Entities animated into visibility are kept, as are
+        entities other content depends on: connection endpoints, polygon
+        vertices and binding targets. Off-scene pruning is skipped while
+        the scene has a viewBox, which may show content outside it.
+
+        Returns:
+            The number of entities removed for each reason:
+            ``"transparent"``, ``"zero_size"`` and ``"off_scene"``.
+
+        Example:
+            ```python
+            stats = scene.optimize()
+            print(f"Pruned {sum(stats.values())} entities: {stats}")
+            ```
+        """
+        area = (
+            (-math.inf, -math.inf, math.inf, math.inf)
+            if self._viewbox is not None
+            else (0.0, 0.0, float(self._width), float(self._height))
+        )
+        entities = self.entities
+        referenced = referenced_entities(entities, self._collect_connections())
+        stats = dict.fromkeys(PRUNE_REASONS, 0)
+        dead: list[Entity] = []
+        for entity in entities:
+            if entity in referenced or type(entity).__name__ == "Point":
+                continue
+            reason = dead_reason(entity, area)
+            if reason is not None:
+                stats[reason] += 1
+                dead.append(entity)
+        self.remove_many(dead)
+        return stats
+
     def remove_grid(self, grid: Grid) -> bool:
         """
         Remove a grid from the scene.
@@ -330,13 +605,27 @@ class Scene(Surface):
             return True
         return False
 
-    def clear(self) -> None:
-        """Remove all objects from the scene."""
+    def clear(self, keep_grids: bool = False) -> None:
+        """
+        Remove all objects from the scene.
+
+        Args:
+            keep_grids: Only empty the grids (their cells keep their data),
+                instead of removing them from the scene.
+        """
+        for entity in self._entities:
+            entity.surface = None
         self._entities.clear()
         self._connections.clear()
+        self._spatial = None
         for grid in self._grids:
             grid.clear()
-        self._grids.clear()
+        if not keep_grids:
+            self._grids.clear()
+
+    def _query_indexes(self) -> list[SpatialIndex]:
+        """Spatial queries search the scene's own entities, then each grid's."""
+        return super()._query_indexes() + [grid._spatial_index() for grid in self._grids]
 
     # --- Iteration ---
 
@@ -365,9 +654,9 @@ class Scene(Surface):
                 if cid not in seen:
                     seen.add(cid)
                     result.append(conn)
-        # Auto-collect from grid cells
+        # Auto-collect from grid cells (only cells holding state can have any)
         for grid in self._grids:
-            for cell in grid:
+            for cell in grid._retained_cells():
                 for conn in cell.connections:
                     cid = id(conn)
                     if cid not in seen:
@@ -403,23 +692,105 @@ class Scene(Surface):
         }
         return gradients
 
-    def render(self, renderer: Renderer | None = None) -> str:
+    def render(
+        self,
+        renderer: Renderer | None = None,
+        *,
+        min_feature_px: float | None = None,
+        output_scale: float | None = None,
+        cull_occluded: bool | None = None,
+    ) -> str:
         """
         Render the scene using the given renderer.
 
         If no renderer is specified, uses SMILRenderer (supports both
         static and animated content).
 
+        With *min_feature_px*, detail too small to see at the output size
+        is dropped or simplified: sub-feature entities are skipped, small
+        Paths get fewer segments or collapse to a line or dot, and
+        coinciding duplicate dots are drawn once. Use it for previews and
+        thumbnails; the scene itself is not changed.
+
+        Options left as None keep the renderer's own settings; options
+        that are given apply to a copy of it.
+
         Args:
             renderer: A Renderer instance. Defaults to SMILRenderer.
+            min_feature_px: Smallest detail to draw, in output pixels
+                (0.5 is a good preview value). The renderer's default
+                renders everything.
+            output_scale: Display size relative to the scene's size
+                (0.1 to preview a 2000 px scene at 200 px).
+            cull_occluded: Skip content completely hidden under a later
+                opaque, unrotated rect, such as shapes drawn before a
+                cell's ``add_fill()`` at a higher z_index.
 
         Returns:
             Rendered output as a string.
+
+        Raises:
+            ValueError: If min_feature_px is negative or output_scale is
+                not positive.
+            TypeError: If options are given with a renderer that isn't
+                an ``SVGRenderer``.
+
+        Example:
+            ```python
+            thumbnail = scene.render(min_feature_px=0.5, output_scale=0.1)
+            ```
         """
-        if renderer is None:
-            renderer = SMILRenderer()
+        renderer = _configured(renderer, min_feature_px, output_scale, cull_occluded)
         return renderer.render_scene(self)
 
+    def fingerprint(
+        self,
+        renderer: Renderer | None = None,
+        *,
+        min_feature_px: float | None = None,
+        output_scale: float | None = None,
+        cull_occluded: bool | None = None,
+    ) -> str | None:
+        """
+        A stable hash of everything that decides the rendered output.
+
+        Hashes the scene's size, background and viewBox, its grids'
+        geometry, the state and animations of every entity and
+        connection, the renderer and its options, and the library
+        version. Equal fingerprints mean identical output, in this run or
+        any other; cached values and ``data`` are left out. Scenes holding
+        state that has no stable form across runs, such as a function
+        stored on an entity, have no fingerprint.
+
+        Nothing is cached between calls: every entity's state is encoded
+        afresh, which for scenes of simple shapes (tens of thousands of
+        dots) costs about as much as rendering them. The saving is in
+        what a match makes unnecessary -- building, writing and
+        re-processing the file -- and grows with rendering options such
+        as ``min_feature_px`` or ``cull_occluded``, which the fingerprint
+        only records.
+
+        Args:
+            renderer: The renderer, as in ``render()``.
+            min_feature_px: Level of detail, as in ``render()``.
+            output_scale: Display size, as in ``render()``.
+            cull_occluded: Occlusion culling, as in ``render()``.
+
+        Returns:
+            A hex digest, or None if the scene can't be fingerprinted.
+
+        Example:
+            ```python
+            if scene.fingerprint() != last_fingerprint:
+                publish(scene.to_svg())
+            ```
+        """
+        renderer = _configured(renderer, min_feature_px, output_scale, cull_occluded)
+        try:
+            return scene_fingerprint(self, renderer)
+        except UnstableState:
+            return None
+
     def to_svg(self) -> str:
         """
         Render the scene to an SVG string.
@@ -433,20 +804,227 @@ class Scene(Surface):
         """
         return self.render()
 
-    def save(self, path: str | Path, renderer: Renderer | None = None) -> None:
+    def save(
+        self,
+        path: str | Path,
+        renderer: Renderer | None = None,
+        *,
+        min_feature_px: float | None = None,
+        output_scale: float | None = None,
+        cull_occluded: bool | None = None,
+        skip_if_unchanged: bool = False,
+    ) -> bool:
         """
         Save the scene to an SVG file.
 
+        With *skip_if_unchanged*, the scene's ``fingerprint()`` is kept in
+        a sidecar file next to the SVG (``art.svg.fingerprint``). When the
+        SVG and a sidecar with the same fingerprint already exist, the
+        scene is neither rendered nor written, so build scripts that
+        re-run on every change leave untouched outputs alone. Computing
+        the fingerprint still visits every entity (see ``fingerprint()``).
+
         Args:
             path: File path (will add .svg extension if missing).
             renderer: Optional Renderer instance. Defaults to SMILRenderer.
+            min_feature_px: Level of detail, as in ``render()``.
+            output_scale: Display size relative to the scene's size, as
+                in ``render()``.
+            cull_occluded: Skip content hidden under opaque rects, as in
+                ``render()``.
+            skip_if_unchanged: Skip saving when the existing file was
+                written from an identical scene.
+
+        Returns:
+            True if the file was written, False if it was skipped.
+
+        Example:
+            ```python
+            scene.save("art.svg", skip_if_unchanged=True)
+            ```
         """
         path = Path(path)
         if path.suffix.lower() != ".svg":
             path = path.with_suffix(".svg")
 
-        svg_content = self.render(renderer)
-        path.write_text(svg_content, encoding="utf-8")
+        renderer = _configured(renderer, min_feature_px, output_scale, cull_occluded)
+        sidecar = path.with_name(f"{path.name}.fingerprint")
+        fingerprint = None
+        if skip_if_unchanged:
+            fingerprint = self.fingerprint(renderer)
+            if (
+                fingerprint is not None
+                and path.exists()
+                and sidecar.exists()
+                and sidecar.read_text(encoding="utf-8") == fingerprint
+            ):
+                return False
+
+        path.write_text(renderer.render_scene(self), encoding="utf-8")
+        if fingerprint is not None:
+            sidecar.write_text(fingerprint, encoding="utf-8")
+        elif skip_if_unchanged:
+            # A stale sidecar would vouch for output it didn't describe
+            sidecar.unlink(missing_ok=True)
+        return True
+
+    def save_tiles(
+        self,
+        directory: str | Path,
+        tile_size: float | tuple[float, float],
+        *,
+        overlap: float = 0.0,
+        renderer: Renderer | None = None,
+        processes: int | None = None,
+    ) -> Path:
+        """
+        Save the scene as a grid of SVG tiles plus a JSON manifest.
+
+        For scenes too large for one file. Every tile is a standalone SVG
+        of one rectangle of the scene at 1:1 scale, holding only the
+        entities and connections that reach into it, and the defs they
+        use (def ids are derived from their content, so a gradient or
+        marker has the same id in every tile). Content is assigned to
+        tiles in one vectorized pass over its bounds, then the tiles are
+        rendered and written in parallel worker processes where the
+        platform can fork them.
+
+        The tiles cover the crop/trim viewBox if one is set, otherwise
+        the whole scene. Tile ``(row, col)`` is written to
+        ``tile_<row>_<col>.svg``; ``manifest.json`` lists every tile's
+        file, grid position and rectangle in scene coordinates.
+
+        Args:
+            directory: Output directory (created if missing).
+            tile_size: Tile width and height in pixels, or a
+                ``(width, height)`` pair.
+            overlap: Pixels each tile extends into its neighbours, so
+                tiles can be trimmed or blended when assembled.
+            renderer: Optional SVGRenderer instance. Defaults to SMILRenderer.
+            processes: Worker processes (default: CPU count). 1 renders
+                in this process.
+
+        Returns:
+            Path of the manifest file.
+
+        Raises:
+            ValueError: If the tile size is not positive, overlap is
+                negative, or processes is less than 1.
+            TypeError: If the renderer is not an SVGRenderer.
+
+        Example:
+            ```python
+            manifest = scene.save_tiles("mural", tile_size=2000, overlap=20)
+            ```
+        """
+        tw, th = (tile_size, tile_size) if isinstance(tile_size, int | float) else tile_size
+        if tw <= 0 or th <= 0:
+            raise ValueError(f"tile_size must be positive, got {tile_size}")
+        if overlap < 0:
+            raise ValueError(f"overlap must not be negative, got {overlap}")
+        workers = (os.cpu_count() or 1) if processes is None else processes
+        if workers < 1:
+            raise ValueError(f"processes must be at least 1, got {processes}")
+        if renderer is None:
+            renderer = SMILRenderer()
+        if not isinstance(renderer, SVGRenderer):
+            raise TypeError(
+                f"save_tiles needs an SVGRenderer to render tiles, got {type(renderer).__name__}"
+            )
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        area = self._viewbox or (0.0, 0.0, float(self._width), float(self._height))
+        x, y, width, height = area
+        cols, rows = max(1, math.ceil(width / tw)), max(1, math.ceil(height / th))
+
+        entities = self.entities
+        connections = self._collect_connections()
+        entity_boxes, connection_boxes = content_bounds(entities, connections, renderer.animated)
+        entity_tiles = tile_buckets(entity_boxes, area, (tw, th), overlap)
+        connection_tiles = tile_buckets(connection_boxes, area, (tw, th), overlap)
+
+        tiles = []
+        jobs = []
+        for index in range(rows * cols):
+            row, col = divmod(index, cols)
+            left, top = x + col * tw, y + row * th
+            bounds = (left, top, min(tw, x + width - left), min(th, y + height - top))
+            view = (
+                bounds[0] - overlap,
+                bounds[1] - overlap,
+                bounds[2] + 2 * overlap,
+                bounds[3] + 2 * overlap,
+            )
+            name = f"tile_{row:03d}_{col:03d}.svg"
+            jobs.append((directory / name, entity_tiles[index], connection_tiles[index], view))
+            tiles.append(
+                {
+                    "file": name,
+                    "row": row,
+                    "column": col,
+                    "bounds": list(bounds),
+                    "viewBox": list(view),
+                    "entities": len(entity_tiles[index]),
+                    "connections": len(connection_tiles[index]),
+                }
+            )
+
+        content = (self, renderer, entities, connections)
+        if workers == 1 or len(jobs) == 1 or "fork" not in multiprocessing.get_all_start_methods():
+            for job in jobs:
+                _write_tile(content, job)
+        else:
+            # Forked workers inherit the scene through the initializer's
+            # arguments instead of unpickling it
+            context = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(
+                min(workers, len(jobs)),
+                mp_context=context,
+                initializer=_init_tile_worker,
+                initargs=(content,),
+            ) as pool:
+                for _ in pool.map(
+                    _write_worker_tile, jobs, chunksize=max(1, len(jobs) // (4 * workers))
+                ):
+                    pass
+
+        manifest = {
+            "area": list(area),
+            "tile_size": [tw, th],
+            "overlap": overlap,
+            "rows": rows,
+            "columns": cols,
+            "tiles": tiles,
+        }
+        manifest_path = directory / "manifest.json"
+        manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        return manifest_path
+
+    def bounds_array(self, *, visual: bool = False) -> np.ndarray:
+        """
+        Bounding boxes of all entities as one ``(n, 4)`` array.
+
+        Rows are ``(min_x, min_y, max_x, max_y)``, in the same order as
+        ``entities`` (grid entities included), ready for whole-scene
+        reductions such as the overall extent or per-entity sizes.
+
+        Args:
+            visual: If True, include stroke widths, as ``bounds(visual=True)``.
+
+        Returns:
+            A new float array; empty ``(0, 4)`` for an empty scene.
+
+        Example:
+            ```python
+            boxes = scene.bounds_array(visual=True)
+            widths = boxes[:, 2] - boxes[:, 0]
+            extent = (*boxes[:, :2].min(axis=0), *boxes[:, 2:].max(axis=0))
+            ```
+        """
+        entities = self.entities
+        values = itertools.chain.from_iterable(e.bounds(visual=visual) for e in entities)
+        return np.fromiter(values, dtype=np.float64, count=4 * len(entities)).reshape(-1, 4)
 
     def crop(self, padding: float = 0) -> Scene:
         """
@@ -471,15 +1049,12 @@ class Scene(Surface):
             scene.save("icon.svg")
             ```
         """
-        all_entities = self.entities
-        if not all_entities:
+        bounds = self.bounds_array(visual=True)
+        if not len(bounds):
             return self
 
-        bounds = [e.bounds(visual=True) for e in all_entities]
-        min_x = min(b[0] for b in bounds) - padding
-        min_y = min(b[1] for b in bounds) - padding
-        max_x = max(b[2] for b in bounds) + padding
-        max_y = max(b[3] for b in bounds) + padding
+        min_x, min_y = (bounds[:, :2].min(axis=0) - padding).tolist()
+        max_x, max_y = (bounds[:, 2:].max(axis=0) + padding).tolist()
 
         self._viewbox = (min_x, min_y, max_x - min_x, max_y - min_y)
         return self
@@ -533,3 +1108,81 @@ class Scene(Surface):
             f"{len(self.entities)} entities, "
             f"{len(self._collect_connections())} connections)"
         )
+
+
+# Scene reused by every frame a pool worker draws (one per process)
+_worker_scene: Scene | None = None
+
+# (scene, renderer, entities, connections) a save_tiles() pool worker renders,
+# set once per worker process by its initializer
+_tile_content: tuple[Scene, SVGRenderer, list[Entity], list[Connection]] | None = None
+
+
+def _configured(
+    renderer: Renderer | None,
+    min_feature_px: float | None,
+    output_scale: float | None,
+    cull_occluded: bool | None,
+) -> Renderer:
+    """
+    The renderer to use with the given options; never modifies *renderer*.
+
+    Options left as None keep the renderer's own settings.
+    """
+    options = {
+        "min_feature_px": min_feature_px,
+        "output_scale": output_scale,
+        "cull_occluded": cull_occluded,
+    }
+    if renderer is None:
+        renderer = SMILRenderer()
+    if all(value is None for value in options.values()):
+        return renderer
+    if not isinstance(renderer, SVGRenderer):
+        raise TypeError(
+            f"Rendering options need an SVGRenderer, got {type(renderer).__name__}; "
+            "configure custom renderers directly"
+        )
+    return renderer.with_options(**options)
+
+
+def _write_tile(
+    content: tuple[Scene, SVGRenderer, list[Entity], list[Connection]],
+    job: tuple[Path, np.ndarray, np.ndarray, tuple[float, float, float, float]],
+) -> None:
+    """Render and write one tile of ``Scene.save_tiles``."""
+    path, entity_indices, connection_indices, view = job
+    scene, renderer, entities, connections = content
+    svg = renderer._render_document(
+        scene,
+        [entities[i] for i in entity_indices],
+        [connections[i] for i in connection_indices],
+        tile=view,
+    )
+    path.write_text(svg, encoding="utf-8")
+
+
+def _init_tile_worker(content: tuple[Scene, SVGRenderer, list[Entity], list[Connection]]) -> None:
+    """Pool initializer of ``Scene.save_tiles``: keep the content for this process."""
+    global _tile_content
+    _tile_content = content
+
+
+def _write_worker_tile(
+    job: tuple[Path, np.ndarray, np.ndarray, tuple[float, float, float, float]],
+) -> None:
+    """Pool worker of ``Scene.save_tiles``: write one tile of this process's content."""
+    _write_tile(_tile_content, job)
+
+
+def _draw_frame(
+    scene_cls: type[Scene],
+    draw: Callable[[Scene, int], T],
+    options: dict[str, Any],
+    index: int,
+    pixels: np.ndarray,
+) -> T:
+    """Pool worker of ``Scene.map_frames``: draw one frame on the process's scene."""
+    global _worker_scene
+    _worker_scene = scene_cls._frame_scene(_worker_scene, Image.from_array(pixels), options)
+    return draw(_worker_scene, index)
@@ -9,7 +9,7 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from pyfreeform import Scene, Grid, Point, Dot, Rect, Image
+from pyfreeform import Scene, Grid, Point, Dot, Rect, Image, Layer, Color
 from pyfreeform.core.relcoord import RelCoord
 
 
@@ -144,6 +144,404 @@ class TestGridRowIndexing:
         assert cells[5].row == 1 and cells[5].col == 2
 
 
+# =========================================================================
+# Lazy Cell Materialization
+# =========================================================================
+
+
+class TestLazyCells:
+    def test_cells_created_on_demand(self):
+        """A fresh grid holds no cells until they are accessed."""
+        grid = Grid(cols=100, rows=100, cell_size=2)
+        assert grid._retained_cells() == []
+        assert not grid._transient_cells
+
+    def test_cell_identity_while_referenced(self):
+        """The same cell object is returned while a reference is held."""
+        grid = Grid(cols=10, rows=10, cell_size=10)
+        cell = grid[3][4]
+        assert grid.get(3, 4) is cell
+        assert grid.cell_at_pixel(45, 35) is cell
+
+    def test_data_survives_cell_release(self):
+        """Custom data lives on the grid, not on the transient cell."""
+        grid = Grid(cols=10, rows=10, cell_size=10)
+        grid.get(2, 2).data["tag"] = "x"
+        assert grid.get(2, 2).data["tag"] == "x"
+
+    def test_layer_keys_keep_values_the_layer_cannot_hold(self):
+        """Text and color names written over a layer read back as written."""
+        grid = Grid.from_image(Image.from_array(np.full((4, 4, 3), 60, np.uint8)), cols=2, rows=2)
+        cell = grid[0][0]
+        cell.data["brightness"] = "high"
+        cell.data["color"] = "red"
+        assert cell.data["brightness"] == "high" and cell.color == "red"
+        assert cell.rgb == (255, 0, 0)
+        assert grid[0][1].data["brightness"] == pytest.approx(60 / 255)
+        cell.data["brightness"] = 0.25
+        assert cell.data["brightness"] == 0.25 and grid.brightness_array[0, 0] == 0.25
+
+    def test_row_access_keeps_at_most_one_row(self):
+        """grid[row][col] doesn't keep every row it touched alive."""
+        grid = Grid(cols=50, rows=40, cell_size=2)
+        for row in range(40):
+            assert grid[row][0].row == row
+        assert len(grid._transient_cells) <= 50
+
+    def test_cells_with_entities_are_retained(self):
+        """Cells that receive entities stay alive and are rendered."""
+        scene = Scene.with_grid(cols=50, rows=50, cell_size=4)
+        for cell in scene.grid.every(n=7):
+            cell.add_dot(color="red")
+        retained = scene.grid._retained_cells()
+        assert len(retained) == len(list(scene.grid.every(n=7)))
+        assert len(scene.entities) == len(retained)
+        assert scene.to_svg().count("<circle") == len(retained)
+
+    def test_selection_helpers_skip_unselected_cells(self):
+        """border/every/checkerboard match a full scan of the grid."""
+        grid = Grid(cols=7, rows=5, cell_size=10)
+        border = [(c.row, c.col) for c in grid.border(thickness=2)]
+        expected = [
+            (r, c) for r in range(5) for c in range(7) if r < 2 or r >= 3 or c < 2 or c >= 5
+        ]
+        assert border == expected
+        assert [(c.row, c.col) for c in grid.every(n=4, offset=1)] == [
+            divmod(i, 7) for i in range(1, 35, 4)
+        ]
+        black = [(c.row, c.col) for c in grid.checkerboard("black")]
+        assert black == [(r, c) for r in range(5) for c in range(7) if (r + c) % 2 == 0]
+
+    def test_neighbors_share_cell_objects(self):
+        """Neighbor lookups return the grid's cached cells."""
+        grid = Grid(cols=4, rows=4, cell_size=10)
+        cell = grid[1][1]
+        assert cell.right is grid[1][2]
+        assert cell.below.above is cell
+
+
+# =========================================================================
+# Vectorized Selection (select / mask_where / CellMask)
+# =========================================================================
+
+
+class TestCellMask:
+    def _grid(self) -> Grid:
+        return Grid.from_image(_make_quadrant_image(40), cols=4, rows=4)
+
+    def test_select_matches_where(self):
+        """select() on brightness_array picks the same cells as where()."""
+        grid = self._grid()
+        mask = grid.select(grid.brightness_array > 0.5)
+        expected = [(c.row, c.col) for c in grid.where(lambda c: c.brightness > 0.5)]
+        assert [(c.row, c.col) for c in mask] == expected
+        assert len(mask) == len(expected)
+
+    def test_mask_where_bounds(self):
+        """mask_where() combines all given bounds."""
+        grid = self._grid()
+        values = grid.brightness_array
+        mask = grid.mask_where("brightness", ge=0.2, lt=0.8)
+        np.testing.assert_array_equal(mask.array, (values >= 0.2) & (values < 0.8))
+
+    def test_mask_composition(self):
+        """Masks compose with &, |, ^, ~ and with plain bool arrays."""
+        grid = self._grid()
+        dark = grid.mask_where("brightness", lt=0.5)
+        top = np.zeros((4, 4), dtype=bool)
+        top[:2] = True
+        assert (dark | ~dark).count == 16
+        assert (dark & ~dark).count == 0
+        assert (dark ^ dark).count == 0
+        np.testing.assert_array_equal((dark & top).array, dark.array & top)
+        np.testing.assert_array_equal((top & dark).array, dark.array & top)
+
+    def test_mask_contains_and_indices(self):
+        grid = self._grid()
+        mask = grid.select(np.eye(4, dtype=bool))
+        assert grid[2][2] in mask
+        assert grid[2][1] not in mask
+        rows, cols = mask.indices()
+        assert rows.tolist() == cols.tolist() == [0, 1, 2, 3]
+
+    def test_default_arrays_without_image(self):
+        """Without loaded data, arrays match the cell property defaults."""
+        grid = Grid(cols=3, rows=2, cell_size=10)
+        assert grid.brightness_array.shape == (2, 3)
+        assert np.all(grid.brightness_array == 0.5)
+        assert np.all(grid.alpha_array == 1.0)
+
+    def test_arrays_include_per_cell_values(self):
+        """Values set through cell.data show up in the arrays, as on the cells."""
+        grid = Grid(cols=3, rows=2, cell_size=10)
+        grid[0][1].data["brightness"] = 0.9
+        grid[1][2].data["alpha"] = 0.25
+        assert grid[0][1].brightness == 0.9
+        assert grid.brightness_array[0, 1] == 0.9
+        assert grid.brightness_array[0, 0] == 0.5
+        assert grid.alpha_array[1, 2] == 0.25
+        assert grid.alpha_array[0, 0] == 1.0
+        assert not grid.brightness_array.flags.writeable
+
+    def test_layer_array_is_read_only(self):
+        grid = self._grid()
+        with pytest.raises(ValueError):
+            grid.layer_array("brightness")[0, 0] = 1.0
+
+    def test_invalid_masks(self):
+        grid = self._grid()
+        with pytest.raises(ValueError):
+            grid.select(np.ones((3, 3), dtype=bool))
+        with pytest.raises(TypeError):
+            grid.select(np.ones((4, 4)))
+        with pytest.raises(KeyError):
+            grid.mask_where("missing", lt=1)
+        with pytest.raises(ValueError):
+            grid.mask_where("color", lt=1)
+        other = Grid(cols=4, rows=4, cell_size=10)
+        with pytest.raises(ValueError):
+            grid.mask_where("brightness", lt=0.5) & other.select(np.ones((4, 4), dtype=bool))
+
+
+# =========================================================================
+# Neighborhood Operations (convolve / neighbor_mean / gradient)
+# =========================================================================
+
+
+class TestNeighborhood:
+    def _grid(self, values) -> Grid:
+        values = np.asarray(values, dtype=np.float64)
+        grid = Grid(cols=values.shape[1], rows=values.shape[0], cell_size=10)
+        grid.load_layer("brightness", Layer(values))
+        return grid
+
+    def test_convolve_identity_and_shift(self):
+        grid = self._grid(np.arange(12).reshape(3, 4))
+        same = grid.convolve("brightness", [[0, 0, 0], [0, 1, 0], [0, 0, 0]], name="same")
+        np.testing.assert_array_equal(same, grid.brightness_array)
+        # True convolution: a kernel weight right of center reads the left neighbor
+        shifted = grid.convolve("brightness", [[0, 0, 0], [0, 0, 1], [0, 0, 0]], edge="zero")
+        assert shifted[0].tolist() == [0, 0, 1, 2]
+        assert grid[0][2].data["brightness_convolved"] == 1.0
+
+    def test_convolve_edge_modes(self):
+        grid = self._grid([[1, 2, 3]])
+        left = [[0, 0, 0], [0, 0, 1], [0, 0, 0]]
+        assert grid.convolve("brightness", left, edge="nearest")[0].tolist() == [1, 1, 2]
+        assert grid.convolve("brightness", left, edge="wrap")[0].tolist() == [3, 1, 2]
+        assert grid.convolve("brightness", left, edge="reflect")[0].tolist() == [1, 1, 2]
+        with pytest.raises(ValueError):
+            grid.convolve("brightness", left, edge="mirror")
+        with pytest.raises(ValueError):
+            grid.convolve("brightness", [[1, 1]])
+
+    def test_neighbor_mean_matches_cell_neighbors(self):
+        rng = np.random.default_rng(7)
+        grid = self._grid(rng.random((5, 6)))
+        result = grid.neighbor_mean()
+        for cell in grid:
+            neighbors = [n.brightness for n in cell.neighbors_all.values() if n]
+            assert result[cell.row, cell.col] == pytest.approx(sum(neighbors) / len(neighbors))
+        cardinal = grid.neighbor_mean(diagonals=False, name="cardinal")
+        cell = grid[2][3]
+        expected = np.mean([n.brightness for n in cell.neighbors.values()])
+        assert cardinal[2, 3] == pytest.approx(expected)
+
+    def test_gradient_of_ramp(self):
+        grid = self._grid(np.tile(np.arange(6.0), (4, 1)))
+        magnitude, direction = grid.gradient()
+        # Interior of a unit-per-column ramp: gradient 1, pointing right
+        np.testing.assert_allclose(magnitude[:, 1:-1], 1.0)
+        np.testing.assert_allclose(direction[:, 1:-1], 0.0)
+        assert grid[1][2].data["gradient_direction"] == pytest.approx(0.0)
+        vertical = self._grid(np.tile(np.arange(4.0)[:, None], (1, 5)))
+        _, direction = vertical.gradient(name="g")
+        assert direction[1, 2] == pytest.approx(90.0)
+
+    def test_color_layer_rejected(self):
+        grid = Grid.from_image(_make_quadrant_image(20), cols=4, rows=4)
+        with pytest.raises(ValueError):
+            grid.gradient("color")
+
+
+# =========================================================================
+# Color-Space Cell Properties (hue / saturation / lightness)
+# =========================================================================
+
+
+class TestColorSpaceCells:
+    def test_properties_match_color(self):
+        grid = Grid.from_image(_make_quadrant_image(20), cols=4, rows=4)
+        for cell in grid:
+            h, s, l = Color(cell.color).to_hsl()
+            assert cell.hue == pytest.approx(h, abs=0.01)
+            assert cell.saturation == pytest.approx(s, abs=1e-4)
+            assert cell.lightness == pytest.approx(l, abs=1e-4)
+
+    def test_layers_available_on_grid(self):
+        grid = Grid.from_image(_make_image(10, 10, 0, 255, 0), cols=4, rows=4)
+        grid[0][1].data["color"] = "#ff0000"
+        greens = grid.mask_where("hue", ge=100, le=140)
+        assert len(greens) == 15 and grid[0][1] not in greens
+        assert grid.layer_array("L").shape == (4, 4)
+
+    def test_follows_color_edits(self):
+        grid = Grid.from_image(_make_image(10, 10, 255, 0, 0), cols=2, rows=2)
+        assert grid[0][0].hue == 0.0
+        grid[0][0].data["color"] = "#0000ff"
+        assert grid[0][0].hue == pytest.approx(240.0)
+        assert grid[1][1].hue == 0.0
+
+    def test_explicit_layer_wins(self):
+        img = _make_image(10, 10, 0, 255, 0)
+        grid = Grid.from_image(img, cols=2, rows=2)
+        grid.load_layer("hue", Layer(np.full((2, 2), 42.0)))
+        assert grid[0][0].hue == 42.0
+
+    def test_defaults_without_image(self):
+        cell = Grid(cols=2, rows=2, cell_size=10)[0][0]
+        assert (cell.hue, cell.saturation, cell.lightness) == (0.0, 0.0, 0.5)
+
+
+# =========================================================================
+# Frame Streaming (iter_frames / load_image / stream_frames / map_frames)
+class TestDithering:
+    def _ramp_grid(self, cols=64, rows=32):
+        ramp = np.tile(np.linspace(0, 255, cols), (rows, 1))
+        return Grid.from_image(Image(ramp, ramp, ramp), cols=cols, rows=rows)
+
+    @pytest.mark.parametrize(
+        "method",
+        ["floyd-steinberg", "atkinson", "jarvis", "stucki", "bayer", "blue-noise", "halftone"],
+    )
+    def test_binary_output_tracks_brightness(self, method):
+        grid = self._ramp_grid()
+        result = grid.dither(method=method)
+        assert set(np.unique(result)) <= {0.0, 1.0}
+        assert abs(result.mean() - grid.brightness_array.mean()) < 0.06
+        # Dark on the left, light on the right
+        assert result[:, :16].mean() < 0.3 < 0.7 < result[:, -16:].mean()
+        assert grid[3][5].data["brightness_dithered"] == result[3, 5]
+
+    def test_error_diffusion_matches_sequential_scan(self):
+        from pyfreeform.image.dither import DIFFUSION_KERNELS, dither
+
+        values = np.random.default_rng(3).random((23, 31))
+        for method, kernel in DIFFUSION_KERNELS.items():
+            buffer, expected = values.copy(), np.zeros_like(values)
+            for y in range(23):
+                for x in range(31):
+                    expected[y, x] = min(max(round(buffer[y, x] * 3), 0), 3) / 3
+                    error = buffer[y, x] - expected[y, x]
+                    for dy, dx, weight in kernel:
+                        if y + dy < 23 and 0 <= x + dx < 31:
+                            buffer[y + dy, x + dx] += weight * error
+            result = dither(values, method, levels=4, serpentine=False)
+            assert np.allclose(result, expected), method
+
+    def test_levels_and_name(self):
+        grid = self._ramp_grid()
+        grid.dither(method="bayer", levels=3, name="ink")
+        assert set(np.unique(grid.layer_array("ink"))) == {0.0, 0.5, 1.0}
+
+    def test_invalid_arguments(self):
+        grid = self._ramp_grid()
+        with pytest.raises(ValueError):
+            grid.dither(method="random")
+        with pytest.raises(ValueError):
+            grid.dither(levels=1)
+        with pytest.raises(ValueError):
+            grid.dither(method="bayer", size=6)
+        with pytest.raises(ValueError):
+            grid.dither("color")
+
+
+# =========================================================================
+
+
+def _write_gif(path: Path, frames: int = 4) -> Path:
+    from PIL import Image as PILImage
+
+    shades = [PILImage.new("RGB", (20, 10), (40 * i, 255 - 40 * i, 90)) for i in range(frames)]
+    shades[0].save(path, save_all=True, append_images=shades[1:], duration=50)
+    return path
+
+
+def _frame_colors(scene: Scene, index: int) -> tuple[int, str]:
+    """Module-level, so it can be pickled into pool workers."""
+    for cell in scene.grid:
+        cell.add_dot(color=cell.color)
+    return index, scene.grid[0][0].color
+
+
+class TestFrameStreaming:
+    def test_iter_frames_matches_load(self, tmp_path):
+        path = _write_gif(tmp_path / "clip.gif")
+        frames = list(Image.iter_frames(path))
+        assert len(frames) == Image.frame_count(path) == 4
+        for i, frame in enumerate(frames):
+            assert frame.rgb_at(3, 3) == Image.load(path, frame=i).rgb_at(3, 3)
+        assert [f.rgb_at(0, 0) for f in Image.iter_frames(path, start=1, stop=3)] == [
+            f.rgb_at(0, 0) for f in frames[1:3]
+        ]
+
+    def test_iter_frames_over_paths(self, tmp_path):
+        from PIL import Image as PILImage
+
+        paths = []
+        for i in range(3):
+            paths.append(tmp_path / f"{i}.png")
+            PILImage.new("RGB", (4, 4), (i * 100, 0, 0)).save(paths[-1])
+        assert [f.rgb_at(0, 0)[0] for f in Image.iter_frames(paths, start=1)] == [100, 200]
+
+    def test_load_image_refreshes_data_only(self):
+        grid = Grid.from_image(_make_image(20, 20, 255, 0, 0), cols=4, rows=4)
+        cell = grid[1][2]
+        cell.add_dot(color="white")
+        grid.load_image(_make_image(20, 20, 0, 0, 255))
+        assert grid[1][2] is cell and len(cell.entities) == 1
+        assert cell.color == "#0000ff"
+        assert grid.source_image.rgb_at(0, 0) == (0, 0, 255)
+
+    def test_stream_frames_reuses_scene(self, tmp_path):
+        path = _write_gif(tmp_path / "clip.gif")
+        scenes, colors = [], []
+        for scene in Scene.stream_frames(path, grid_size=4):
+            scenes.append(scene)
+            cell = scene.grid[0][0]
+            assert cell.entities == []
+            cell.add_dot(color=cell.color)
+            colors.append(cell.color)
+        assert all(s is scenes[0] for s in scenes)
+        assert colors[0] == Scene.from_image(path, grid_size=4).grid[0][0].color
+        assert len(set(colors)) == 4
+
+    def test_stream_frames_resets_frame_state(self, tmp_path):
+        path = _write_gif(tmp_path / "clip.gif")
+        fresh = Scene.from_image(path, grid_size=4).to_svg()
+        for i, scene in enumerate(Scene.stream_frames(path, grid_size=4, stop=2)):
+            if i == 0:
+                scene.grid[0][0].add_dot(radius=0.3)
+                scene.crop()
+                scene.background = "white"
+                scene.grid.dither()
+                scene.add_grid(Grid(cols=2, rows=2, cell_size=5))
+        assert scene.to_svg() == fresh
+        assert len(scene.grids) == 1
+        assert "brightness_dithered" not in scene.grid[0][0].data
+
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_map_frames(self, tmp_path, processes):
+        path = _write_gif(tmp_path / "clip.gif")
+        results = Scene.map_frames(path, _frame_colors, processes=processes, grid_size=4)
+        scenes = Scene.stream_frames(path, grid_size=4)
+        assert results == [_frame_colors(scene, i) for i, scene in enumerate(scenes)]
+
+    def test_map_frames_rejects_bad_process_count(self, tmp_path):
+        with pytest.raises(ValueError):
+            Scene.map_frames(_write_gif(tmp_path / "clip.gif"), _frame_colors, processes=0)
+
+
 # =========================================================================
 # Feature 2: Fit Grid to Image Mode
 # =========================================================================
@@ -451,3 +849,546 @@ class TestPlaceBeside:
         d2 = Dot(0, 0, radius=10, color="blue")
         with pytest.raises(ValueError, match="must be in a surface"):
             d2.place_beside(d1, "right")
+
+
+# =========================================================================
+# Photo mosaics: TileLibrary and Picture
+# =========================================================================
+
+_TILE_COLORS = {
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "white": (255, 255, 255),
+    "pink": (255, 170, 170),
+}
+
+
+def _tile_library(tmp_path: Path, detail: int = 1):
+    from PIL import Image as PILImage
+
+    from pyfreeform import TileLibrary
+
+    paths = []
+    for name, rgb in _TILE_COLORS.items():
+        paths.append(tmp_path / f"{name}.png")
+        PILImage.new("RGB", (12, 8), rgb).save(paths[-1])
+    return TileLibrary.build(paths, detail=detail)
+
+
+class TestPhotoMosaic:
+    def test_build_and_match_quadrants(self, tmp_path):
+        library = _tile_library(tmp_path)
+        assert len(library) == 5 and library.detail == 1
+        grid = Grid.from_image(_make_quadrant_image(40), cols=4, rows=4)
+        names = np.array([Path(p).stem for p in library.paths])[library.match(grid)]
+        assert names[0, 0] == "red" and names[0, 3] == "green"
+        assert names[3, 0] == "blue" and names[3, 3] == "white"
+
+    def test_nearest_is_exact(self, tmp_path):
+        library = _tile_library(tmp_path)
+        queries = np.random.default_rng(1).uniform(-50, 100, (200, 3))
+        indices, distances = library.nearest(queries, k=2)
+        brute = np.linalg.norm(queries[:, None] - library._descriptors[None], axis=-1)
+        assert np.array_equal(indices, np.argsort(brute, axis=1)[:, :2])
+        assert np.allclose(distances, np.sort(brute, axis=1)[:, :2])
+
+    def test_repeat_penalty_spreads_tiles(self, tmp_path):
+        library = _tile_library(tmp_path)
+        grid = Grid.from_image(_make_image(20, 20, 250, 20, 20), cols=4, rows=4)
+        assert len(np.unique(library.match(grid))) == 1
+        assert len(np.unique(library.match(grid, repeat_penalty=500.0))) > 1
+
+    def test_detail_descriptors(self, tmp_path):
+        library = _tile_library(tmp_path, detail=2)
+        grid = Grid.from_image(_make_quadrant_image(40), cols=2, rows=2)
+        assert library.cell_descriptors(grid).shape == (4, 12)
+        names = np.array([Path(p).stem for p in library.paths])[library.match(grid)]
+        assert names.tolist() == [["red", "green"], ["blue", "white"]]
+
+    def test_save_load_roundtrip(self, tmp_path):
+        from pyfreeform import TileLibrary
+
+        library = _tile_library(tmp_path, detail=2)
+        library.save(tmp_path / "tiles.npz")
+        loaded = TileLibrary.load(tmp_path / "tiles.npz")
+        assert loaded.paths == library.paths and loaded.detail == 2
+        assert np.allclose(loaded._descriptors, library._descriptors)
+
+    def test_place_shares_one_symbol_per_tile(self, tmp_path):
+        library = _tile_library(tmp_path)
+        scene = Scene.from_image(_make_quadrant_image(40), grid_size=4, cell_size=10)
+        pictures = library.place(scene.grid, href=lambda p: Path(p).name)
+        assert len(pictures) == 16
+        svg = scene.to_svg()
+        assert svg.count("<symbol") == 4 and svg.count("<use ") == 16
+        assert 'href="red.png"' in svg and 'viewBox="0 0 1.5 1"' in svg
+
+    def test_picture_validation_and_anchors(self):
+        from pyfreeform import Picture
+
+        with pytest.raises(ValueError):
+            Picture(0, 0, 10, 10, "a.png", fit="cover")
+        with pytest.raises(ValueError):
+            Picture(0, 0, 10, 10, "a.png", aspect=0)
+        pic = Picture(10, 20, 30, 40, "a.png")
+        assert pic.bounds() == (10, 20, 40, 60)
+        assert tuple(pic.anchor("center")) == (25, 40)
+        assert pic.symbol_id != Picture(0, 0, 1, 1, "b.png").symbol_id
+
+
+# =========================================================================
+# Viewport culling
+# =========================================================================
+
+
+class TestViewportCulling:
+    """Content outside a crop/trim viewBox is left out of the SVG."""
+
+    def _scene(self):
+        scene = Scene(400, 400)
+        scene.place(Dot(50, 50, radius=5, color="red"))
+        scene.place(Dot(350, 350, radius=5, color="blue"))
+        return scene
+
+    def test_no_viewbox_renders_everything(self):
+        svg = self._scene().to_svg()
+        assert "red" in svg and "blue" in svg
+
+    def test_trim_culls_outside_entities(self):
+        scene = self._scene()
+        scene.trim(right=200, bottom=200)
+        svg = scene.to_svg()
+        assert "red" in svg
+        assert "blue" not in svg
+
+    def test_partially_visible_entity_is_kept(self):
+        scene = self._scene()
+        scene.trim(right=48, bottom=48)  # blue dot reaches x = 355
+        assert "blue" in scene.to_svg()
+
+    def test_culled_defs_are_dropped(self):
+        scene = Scene(400, 400)
+        scene.place(Dot(50, 50, radius=5))
+        far = scene.add_line(start=(0.9, 0.9), end=(0.95, 0.95), end_cap="arrow")
+        assert "<marker" in scene.to_svg()
+        scene.trim(right=200, bottom=200)
+        svg = scene.to_svg()
+        assert "<marker" not in svg
+        assert far.end_cap == "arrow"
+
+    def test_connections_are_culled(self):
+        scene = Scene(400, 400)
+        a = scene.place(Dot(300, 300, radius=2))
+        b = scene.place(Dot(380, 380, radius=2))
+        a.connect(b, color="green")
+        assert "green" in scene.to_svg()
+        scene.trim(right=200, bottom=200)
+        assert "green" not in scene.to_svg()
+
+    def test_animated_travel_keeps_entity(self):
+        scene = self._scene()
+        mover = scene.add_dot(at=(0.9, 0.1), radius=0.01, color="orange")
+        mover.animate_move(to=(0.1, 0.1))
+        scene.trim(right=200, bottom=200)
+        assert "orange" in scene.to_svg()
+        assert "blue" not in scene.to_svg()
+
+    def test_orbiting_entity_is_kept(self):
+        scene = self._scene()
+        orbiter = scene.add_dot(at=(0.9, 0.5), radius=0.01, color="purple")
+        orbiter.animate_spin(360, pivot=(0.5, 0.5))
+        scene.trim(right=200, bottom=200)
+        assert "purple" in scene.to_svg()
+
+    def test_static_renderer_uses_static_pose(self):
+        from pyfreeform.renderers import SVGRenderer
+
+        scene = self._scene()
+        mover = scene.add_dot(at=(0.9, 0.1), radius=0.01, color="orange")
+        mover.animate_move(to=(0.1, 0.1))
+        scene.trim(right=200, bottom=200)
+        assert "orange" not in SVGRenderer().render_scene(scene)
+
+    def test_rotated_text_is_kept(self):
+        from pyfreeform.renderers import SVGRenderer
+
+        scene = Scene(400, 400)
+        scene.add_text("A long vertical label down the page", at=(0.5, 0.5), rotation=90)
+        scene._viewbox = (190, 0, 20, 120)
+        assert "vertical label" in scene.to_svg()
+        assert "vertical label" in SVGRenderer().render_scene(scene)
+
+    def test_textpath_text_is_kept(self):
+        scene = Scene(400, 400)
+        curve = scene.add_curve(start=(0.1, 0.05), end=(0.1, 0.95), curvature=0.1)
+        scene.add_text("Text running along a vertical curve", along=curve)
+        scene._viewbox = (20, 300, 40, 80)
+        assert "vertical curve" in scene.to_svg()
+
+
+# =========================================================================
+# Tiled export
+# =========================================================================
+
+
+class TestSaveTiles:
+    """scene.save_tiles() splits a scene into SVG tiles and a manifest."""
+
+    def _scene(self):
+        scene = Scene(300, 200)
+        scene.place(Dot(50, 50, radius=5, color="red"))
+        scene.place(Dot(250, 150, radius=5, color="blue"))
+        scene.place(Dot(100, 100, radius=5, color="lime"))  # on the 4-tile corner
+        return scene
+
+    def _manifest(self, path):
+        import json
+
+        return json.loads(Path(path).read_text())
+
+    def test_manifest_describes_grid(self, tmp_path):
+        manifest = self._manifest(self._scene().save_tiles(tmp_path, 100, processes=1))
+        assert (manifest["rows"], manifest["columns"]) == (2, 3)
+        assert len(manifest["tiles"]) == 6
+        tile = manifest["tiles"][4]
+        assert (tile["row"], tile["column"], tile["file"]) == (1, 1, "tile_001_001.svg")
+        assert tile["bounds"] == [100, 100, 100, 100]
+        assert (tmp_path / tile["file"]).exists()
+
+    def test_content_goes_to_touching_tiles(self, tmp_path):
+        self._scene().save_tiles(tmp_path, 100, processes=1)
+
+        def read(row, col):
+            return (tmp_path / f"tile_{row:03d}_{col:03d}.svg").read_text()
+
+        assert "red" in read(0, 0) and "red" not in read(0, 1)
+        assert "blue" in read(1, 2) and "blue" not in read(0, 0)
+        assert all("lime" in read(r, c) for r, c in [(0, 0), (0, 1), (1, 0), (1, 1)])
+        assert "lime" not in read(0, 2)
+
+    def test_overlap_widens_tiles(self, tmp_path):
+        manifest = self._manifest(self._scene().save_tiles(tmp_path, 100, overlap=10, processes=1))
+        tile = manifest["tiles"][1]
+        assert tile["viewBox"] == [90, -10, 120, 120]
+        assert 'viewBox="90 -10 120 120"' in (tmp_path / tile["file"]).read_text()
+        # red (x 45-55) is 35 px left of tile (0, 1): still outside its overlap
+        assert "red" not in (tmp_path / tile["file"]).read_text()
+
+    def test_tiles_cover_viewbox(self, tmp_path):
+        scene = self._scene()
+        scene.trim(left=200)
+        manifest = self._manifest(scene.save_tiles(tmp_path, (100, 200), processes=1))
+        assert (manifest["rows"], manifest["columns"]) == (1, 1)
+        svg = (tmp_path / "tile_000_000.svg").read_text()
+        assert "blue" in svg and "red" not in svg
+
+    def test_parallel_matches_serial(self, tmp_path):
+        scene = self._scene()
+        scene.save_tiles(tmp_path / "serial", 100, processes=1)
+        scene.save_tiles(tmp_path / "parallel", 100, processes=2)
+        for path in (tmp_path / "serial").iterdir():
+            assert path.read_text() == (tmp_path / "parallel" / path.name).read_text()
+
+    def test_rotated_text_reaches_every_tile_it_crosses(self, tmp_path):
+        scene = Scene(200, 400)
+        scene.add_text("A long vertical label down the page", at=(0.5, 0.35), rotation=90)
+        scene.save_tiles(tmp_path, 200, processes=1)
+        for row in (0, 1):
+            assert "vertical label" in (tmp_path / f"tile_{row:03d}_000.svg").read_text()
+
+    def test_invalid_arguments(self, tmp_path):
+        scene = self._scene()
+        with pytest.raises(ValueError, match="tile_size"):
+            scene.save_tiles(tmp_path, 0)
+        with pytest.raises(ValueError, match="overlap"):
+            scene.save_tiles(tmp_path, 100, overlap=-1)
+        with pytest.raises(TypeError, match="SVGRenderer"):
+            scene.save_tiles(tmp_path, 100, renderer=object())
+
+
+# =========================================================================
+# Level of detail
+# =========================================================================
+
+
+class TestLevelOfDetail:
+    """render(min_feature_px=...) drops and simplifies sub-pixel detail."""
+
+    @staticmethod
+    def _wave_path(start, end, amplitude, **kwargs):
+        from pyfreeform import Path as PathEntity
+        from pyfreeform.paths import Wave
+
+        return PathEntity(Wave(start, end, amplitude=amplitude), **kwargs)
+
+    def test_default_render_is_exact(self):
+        from pyfreeform.renderers import SMILRenderer
+
+        scene = Scene(100, 100)
+        scene.place(Dot(10, 10, radius=0.01))
+        assert scene.render() == scene.render(renderer=SMILRenderer())
+        assert "<circle" in scene.render()
+
+    def test_options_only_override_what_is_given(self):
+        from pyfreeform.renderers import SVGRenderer
+
+        scene = Scene(1000, 1000)
+        scene.place(Dot(10, 10, radius=2, color="red"))
+        renderer = SVGRenderer(min_feature_px=1)
+        assert 'fill="red"' not in scene.render(renderer, output_scale=0.1)
+        assert renderer.output_scale == 1.0  # the caller's renderer is untouched
+        with pytest.raises(ValueError, match="min_feature_px"):
+            scene.render(SVGRenderer(), min_feature_px=-1)
+        with pytest.raises(ValueError, match="output_scale"):
+            scene.render(output_scale=0)
+
+    def test_drops_sub_feature_entities(self):
+        scene = Scene(1000, 1000)
+        scene.place(Dot(10, 10, radius=2, color="red"))
+        scene.place(Dot(50, 50, radius=20, color="blue"))
+        svg = scene.render(min_feature_px=1, output_scale=0.1)
+        # 4 units across = 0.4 px at a tenth of the size
+        assert 'fill="red"' not in svg and 'fill="blue"' in svg
+
+    def test_viewbox_zoom_counts_toward_scale(self):
+        scene = Scene(1000, 1000)
+        scene.place(Dot(10, 10, radius=2, color="red"))
+        scene.trim(right=900, bottom=900)  # 100-unit viewBox shown 1000 px wide
+        assert 'fill="red"' in scene.render(min_feature_px=1, output_scale=0.1)
+
+    def test_merges_coinciding_dots(self):
+        scene = Scene(1000, 1000)
+        for dx in (0.0, 0.1, 0.2):
+            scene.place(Dot(100 + dx, 100, radius=10))
+        scene.place(Dot(500, 100, radius=10))
+        svg = scene.render(min_feature_px=1, output_scale=0.1)
+        assert svg.count("<circle") == 2
+
+    def test_keeps_dots_drawn_over_something_else(self):
+        scene = Scene(1000, 1000)
+        scene.place(Dot(100, 100, radius=10, color="red"))
+        scene.place(Rect(80, 80, 40, 40, fill="blue"))
+        scene.place(Dot(100, 100, radius=10, color="red"))
+        scene.place(Dot(100, 100, radius=10, color="red"))
+        svg = scene.render(min_feature_px=1, output_scale=0.1)
+        assert svg.count("<circle") == 2
+        assert svg.rindex("<circle") > svg.index("<rect")
+
+    def test_reduces_path_segments(self):
+        scene = Scene(1000, 1000)
+        path = scene.place(self._wave_path((0, 500), (1000, 500), 50, segments=64))
+        svg = scene.render(min_feature_px=0.5, output_scale=0.1)
+        assert 1 < svg.count(" C ") < 64
+        assert len(path._bezier_segments) == 64  # the scene is untouched
+
+    def test_collapses_tiny_paths(self):
+        scene = Scene(1000, 1000)
+        scene.place(self._wave_path((0, 0), (15, 0), 2, color="red"))
+        scene.place(
+            self._wave_path((100, 100), (110, 100), 3, closed=True, fill="blue", color="blue")
+        )
+        svg = scene.render(min_feature_px=0.5, output_scale=0.1)
+        assert "<path" not in svg
+        assert '<line x1="0" y1="0" x2="15"' in svg
+        assert "<circle" in svg
+
+    def test_thins_dot_clouds(self):
+        from pyfreeform import DotCloud
+
+        points = [(10, 10), (10.05, 10), (50, 50), (90, 90)]
+        scene = Scene(100, 100)
+        scene.place(DotCloud(points, radius=[1, 1, 1, 0.1]))
+        svg = scene.render(min_feature_px=1)
+        assert svg.count("M") == 2
+
+    def test_animated_entities_are_kept(self):
+        from pyfreeform.renderers import SVGRenderer
+
+        scene = Scene(1000, 1000)
+        dot = scene.place(Dot(10, 10, radius=1, color="red"))
+        dot.animate_scale(100, duration=1)
+        assert 'fill="red"' in scene.render(min_feature_px=1, output_scale=0.1)
+        assert 'fill="red"' not in scene.render(SVGRenderer(), min_feature_px=1, output_scale=0.1)
+
+    def test_invalid_options(self):
+        from pyfreeform.renderers import SVGRenderer
+
+        with pytest.raises(ValueError, match="output_scale"):
+            SVGRenderer(output_scale=0)
+        with pytest.raises(ValueError, match="min_feature_px"):
+            SVGRenderer(min_feature_px=-1)
+
+
+# =========================================================================
+# Occlusion culling
+# =========================================================================
+
+
+class TestOcclusionCulling:
+    """render(cull_occluded=True) skips content under later opaque rects."""
+
+    def test_off_by_default(self):
+        scene = Scene(100, 100)
+        scene.place(Dot(50, 50, radius=5, color="red"))
+        scene.place(Rect(0, 0, 100, 100, fill="white", z_index=1))
+        assert 'fill="red"' in scene.render()
+
+    def test_hides_content_under_cell_fill(self):
+        scene = Scene.with_grid(cols=3, rows=3, cell_size=20)
+        for cell in scene.grid:
+            cell.add_dot(radius=0.2, color="red")
+            cell.add_fill(color="white", z_index=1)
+            cell.add_dot(radius=0.2, color="blue", z_index=2)
+        svg = scene.render(cull_occluded=True)
+        assert 'fill="red"' not in svg
+        assert svg.count('fill="blue"') == 9
+
+    def test_draw_order_decides(self):
+        scene = Scene(100, 100)
+        scene.place(Rect(0, 0, 100, 100, fill="white"))
+        scene.place(Dot(50, 50, radius=5, color="red"))  # same z, added later: on top
+        scene.place(Dot(60, 60, radius=5, color="blue", z_index=-1))  # below
+        svg = scene.render(cull_occluded=True)
+        assert 'fill="red"' in svg and 'fill="blue"' not in svg
+
+    def test_partial_cover_is_kept(self):
+        scene = Scene(100, 100)
+        scene.place(Dot(48, 50, radius=5, color="red"))
+        scene.place(Rect(45, 0, 55, 100, fill="white", z_index=1))
+        assert 'fill="red"' in scene.render(cull_occluded=True)
+
+    @pytest.mark.parametrize(
+        "rect_kwargs",
+        [
+            {"fill": "white", "opacity": 0.5},
+            {"fill": "white", "fill_opacity": 0.9},
+            {"fill": "white", "rotation": 10},
+            {"fill": None, "stroke": "black"},
+            {"fill": "transparent"},
+        ],
+    )
+    def test_only_opaque_plain_rects_occlude(self, rect_kwargs):
+        scene = Scene(100, 100)
+        scene.place(Dot(50, 50, radius=5, color="red"))
+        scene.place(Rect(0, 0, 100, 100, z_index=1, **rect_kwargs))
+        assert 'fill="red"' in scene.render(cull_occluded=True)
+
+    def test_animated_occluder_does_not_hide(self):
+        from pyfreeform.renderers import SVGRenderer
+
+        scene = Scene(100, 100)
+        scene.place(Dot(50, 50, radius=5, color="red"))
+        cover = scene.place(Rect(0, 0, 100, 100, fill="white", z_index=1))
+        cover.animate_fade(to=0, duration=1)
+        assert 'fill="red"' in scene.render(cull_occluded=True)
+        assert 'fill="red"' not in scene.render(SVGRenderer(), cull_occluded=True)
+
+    def test_hides_covered_connections(self):
+        scene = Scene(100, 100)
+        a = scene.place(Dot(30, 50, radius=2))
+        b = scene.place(Dot(70, 50, radius=2))
+        a.connect(b, color="red")
+        scene.place(Rect(0, 0, 100, 100, fill="white", z_index=1))
+        assert 'stroke="red"' not in scene.render(cull_occluded=True)
+
+
+# =========================================================================
+# Layer order
+# =========================================================================
+
+
+class TestLayerOrder:
+    """Output is ordered by z_index; ties keep connections first, then add order."""
+
+    @staticmethod
+    def _scene() -> Scene:
+        scene = Scene(100, 100)
+        scene.place(Dot(10, 10, radius=1, color="red", z_index=2))
+        a = scene.place(Dot(20, 20, radius=1, color="green"))
+        scene.place(Dot(30, 30, radius=1, color="blue", z_index=-1))
+        b = scene.place(Dot(40, 40, radius=1, color="gold"))
+        a.connect(b, color="purple")
+        return scene
+
+    @pytest.mark.parametrize("animated", [False, True])
+    def test_layers_in_order(self, animated):
+        from pyfreeform.renderers import SVGRenderer
+
+        scene = self._scene()
+        svg = scene.render() if animated else scene.render(SVGRenderer())
+        order = ["blue", "purple", "green", "gold", "red"]
+        positions = [svg.index(f'="{color}"') for color in order]
+        assert positions == sorted(positions)
+        assert svg.endswith("</svg>")
+
+    def test_empty_scene(self):
+        assert Scene(10, 10).render().endswith("\n</svg>")
+
+
+# =========================================================================
+# Scene fingerprints
+# =========================================================================
+
+
+class TestFingerprint:
+    """scene.fingerprint() and save(skip_if_unchanged=True)."""
+
+    @staticmethod
+    def _scene(radius: float = 0.3) -> Scene:
+        scene = Scene.with_grid(cols=3, rows=3, cell_size=10)
+        for cell in scene.grid:
+            cell.add_dot(radius=radius, color="red")
+        a = scene.place(Dot(5, 5, radius=2))
+        b = scene.place(Dot(25, 25, radius=2))
+        a.connect(b, color="blue")
+        b.animate_fade(to=0, duration=1)
+        return scene
+
+    def test_stable_and_sensitive(self):
+        fingerprint = self._scene().fingerprint()
+        assert fingerprint == self._scene().fingerprint()
+        assert fingerprint != self._scene(radius=0.4).fingerprint()
+        changed = self._scene()
+        changed.entities[-1].animate_fade(to=1, duration=2)
+        assert fingerprint != changed.fingerprint()
+        changed = self._scene()
+        changed.connections[0].z_index = 3
+        assert fingerprint != changed.fingerprint()
+
+    def test_covers_renderer_options(self):
+        from pyfreeform.renderers import SVGRenderer
+
+        scene = self._scene()
+        fingerprints = {
+            scene.fingerprint(),
+            scene.fingerprint(SVGRenderer()),
+            scene.fingerprint(cull_occluded=True),
+            scene.fingerprint(min_feature_px=0.5),
+        }
+        assert len(fingerprints) == 4
+
+    def test_ignores_caches_and_data(self):
+        scene = self._scene()
+        fingerprint = scene.fingerprint()
+        scene.query((0, 0, 30, 30))
+        scene.entities[0].data["note"] = "kept out"
+        assert scene.fingerprint() == fingerprint
+
+    def test_unstable_state_has_no_fingerprint(self):
+        scene = self._scene()
+        scene.entities[0].hook = lambda: None
+        assert scene.fingerprint() is None
+
+    def test_save_skips_unchanged(self, tmp_path):
+        path = tmp_path / "art.svg"
+        assert self._scene().save(path, skip_if_unchanged=True)
+        path.write_text("sentinel")
+        assert not self._scene().save(path, skip_if_unchanged=True)
+        assert path.read_text() == "sentinel"
+        assert self._scene(radius=0.4).save(path, skip_if_unchanged=True)
+        assert path.read_text().startswith("<?xml")
+        # Without the output file, the sidecar alone is not trusted
+        path.unlink()
+        assert self._scene(radius=0.4).save(path, skip_if_unchanged=True)
+        assert path.exists()
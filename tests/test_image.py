@@ -5,14 +5,17 @@ constant-channel resize bug: a fully-opaque image has a constant alpha (255),
 and a solid-color image has constant RGB — both used to resize to all-zeros.
 """
 
+import os
+
 import numpy as np
 import pytest
 from PIL import Image as PILImage
 
 import pyfreeform as pf
 from pyfreeform.image.image import Image
+from pyfreeform.image.integral import SummedAreaTable
 from pyfreeform.image.layer import Layer
-from pyfreeform.image.resize import resize_array, fit_dimensions, downscale_array
+from pyfreeform.image.resize import resize_array, fit_dimensions, downscale_array, halve_array
 
 
 # ---------------------------------------------------------------------------
@@ -112,6 +115,477 @@ class TestLayer:
             Layer(np.zeros((2, 2, 2)))
 
 
+# ---------------------------------------------------------------------------
+# Color-space layers — computed over the whole image
+# ---------------------------------------------------------------------------
+def test_layer_dither_on_0_255_scale():
+    layer = Layer(np.full((16, 16), 64.0))
+    dithered = layer.dither("floyd-steinberg")
+    assert set(np.unique(dithered.data)) == {0.0, 255.0}
+    assert abs(dithered.data.mean() - 64.0) < 4.0
+    assert np.array_equal(layer.dither("bayer", levels=5).data, np.full((16, 16), 63.75))
+
+
+class TestColorSpaceLayers:
+    def _image(self):
+        rng = np.random.default_rng(3)
+        return Image(*(rng.integers(0, 256, (6, 8)).astype(np.float64) for _ in range(3)))
+
+    def test_hsl_matches_color(self):
+        img = self._image()
+        for x, y in [(0, 0), (3, 2), (7, 5)]:
+            h, s, l = pf.Color(img.hex_at(x, y)).to_hsl()
+            assert img["hue"][x, y] == pytest.approx(h, abs=0.01)
+            assert img["saturation"][x, y] == pytest.approx(s, abs=1e-4)
+            assert img["lightness"][x, y] == pytest.approx(l, abs=1e-4)
+
+    def test_gray_has_zero_hue_and_saturation(self):
+        gray = np.full((2, 2), 90.0)
+        img = Image(gray, gray, gray)
+        assert np.all(img["hue"].data == 0)
+        assert np.all(img["saturation"].data == 0)
+
+    def test_lab_and_luminance_reference_values(self):
+        red = np.array([[255.0, 255.0]])
+        zero = np.array([[0.0, 255.0]])
+        img = Image(red, zero, zero)  # pure red, white
+        assert img["L"][0, 0] == pytest.approx(53.24, abs=0.01)
+        assert img["a"][0, 0] == pytest.approx(80.09, abs=0.01)
+        assert img["b"][0, 0] == pytest.approx(67.20, abs=0.01)
+        assert img["L"][1, 0] == pytest.approx(100.0, abs=0.01)
+        assert img["luminance"][0, 0] == pytest.approx(0.2126)
+        assert img["luminance"][1, 0] == pytest.approx(1.0)
+        assert img["value"][0, 0] == 1.0
+
+    def test_layers_are_cached_together(self):
+        img = self._image()
+        hue = img["hue"]
+        assert img["hue"] is hue
+        assert "saturation" in img._layers and "L" not in img._layers
+
+    def test_resize_rebuilds_computed_layers(self):
+        img = self._image()
+        img["hue"]
+        small = img.resize(4, 3)
+        assert "hue" not in small._layers
+        assert small["hue"].shape == (3, 4)
+
+
+# ---------------------------------------------------------------------------
+# FilterPipeline — lazy, fused layer filters
+# ---------------------------------------------------------------------------
+class TestFilterPipeline:
+    def _layer(self, height=20, width=30):
+        rng = np.random.default_rng(5)
+        return Layer(rng.random((height, width)) * 255)
+
+    def test_point_operations_fuse(self):
+        pipeline = pf.FilterPipeline().scale(2).add(5).scale(0.5).clip().clip(10, 300)
+        assert pipeline.steps == ("affine", "clip")
+        assert pipeline.apply(Layer(np.array([[0.0, 100.0, 200.0]]))).data.tolist() == [
+            [10.0, 102.5, 202.5]
+        ]
+        assert pf.FilterPipeline().scale(2).scale(0.5).steps == ()
+
+    def test_levels_and_gamma(self):
+        layer = self._layer()
+        out = pf.FilterPipeline().levels(50, 200, gamma=2.0).apply(layer, dtype=np.float64)
+        expected = np.clip((layer.data - 50) / 150, 0, 1) ** 0.5 * 255
+        np.testing.assert_allclose(out.data, expected)
+
+    def test_blur_matches_direct_convolution(self):
+        from pyfreeform.image.filters import _gaussian_kernel
+
+        layer = self._layer()
+        out = pf.FilterPipeline().blur(1.5).apply(layer, dtype=np.float64)
+        kernel = _gaussian_kernel(1.5)
+        radius = len(kernel) // 2
+        padded = np.pad(layer.data, radius, mode="edge")
+        expected = np.zeros_like(layer.data)
+        for i, wy in enumerate(kernel):
+            for j, wx in enumerate(kernel):
+                expected += wy * wx * padded[i : i + 20, j : j + 30]
+        np.testing.assert_allclose(out.data, expected)
+
+    def test_blur_keeps_constant_and_mean(self):
+        flat = Layer(np.full((4, 5), 80.0))
+        assert np.allclose(pf.FilterPipeline().blur(3).apply(flat).data, 80.0)
+
+    def test_unsharp_increases_contrast_and_clips(self):
+        step = Layer(np.repeat([[50.0] * 5 + [200.0] * 5], 3, axis=0))
+        out = pf.FilterPipeline().unsharp(sigma=1, amount=2).apply(step).data
+        assert out[:, 4].max() < 50 and out[:, 5].min() > 200
+        assert out.min() >= 0 and out.max() <= 255
+
+    def test_equalize_spreads_values(self):
+        layer = Layer(np.array([[10.0, 10.0, 20.0, 30.0]]))
+        out = pf.FilterPipeline().equalize().apply(layer).data
+        assert out.tolist() == [[0.0, 0.0, 127.5, 255.0]]
+
+    def test_threshold(self):
+        layer = Layer(np.array([[0.0, 127.0, 128.0, 255.0]]))
+        out = pf.FilterPipeline().threshold(128, low=1, high=9).apply(layer).data
+        assert out.tolist() == [[1.0, 1.0, 9.0, 9.0]]
+
+    def test_layer_arithmetic(self):
+        a = Layer(np.array([[1.0, 2.0]]))
+        b = Layer(np.array([[10.0, 20.0]]))
+        assert pf.FilterPipeline().add(b, 0.5).apply(a).data.tolist() == [[6.0, 12.0]]
+        assert pf.FilterPipeline().subtract(b).apply(a).data.tolist() == [[-9.0, -18.0]]
+        assert pf.FilterPipeline().multiply(b).apply(a).data.tolist() == [[10.0, 40.0]]
+        with pytest.raises(ValueError):
+            pf.FilterPipeline().add(Layer(np.zeros((2, 2)))).apply(a)
+
+    def test_in_place(self):
+        layer = self._layer()
+        assert layer.integral.sum(0, 0, 1, 1) == pytest.approx(layer.data[0, 0])  # now cached
+        result = layer.filter(pf.FilterPipeline().invert(), in_place=True)
+        assert result is layer
+        assert layer.integral.sum(0, 0, 1, 1) == pytest.approx(layer.data[0, 0])
+
+    def test_pipeline_is_immutable_and_reusable(self):
+        base = pf.FilterPipeline().blur(1)
+        base.threshold()
+        assert base.steps == ("blur",)
+        first, second = base(self._layer()), base(self._layer())
+        np.testing.assert_array_equal(first.data, second.data)
+
+    def test_image_filter_keeps_alpha(self):
+        red = np.full((3, 3), 100.0)
+        img = Image(red, red, red, alpha=np.full((3, 3), 255.0))
+        out = img.filter(pf.FilterPipeline().invert())
+        assert out.rgb_at(0, 0) == (155, 155, 155)
+        assert out.alpha_at(0, 0) == 1.0
+        assert out["red"].data.dtype == np.float32
+        assert not np.shares_memory(out["alpha"].data, img["alpha"].data)
+        with pytest.raises(KeyError):
+            img.filter(pf.FilterPipeline(), channels=("brightness",))
+
+
+# ---------------------------------------------------------------------------
+# TiledImage — windowed reads and streamed grid ingestion
+# ---------------------------------------------------------------------------
+def _pixels(height=61, width=43, channels=3):
+    rng = np.random.default_rng(11)
+    return rng.integers(0, 256, (height, width, channels), dtype=np.uint8)
+
+
+def _box_average(pixels, cols, rows):
+    height, width = pixels.shape[:2]
+    cell_rows = (np.arange(height) * rows) // height
+    cell_cols = (np.arange(width) * cols) // width
+    sums = np.zeros((rows, cols, pixels.shape[2]))
+    counts = np.zeros((rows, cols))
+    np.add.at(sums, (cell_rows[:, None], cell_cols[None, :]), pixels.astype(np.float64))
+    np.add.at(counts, (cell_rows[:, None], cell_cols[None, :]), 1)
+    return sums / counts[..., None]
+
+
+class TestTiledImage:
+    @pytest.mark.parametrize("suffix, mapped", [(".tif", True), (".ppm", True), (".png", False)])
+    def test_read_matches_pixels(self, tmp_path, suffix, mapped):
+        pixels = _pixels()
+        path = tmp_path / f"img{suffix}"
+        PILImage.fromarray(pixels).save(path)
+        tiled = pf.TiledImage.open(path)
+        assert tiled.size == (43, 61) and tiled.is_mapped == mapped
+        window = tiled.read(5, 7, 20, 30)
+        np.testing.assert_array_equal(window[..., :3], pixels[7:30, 5:20])
+        assert np.all(window[..., 3] == 255)
+        assert tiled.rgb_at(9, 12) == tuple(pixels[12, 9].tolist())
+        assert tiled.read(40, 60, 100, 100).shape == (1, 3, 4)
+
+    def test_alpha_channel(self, tmp_path):
+        pixels = _pixels(channels=4)
+        path = tmp_path / "alpha.tif"
+        PILImage.fromarray(pixels).save(path)
+        tiled = pf.TiledImage.open(path)
+        assert tiled.has_alpha and tiled.is_mapped
+        assert tiled.alpha_at(3, 4) == pytest.approx(pixels[4, 3, 3] / 255)
+
+    @pytest.mark.parametrize("suffix", [".tif", ".png"])
+    def test_grid_layers_are_area_averages(self, tmp_path, suffix):
+        pixels = _pixels()
+        path = tmp_path / f"img{suffix}"
+        PILImage.fromarray(pixels).save(path)
+        grid = pf.Grid.from_image(pf.TiledImage.open(path), cols=8, rows=12)
+        expected = _box_average(pixels, cols=8, rows=12)
+        np.testing.assert_array_equal(grid.layer_array("color"), expected.astype(np.uint8))
+        brightness = expected @ np.array([0.299, 0.587, 0.114]) / 255
+        np.testing.assert_allclose(grid.brightness_array, brightness)
+
+    def test_stats_match_in_memory_image(self, tmp_path):
+        pixels = _pixels()
+        path = tmp_path / "img.tif"
+        PILImage.fromarray(pixels).save(path)
+        stats = ("std", "min", "max")
+        tiled = pf.Grid.from_image(pf.TiledImage.open(path), cols=8, rows=12, stats=stats)
+        loaded = pf.Grid.from_image(Image.load(path), cols=8, rows=12, stats=stats)
+        for stat in stats:
+            np.testing.assert_allclose(
+                tiled.layer_array(f"brightness_{stat}"),
+                loaded.layer_array(f"brightness_{stat}"),
+                atol=1e-6,
+            )
+        assert np.all(tiled.layer_array("brightness_min") <= tiled.brightness_array)
+
+    def test_cell_sampling_reads_on_demand(self, tmp_path):
+        pixels = _pixels()
+        path = tmp_path / "img.tif"
+        PILImage.fromarray(pixels).save(path)
+        tiled_grid = pf.Grid.from_image(pf.TiledImage.open(path), cols=8, rows=12)
+        loaded_grid = pf.Grid.from_image(Image.load(path), cols=8, rows=12)
+        a, b = tiled_grid[5][3], loaded_grid[5][3]
+        assert a.sample_image(0.3, 0.6) == b.sample_image(0.3, 0.6)
+        assert a.region_stats().mean == pytest.approx(b.region_stats().mean)
+        assert a.region_stats(layer="hue").mean == pytest.approx(b.region_stats(layer="hue").mean)
+
+    def test_compressed_file_decoded_once_for_many_reads(self, tmp_path, monkeypatch):
+        from pyfreeform.image import tiled as tiled_module
+
+        pixels = _pixels()
+        path = tmp_path / "img.tif"
+        PILImage.fromarray(pixels).save(path, compression="tiff_lzw")
+        image = pf.TiledImage.open(path)
+        assert not image.is_mapped
+        opened = []
+        real_open = tiled_module._open_unchecked
+        monkeypatch.setattr(
+            tiled_module, "_open_unchecked", lambda p: opened.append(p) or real_open(p)
+        )
+        for y in range(0, 60, 6):
+            window = image.read(3, y, 40, y + 5)
+            np.testing.assert_array_equal(window[..., :3], pixels[y : y + 5, 3:40])
+        assert len(opened) == 1
+        image.release()
+        assert image.rgb_at(9, 12) == tuple(pixels[12, 9].tolist())
+        assert len(opened) == 2
+
+    def test_decoded_size_limit_is_local(self, tmp_path):
+        for suffix in (".tif", ".png"):
+            PILImage.fromarray(_pixels()).save(tmp_path / f"img{suffix}")
+        limit = PILImage.MAX_IMAGE_PIXELS
+        assert pf.TiledImage.open(tmp_path / "img.tif", max_pixels=100).is_mapped
+        with pytest.raises(ValueError, match="max_pixels"):
+            pf.TiledImage.open(tmp_path / "img.png", max_pixels=100)
+        assert pf.TiledImage.open(tmp_path / "img.png", max_pixels=43 * 61).size == (43, 61)
+        assert limit == PILImage.MAX_IMAGE_PIXELS
+
+    def test_grid_finer_than_image_rejected(self, tmp_path):
+        path = tmp_path / "img.tif"
+        PILImage.fromarray(_pixels(height=4, width=4)).save(path)
+        with pytest.raises(ValueError):
+            pf.Grid.from_image(pf.TiledImage.open(path), cols=8, rows=8)
+
+
+# ---------------------------------------------------------------------------
+# Image.from_array / to_array — zero-copy interchange with NumPy
+# ---------------------------------------------------------------------------
+class TestImageFromArray:
+    def test_wraps_without_copy(self):
+        pixels = _pixels()
+        img = pf.Image.from_array(pixels)
+        assert img.size == (43, 61) and not img.has_alpha
+        assert np.shares_memory(img["red"].data, pixels)
+        assert img["green"].data.dtype == np.uint8
+        assert img.to_array() is pixels
+        assert img.rgb_at(9, 12) == tuple(pixels[12, 9].tolist())
+
+    def test_matches_copied_image(self):
+        pixels = _pixels(channels=4)
+        wrapped = pf.Image.from_array(pixels)
+        loaded = Image(*(pixels[..., i].astype(np.float64) for i in range(4)))
+        for name in ("brightness", "grayscale", "hue"):
+            np.testing.assert_allclose(wrapped[name].data, loaded[name].data)
+        a = pf.Grid.from_image(wrapped, cols=8, rows=12)
+        b = pf.Grid.from_image(loaded, cols=8, rows=12)
+        np.testing.assert_array_equal(a.layer_array("color"), b.layer_array("color"))
+
+    def test_grayscale_and_float32(self):
+        field = np.linspace(0, 255, 20, dtype=np.float32).reshape(4, 5)
+        img = pf.Image.from_array(field)
+        assert img.rgb_at(4, 3) == (255, 255, 255)
+        assert img["brightness"].data[3, 4] == pytest.approx(255)
+        assert img.to_array().shape == (4, 5, 3)
+
+    def test_copy_and_writes(self):
+        pixels = _pixels()
+        owned = pf.Image.from_array(pixels, copy=True)
+        assert not np.shares_memory(owned["red"].data, pixels)
+        shared = pf.Image.from_array(pixels)
+        shared["red"][0, 0] = 7
+        assert pixels[0, 0, 0] == 7
+
+    def test_in_place_filter_on_read_only_buffer(self):
+        pixels = _pixels()
+        pixels.flags.writeable = False
+        img = pf.Image.from_array(pixels)
+        img["red"].filter(pf.FilterPipeline().invert(), in_place=True)
+        np.testing.assert_array_equal(img["red"].data, 255.0 - pixels[..., 0])
+        assert img.to_array() is not pixels
+
+    def test_pil_image(self):
+        pixels = _pixels()
+        img = pf.Image.from_array(PILImage.fromarray(pixels))
+        np.testing.assert_array_equal(img.to_array(), pixels)
+        palette = PILImage.fromarray(pixels).convert("P")
+        assert pf.Image.from_array(palette).has_alpha
+
+    def test_loaded_image_to_array(self, tmp_path):
+        path = tmp_path / "img.png"
+        PILImage.fromarray(_pixels()).save(path)
+        array = Image.load(path).to_array(np.uint8)
+        assert array.shape == (61, 43, 4)
+        np.testing.assert_array_equal(array[..., :3], _pixels())
+
+    @pytest.mark.parametrize("shape", [(4,), (4, 5, 2), (2, 4, 5, 3)])
+    def test_rejects_non_image_shapes(self, shape):
+        with pytest.raises(ValueError):
+            pf.Image.from_array(np.zeros(shape))
+
+    def test_rejects_non_numeric(self):
+        with pytest.raises(TypeError):
+            pf.Image.from_array(np.zeros((4, 5, 3), dtype=bool))
+
+
+# ---------------------------------------------------------------------------
+# Image pyramid — cached 2x box reductions for multi-resolution access
+# ---------------------------------------------------------------------------
+class TestImagePyramid:
+    def test_halve_array_odd_sizes(self):
+        arr = np.arange(15, dtype=np.float64).reshape(3, 5)
+        out = halve_array(arr)
+        assert out.shape == (2, 3)
+        assert out[0, 0] == pytest.approx(arr[:2, :2].mean())
+        assert out[1, 2] == arr[2, 4]  # edge pixel paired with its own copy
+
+    def test_levels_are_box_averages_and_cached(self):
+        pixels = _pixels(height=64, width=48)
+        img = pf.Image.from_array(pixels)
+        assert img.pyramid_depth == 7 and img.pyramid_level(0) is img
+        level = img.pyramid_level(2)
+        assert level.size == (12, 16) and img.pyramid_level(2) is level
+        expected = pixels[:4, 4:8, 1].mean()
+        assert level["green"][1, 0] == pytest.approx(expected)
+        assert img.pyramid_level(6).size == (1, 1)
+        with pytest.raises(ValueError):
+            img.pyramid_level(7)
+
+    def test_resize_reads_nearest_level(self):
+        pixels = _pixels(height=256, width=192)
+        img = pf.Image.from_array(pixels)
+        resized = img.resize(24, 32)
+        assert len(img._levels) == 3  # 192 -> 96 -> 48 -> 24
+        direct = resize_array(pixels[..., 0].astype(np.float64), 24, 32)
+        assert np.abs(resized["red"].data - direct).mean() < 4
+
+    def test_resize_from_padded_level_keeps_geometry(self):
+        # 1001 x 777 halves to edge-padded levels; the resize must not
+        # stretch the padding over the target
+        ramp = np.tile(np.linspace(0, 255, 1001), (777, 1))
+        img = pf.Image(ramp, ramp, ramp)
+        resized = img.resize(100, 77)
+        assert len(img._levels) == 3  # 1001 -> 501 -> 251 -> 126
+        direct = resize_array(ramp, 100, 77)
+        np.testing.assert_allclose(resized["red"].data, direct, atol=1.5)
+        assert resized["red"][99, 50] == pytest.approx(253.7, abs=1.0)
+
+    def test_sample_footprint_averages(self):
+        checker = (np.indices((64, 64)).sum(axis=0) % 2 * 255).astype(np.uint8)
+        grid = pf.Grid.from_image(pf.Image.from_array(checker), cols=8, rows=8)
+        cell = grid[3][4]
+        assert cell.sample_image(0.5, 0.5)[0] in (0, 255)
+        assert cell.sample_image(0.5, 0.5, footprint=0.5)[0] == 127
+        assert cell.sample_brightness(0.2, 0.7, footprint=1.0) == pytest.approx(127.5 / 255, abs=0.01)
+
+    def test_sample_footprint_on_tiled_image(self, tmp_path):
+        checker = (np.indices((64, 64)).sum(axis=0) % 2 * 255).astype(np.uint8)
+        path = tmp_path / "checker.tif"
+        PILImage.fromarray(checker).convert("RGB").save(path)
+        grid = pf.Grid.from_image(pf.TiledImage.open(path), cols=8, rows=8)
+        assert grid[3][4].sample_image(0.5, 0.5, footprint=0.5)[0] == 127
+
+
+# ---------------------------------------------------------------------------
+# ImageCache — on-disk .npy cache of decoded and resampled images
+# ---------------------------------------------------------------------------
+class TestImageCache:
+    def _photo(self, tmp_path):
+        path = tmp_path / "photo.png"
+        PILImage.fromarray(_pixels()).save(path)
+        return path
+
+    def test_warm_load_matches_decode(self, tmp_path):
+        path = self._photo(tmp_path)
+        cache = pf.ImageCache(tmp_path / "cache")
+        cold = cache.load(path)
+        assert len(list(cache.directory.glob("*.npy"))) == 1
+        warm = cache.load(path)
+        assert isinstance(warm.to_array().base, np.memmap)
+        reference = Image.load(path)
+        for name in ("red", "green", "blue", "alpha"):
+            np.testing.assert_array_equal(cold[name].data, reference[name].data)
+            np.testing.assert_array_equal(warm[name].data, reference[name].data)
+
+    def test_scene_from_image_caches_grid_layers(self, tmp_path):
+        path = self._photo(tmp_path)
+        cache = pf.ImageCache(tmp_path / "cache")
+        cold = pf.Scene.from_image(path, grid_size=8, cache=cache)
+        assert len(list(cache.directory.glob("*-8x11-*.npy"))) == 1
+        warm = pf.Scene.from_image(path, grid_size=8, cache=cache)
+        plain = pf.Scene.from_image(path, grid_size=8)
+        for scene in (cold, warm):
+            np.testing.assert_array_equal(
+                scene.grid.layer_array("color"), plain.grid.layer_array("color")
+            )
+            np.testing.assert_allclose(scene.grid.brightness_array, plain.grid.brightness_array)
+
+    @pytest.mark.parametrize("hash_contents", [False, True])
+    def test_changed_file_misses(self, tmp_path, hash_contents):
+        path = self._photo(tmp_path)
+        cache = pf.ImageCache(tmp_path / "cache", hash_contents=hash_contents)
+        cache.load(path)
+        PILImage.fromarray(255 - _pixels()).save(path)
+        os.utime(path, ns=(0, 0))
+        assert cache.load(path).rgb_at(0, 0) == tuple(255 - _pixels()[0, 0])
+        assert len(list(cache.directory.glob("*.npy"))) == 2
+
+    def test_lru_eviction(self, tmp_path):
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"photo{i}.png"
+            PILImage.fromarray(_pixels()).save(path)
+            paths.append(path)
+        entry_size = 61 * 43 * 4 + 128
+        cache = pf.ImageCache(tmp_path / "cache", max_bytes=2 * entry_size)
+        first = cache.load(paths[0])
+        cache.load(paths[1])
+        os.utime(cache.directory / f"{cache._keys[first]}.npy", ns=(0, 0))  # least recent
+        cache.load(paths[2])
+        assert cache.size_bytes <= cache.max_bytes
+        assert not (cache.directory / f"{cache._keys[first]}.npy").exists()
+
+    def test_hit_survives_concurrent_eviction(self, tmp_path, monkeypatch):
+        path = self._photo(tmp_path)
+        cache = pf.ImageCache(tmp_path / "cache")
+        cache.load(path)
+
+        def evicted(entry, *args, **kwargs):
+            raise FileNotFoundError(entry)
+
+        # The entry vanishes between mapping it and touching its mtime
+        monkeypatch.setattr(os, "utime", evicted)
+        assert cache.load(path).rgb_at(0, 0) == tuple(_pixels()[0, 0])
+
+    def test_clear_and_validation(self, tmp_path):
+        cache = pf.ImageCache(tmp_path / "cache")
+        cache.load(self._photo(tmp_path))
+        cache.clear()
+        assert cache.size_bytes == 0
+        with pytest.raises(ValueError):
+            pf.ImageCache(tmp_path / "other", max_bytes=-1)
+
+
 # ---------------------------------------------------------------------------
 # misc resize helpers
 # ---------------------------------------------------------------------------
@@ -127,3 +601,151 @@ class TestResizeHelpers:
         out = downscale_array(arr, 2)
         assert out.shape == (1, 2)
         assert np.allclose(out, [[0.0, 4.0]])
+
+
+# ---------------------------------------------------------------------------
+# SummedAreaTable — O(1) region statistics
+# ---------------------------------------------------------------------------
+class TestSummedAreaTable:
+    def test_matches_numpy_on_random_rectangles(self):
+        rng = np.random.default_rng(0)
+        data = rng.uniform(0, 255, (23, 31))
+        table = SummedAreaTable(data)
+        for _ in range(20):
+            x0, x1 = sorted(rng.integers(0, 32, 2))
+            y0, y1 = sorted(rng.integers(0, 24, 2))
+            x1, y1 = max(x1, x0 + 1), max(y1, y0 + 1)
+            block = data[y0:y1, x0:x1]
+            assert table.sum(x0, y0, x1, y1) == pytest.approx(block.sum())
+            assert table.mean(x0, y0, x1, y1) == pytest.approx(block.mean())
+            assert table.variance(x0, y0, x1, y1) == pytest.approx(block.var(), abs=1e-6)
+
+    def test_vectorized_queries(self):
+        data = np.arange(16, dtype=np.float64).reshape(4, 4)
+        table = SummedAreaTable(data)
+        means = table.mean(np.array([0, 2]), np.array([0, 2]), np.array([2, 4]), np.array([2, 4]))
+        assert np.allclose(means, [data[:2, :2].mean(), data[2:, 2:].mean()])
+
+    def test_clamps_and_rejects_empty(self):
+        table = SummedAreaTable(np.ones((3, 3)))
+        assert table.stats(-5, -5, 99, 99).count == 9
+        with pytest.raises(ValueError):
+            table.stats(2, 2, 2, 3)
+
+    def test_layer_integral_cached_and_invalidated(self):
+        layer = Layer(np.zeros((2, 2)))
+        assert layer.integral is layer.integral
+        layer[1, 1] = 4.0
+        assert layer.integral.sum(0, 0, 2, 2) == 4.0
+
+
+class TestRegionStats:
+    def _scene(self, grid_size=4):
+        arr = np.zeros((20, 20, 3), dtype=np.uint8)
+        arr[:, 10:] = 255  # left half black, right half white
+        img = Image.from_pil(PILImage.fromarray(arr))
+        return pf.Scene.from_image(img, grid_size=grid_size)
+
+    def test_cell_region_stats_reads_full_resolution(self):
+        scene = self._scene()
+        cell = scene.grid[0][1]  # px 5-10, just left of the edge: all black
+        assert cell.region_stats().mean == pytest.approx(0.0)
+        edge = scene.grid[0][2]  # px 10-15, all white
+        assert edge.region_stats(layer="red").mean == pytest.approx(1.0)
+        left = cell.region_stats(0, 0, 0.5, 1)
+        assert left.count == 15  # ceil(2.5) x 5 pixels
+
+        straddle = self._scene(grid_size=5).grid[0][2]  # px 8-12, across the edge
+        stats = straddle.region_stats()
+        assert stats.count == 16
+        assert stats.mean == pytest.approx(0.5)
+
+    def test_cell_region_stats_requires_image(self):
+        scene = pf.Scene.with_grid(cols=2, rows=2, cell_size=10)
+        with pytest.raises(ValueError):
+            scene.grid[0][0].region_stats()
+
+    def test_grid_region_stats_matches_cells(self):
+        scene = self._scene()
+        grid = scene.grid
+        stats = grid.region_stats((0, 0), (3, 1))
+        cells = list(grid.region(0, 4, 0, 2))
+        assert stats.count == len(cells)
+        assert stats.mean == pytest.approx(sum(c.brightness for c in cells) / len(cells))
+
+    def test_cell_group_averages_use_layers(self):
+        scene = self._scene()
+        group = scene.grid.merge((0, 0), (3, 3))
+        cells = group.cells
+        assert group.brightness == pytest.approx(sum(c.brightness for c in cells) / len(cells))
+        expected = tuple(round(sum(c.rgb[i] for c in cells) / len(cells)) for i in range(3))
+        assert group.rgb == expected
+
+    def test_cell_data_writes_reach_group_average(self):
+        scene = self._scene()
+        group = scene.grid.merge((0, 0), (0, 1))
+        before = group.brightness
+        scene.grid[0][0].data["brightness"] = 1.0
+        assert group.brightness > before
+
+
+# ---------------------------------------------------------------------------
+# stipple / DotCloud
+# ---------------------------------------------------------------------------
+class TestStipple:
+    def _nearest_distances(self, points):
+        gaps = np.linalg.norm(points[:, None] - points[None], axis=-1)
+        np.fill_diagonal(gaps, np.inf)
+        return gaps.min(axis=1)
+
+    def test_count_and_coordinate_space(self):
+        points = pf.stipple(np.full((50, 80), 0.6), 500, width=160, height=100)
+        assert points.shape == (500, 2)
+        assert (points >= 0).all() and (points[:, 0] < 160).all() and (points[:, 1] < 100).all()
+
+    def test_points_follow_darkness(self):
+        # Left half black, right half mid-grey: about 2/3 of the points go left
+        brightness = np.full((60, 60), 127.5)
+        brightness[:, :30] = 0
+        points = pf.stipple(Layer(brightness), 900)
+        assert abs((points[:, 0] < 30).mean() - 2 / 3) < 0.05
+        # Pure white gets no points at all
+        points = pf.stipple(Layer(np.where(brightness > 0, 255.0, 0.0)), 200)
+        assert (points[:, 0] < 30).all()
+
+    def test_poisson_disk_spacing(self):
+        from pyfreeform.image import stipple as stipple_module
+
+        density = np.ones((40, 40))
+        points = pf.stipple(density, 400)
+        # Uniform density: nothing closer than the starting radius
+        r0 = np.sqrt(stipple_module._PACKING * 40 * 40 / 400)
+        assert self._nearest_distances(points).min() >= 0.8 * r0
+        white_noise = np.random.default_rng(0).random((400, 2)) * 40
+        assert self._nearest_distances(points).min() > 5 * self._nearest_distances(white_noise).min()
+
+    def test_relaxation_evens_spacing(self):
+        density = np.ones((40, 40))
+        before = self._nearest_distances(pf.stipple(density, 300))
+        after = self._nearest_distances(pf.stipple(density, 300, relax=8))
+        assert after.mean() > before.mean()
+
+    def test_reproducible_and_validated(self):
+        image = Image(*(np.tile(np.linspace(0, 255, 40), (30, 1)),) * 3)
+        assert np.array_equal(pf.stipple(image, 100, seed=3), pf.stipple(image, 100, seed=3))
+        with pytest.raises(ValueError):
+            pf.stipple(np.zeros((10, 10)), 10)
+        with pytest.raises(ValueError):
+            pf.stipple(image, -1)
+
+    def test_dot_cloud_renders_one_path(self):
+        scene = pf.Scene(100, 100)
+        cloud = scene.place(pf.DotCloud([(10, 20), (30, 40)], radius=[1, 2], color="red"))
+        svg = scene.to_svg()
+        assert svg.count("<path") == 1 and "<circle" not in svg
+        assert "M9 20a1 1 0 1 0 2 0a1 1 0 1 0 -2 0M28 40a2 2" in svg
+        assert cloud.bounds() == (9, 19, 32, 42)
+        cloud.position = (5, 5)
+        assert np.allclose(cloud.points, [(15, 25), (35, 45)])
+        with pytest.raises(ValueError):
+            pf.DotCloud([(0, 0)], radius=[1, 2])
@@ -1,5 +1,7 @@
 """Tests for the Surface protocol — Scene builders, CellGroup, grid.merge()."""
 
+import math
+import random
 import sys
 from pathlib import Path
 
@@ -7,7 +9,7 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from pyfreeform import Scene, CellGroup, Surface, Text
+from pyfreeform import Scene, CellGroup, Dot, Surface, Text
 
 
 # =========================================================================
@@ -180,6 +182,65 @@ def test_cell_group_averaged_color():
     assert b == 128
 
 
+# =========================================================================
+# Quadtree subdivision
+# =========================================================================
+
+
+def _half_flat_image():
+    import numpy as np
+    from PIL import Image as PILImage
+
+    from pyfreeform import Image
+
+    arr = np.zeros((64, 64, 3), dtype=np.uint8)
+    arr[:] = (40, 80, 160)
+    arr[:, 32:] = np.random.default_rng(0).integers(0, 255, (64, 32, 3))
+    return Image.from_pil(PILImage.fromarray(arr))
+
+
+def test_subdivide_tiles_grid_exactly():
+    scene = Scene.from_image(_half_flat_image(), grid_size=16)
+    blocks = scene.grid.subdivide(threshold=0.002)
+    covered = [(c.row, c.col) for block in blocks for c in block.cells]
+    assert len(covered) == len(scene.grid) == len(set(covered))
+    assert scene.grid.cell_groups == blocks
+
+
+def test_subdivide_keeps_flat_regions_coarse():
+    scene = Scene.from_image(_half_flat_image(), grid_size=16)
+    blocks = scene.grid.subdivide(threshold=0.002)
+    left = [b for b in blocks if b.cells[0].col < 8]
+    right = [b for b in blocks if b.cells[0].col >= 8]
+    assert len(left) < len(right)
+    assert max(len(b.cells) for b in left) >= 16
+
+
+def test_subdivide_respects_max_depth():
+    scene = Scene.from_image(_half_flat_image(), grid_size=16)
+    blocks = scene.grid.subdivide(threshold=0.0, max_depth=1)
+    assert len(blocks) == 4
+
+
+def test_subdivide_on_derived_layer():
+    scene = Scene.from_image(_half_flat_image(), grid_size=16)
+    blocks = scene.grid.subdivide(threshold=0.002, layer="hue")
+    left = [b for b in blocks if b.cells[0].col < 8]
+    right = [b for b in blocks if b.cells[0].col >= 8]
+    assert len(left) < len(right)
+    assert sum(len(b.cells) for b in blocks) == len(scene.grid)
+
+
+def test_adaptive_from_image():
+    from pyfreeform import Grid
+
+    grid = Grid.adaptive_from_image(_half_flat_image(), max_depth=4)
+    assert grid.num_columns == 16
+    assert 1 < len(grid.cell_groups) < len(grid)
+    block = grid.cell_groups[0]
+    assert block.color.startswith("#")
+
+
 # =========================================================================
 # CellGroup builder methods
 # =========================================================================
@@ -342,3 +403,239 @@ def test_text_fit_to_surface_no_cell_raises():
         raise AssertionError("Should have raised ValueError")
     except ValueError:
         pass
+
+
+# =========================================================================
+# Removal
+# =========================================================================
+
+
+def test_scene_remove_direct_and_cell_entities():
+    scene = Scene.with_grid(cols=3, rows=3, cell_size=10)
+    direct = scene.add_dot()
+    in_cell = scene.grid[2][1].add_dot()
+    in_group = scene.grid.merge((0, 0), (1, 1)).add_dot()
+    assert scene.remove(in_cell)
+    assert scene.remove(in_group)
+    assert scene.remove(direct)
+    assert scene.entities == []
+    assert in_cell.surface is None
+    assert not scene.remove(in_cell)
+
+
+def test_scene_remove_ignores_other_scenes():
+    scene = Scene.with_grid(cols=2, rows=2, cell_size=10)
+    other = Scene.with_grid(cols=2, rows=2, cell_size=10)
+    dot = other.grid[0][0].add_dot()
+    assert not scene.remove(dot)
+    assert other.entities == [dot]
+
+
+def test_remove_many_and_remove_where_keep_order():
+    scene = Scene.with_grid(cols=4, rows=4, cell_size=10)
+    dots = [cell.add_dot() for cell in scene.grid]
+    extra = [scene.add_dot(at=(i / 10, 0.5)) for i in range(10)]
+
+    assert scene.remove_many([*dots[::2], Text(0, 0, "stray")]) == 8
+    assert scene.remove_where(lambda e: e.surface is scene and e.x >= 20) == 5
+    assert scene.entities == extra[:5] + dots[1::2]
+
+
+def test_scene_clear_detaches_entities():
+    scene = Scene(10, 10)
+    dot = scene.add_dot()
+    scene.clear()
+    assert dot.surface is None
+    assert scene.entities == []
+
+
+def test_bounds_array_matches_entity_bounds():
+    scene = Scene.with_grid(cols=3, rows=3, cell_size=10)
+    scene.add_dot(at=(0.2, 0.3))
+    scene.grid[1][2].add_rect(width=0.5, height=0.5)
+    scene.place(Text(40, 40, "hi"))
+    boxes = scene.bounds_array(visual=True)
+    assert boxes.shape == (3, 4)
+    for row, entity in zip(boxes.tolist(), scene.entities, strict=True):
+        assert tuple(row) == entity.bounds(visual=True)
+    assert Scene(10, 10).bounds_array().shape == (0, 4)
+
+
+def test_crop_uses_overall_extent():
+    scene = Scene(100, 100)
+    scene.place(Dot(20, 30, radius=5))
+    scene.place(Dot(70, 60, radius=10))
+    scene.crop(padding=2)
+    assert scene._viewbox == (13, 23, 69, 49)
+
+
+# =========================================================================
+# Dead-entity pruning
+# =========================================================================
+
+
+def test_optimize_prunes_dead_entities():
+    scene = Scene.with_grid(cols=2, rows=2, cell_size=50)
+    visible = scene.add_dot()
+    scene.add_dot(opacity=0)
+    scene.add_rect(fill=None)
+    scene.grid[0][0].add_dot(radius=0)
+    scene.add_line(start=(0.1, 0.1), end=(0.9, 0.9), width=0)
+    scene.add_text("")
+    scene.place(Dot(150, 50, radius=5))
+    stats = scene.optimize()
+    assert stats == {"transparent": 2, "zero_size": 3, "off_scene": 1}
+    assert scene.entities == [visible]
+
+
+def test_optimize_keeps_entities_animated_into_view():
+    scene = Scene(100, 100)
+    fading_in = scene.add_dot(opacity=0)
+    fading_in.animate_fade(to=1)
+    growing = scene.add_dot(radius=0)
+    growing.animate_radius(to=5)
+    arriving = scene.place(Dot(-50, 50, radius=5))
+    arriving.animate_move(to=(0.5, 0.5))
+    stays_hidden = scene.add_dot(opacity=0)
+    stays_hidden.animate_spin(90)
+    assert scene.optimize() == {"transparent": 1, "zero_size": 0, "off_scene": 0}
+    assert scene.entities == [fading_in, growing, arriving]
+
+
+def test_optimize_keeps_referenced_and_viewbox_content():
+    scene = Scene(100, 100)
+    start = scene.add_dot(opacity=0, at=(0.1, 0.1))
+    end = scene.add_dot(opacity=0, at=(0.9, 0.9))
+    start.connect(end)
+    outside = scene.place(Dot(150, 50, radius=5))
+    scene.trim(right=-100)
+    assert sum(scene.optimize().values()) == 0
+    assert scene.entities == [start, end, outside]
+
+
+def test_optimize_keeps_rotated_text_reaching_into_scene():
+    scene = Scene(400, 400)
+    # Unrotated, the label would sit above the scene; turned, it runs down into it
+    label = scene.add_text(
+        "A long vertical label down the page", at=(0.5, -0.3), font_size=0.05, rotation=90
+    )
+    assert scene.optimize()["off_scene"] == 0
+    assert scene.entities == [label]
+
+
+# =========================================================================
+# Spatial queries
+# =========================================================================
+
+
+def _overlaps(entity, rect):
+    x1, y1, x2, y2 = entity.bounds(visual=True)
+    return x1 <= rect[2] and x2 >= rect[0] and y1 <= rect[3] and y2 >= rect[1]
+
+
+def _box_distance(entity, x, y):
+    x1, y1, x2, y2 = entity.bounds(visual=True)
+    return math.hypot(max(x1 - x, 0, x - x2), max(y1 - y, 0, y - y2))
+
+
+def _scattered_scene(count=500):
+    rng = random.Random(7)
+    scene = Scene.with_grid(cols=4, rows=4, cell_size=50)
+    for _ in range(count):
+        scene.place(Dot(rng.uniform(0, 200), rng.uniform(0, 200), radius=rng.uniform(0.5, 4)))
+    scene.grid[1][2].add_rect(width=0.5, height=0.5)
+    scene.add_line(start=(0, 0), end=(1, 1), width=2)
+    return scene
+
+
+def test_query_matches_brute_force():
+    scene = _scattered_scene()
+    rng = random.Random(1)
+    for _ in range(30):
+        x, y = rng.uniform(-20, 200), rng.uniform(-20, 200)
+        rect = (x, y, x + rng.uniform(0, 80), y + rng.uniform(0, 80))
+        expected = [e for e in scene.entities if _overlaps(e, rect)]
+        assert {id(e) for e in scene.query(rect)} == {id(e) for e in expected}
+
+
+def test_query_follows_moves_and_removals():
+    scene = Scene(200, 200)
+    dot = scene.add_dot(at=(0.1, 0.1), radius=0.01)
+    assert scene.query((0, 0, 40, 40)) == [dot]
+
+    dot.position = (150, 150)
+    assert scene.query((0, 0, 40, 40)) == []
+    assert scene.query((140, 140, 160, 160)) == [dot]
+
+    dot.rotate(90, origin=(100, 100))
+    assert scene.query((40, 140, 60, 160)) == [dot]
+
+    scene.remove(dot)
+    assert scene.query((0, 0, 200, 200)) == []
+
+
+def test_query_follows_entities_bound_to_a_moved_one():
+    from pyfreeform import Rect
+    from pyfreeform.core.binding import Binding
+
+    scene = Scene.with_grid(cols=2, rows=2, cell_size=100)
+    rect = scene.grid[0][0].place(Rect(10, 10, 40, 40))
+    dot = scene.place(Dot(0, 0, radius=2))
+    dot.binding = Binding(at=(0.5, 0.5), reference=rect)
+    curve = scene.add_curve(start=(0.1, 0.9), end=(0.3, 0.9))
+    bead = scene.add_dot(along=curve, t=0.5, radius=0.01)
+    assert dot in scene.query((25, 25, 35, 35))
+
+    rect.position = (300, 300)
+    curve._move_by(0, -100)
+    assert scene.query((0, 0, 60, 60)) == []
+    assert dot in scene.query((315, 315, 325, 325))
+    assert bead in scene.query((0, 60, 200, 90))
+
+
+def test_query_sees_cell_entities():
+    scene = Scene.with_grid(cols=4, rows=4, cell_size=50)
+    assert scene.query((0, 0, 200, 200)) == []
+    dot = scene.grid[3][3].add_dot(radius=0.05)
+    assert scene.query((170, 170, 180, 180)) == [dot]
+    assert scene.grid[3][3].query((0, 0, 200, 200)) == [dot]
+    scene.grid[3][3].remove(dot)
+    assert scene.query((0, 0, 200, 200)) == []
+
+
+def test_entities_at_topmost_first():
+    scene = Scene(100, 100)
+    low = scene.add_rect(width=0.8, height=0.8, z_index=0)
+    high = scene.add_dot(radius=0.05, z_index=2)
+    middle = scene.add_ellipse(rx=0.1, ry=0.1, z_index=1)
+    assert scene.entities_at(50, 50) == [high, middle, low]
+    assert scene.entities_at(15, 15) == [low]
+    assert scene.entities_at(1, 1) == []
+
+
+def test_nearest_matches_brute_force():
+    scene = _scattered_scene()
+    rng = random.Random(2)
+    for _ in range(30):
+        x, y = rng.uniform(-100, 300), rng.uniform(-100, 300)
+        got = [_box_distance(e, x, y) for e in scene.nearest((x, y), k=4)]
+        expected = sorted(_box_distance(e, x, y) for e in scene.entities)[:4]
+        assert got == pytest.approx(expected)
+
+
+def test_nearest_to_entity_excludes_itself():
+    scene = Scene(100, 100)
+    a = scene.place(Dot(10, 10, radius=1))
+    b = scene.place(Dot(20, 10, radius=1))
+    c = scene.place(Dot(90, 90, radius=1))
+    assert scene.nearest(a, k=2) == [b, c]
+    assert scene.nearest((0, 0), k=10) == [a, b, c]
+
+
+def test_reindex_after_shape_edit():
+    scene = Scene(100, 100)
+    dot = scene.place(Dot(50, 50, radius=1))
+    assert scene.entities_at(58, 50) == []
+    dot.radius = 10
+    scene.reindex()
+    assert scene.entities_at(58, 50) == [dot]
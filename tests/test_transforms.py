@@ -277,6 +277,28 @@ class TestWorldSpaceBounds:
         w2 = b2[2] - b2[0]
         assert w2 == pytest.approx(w1 * 2, abs=1)
 
+    def test_path_bounds_follow_moves_and_transforms(self):
+        """Memoized Path bounds never go stale."""
+        path = Path(Wave((0, 0), (100, 0), amplitude=0.2), segments=32)
+        b1 = path.bounds()
+        assert path.bounds() == b1
+        path._move_by(10, 5)
+        assert path.bounds() == pytest.approx((b1[0] + 10, b1[1] + 5, b1[2] + 10, b1[3] + 5))
+        path.rotate(90)
+        b2 = path.bounds()
+        assert (b2[2] - b2[0]) == pytest.approx(b1[3] - b1[1])
+        path.scale(2.0)
+        assert (path.bounds()[3] - path.bounds()[1]) == pytest.approx(2 * (b1[2] - b1[0]))
+
+    def test_path_bounds_exact_on_extrema(self):
+        """Bounds reach the curve's extremes, not just its control points."""
+        path = Path(Wave((0, 50), (100, 50), amplitude=0.2, frequency=1), segments=8)
+        samples = [path.point_at(i / 400) for i in range(401)]
+        _, min_y, _, max_y = path.bounds()
+        assert min_y == pytest.approx(min(p.y for p in samples), abs=0.05)
+        assert max_y == pytest.approx(max(p.y for p in samples), abs=0.05)
+        assert min_y <= min(p.y for p in samples) + 1e-9
+
 
 # =========================================================================
 # World-space point_at